@@ -6,7 +6,7 @@ Supports both historical data fetching and live streaming with
 unified data formats and pluggable providers.
 """
 
-from .models import Candle, Ticker, OrderBook, Trade as MarketTrade
+from .models import Candle, CandleBatch, Ticker, OrderBook, Trade as MarketTrade
 from .providers.base import MarketDataProvider
 from .providers.binance_rest import BinanceRESTProvider
 from .providers.mock import MockProvider
@@ -14,6 +14,7 @@ from .streaming.data_stream import DataStream, StreamConfig
 
 __all__ = [
     'Candle',
+    'CandleBatch',
     'Ticker', 
     'OrderBook',
     'MarketTrade',
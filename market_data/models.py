@@ -11,14 +11,34 @@ from typing import Optional, Dict, Any, List
 from decimal import Decimal
 import json
 
+import numpy as np
 
-@dataclass
+
+# Packed (structure-of-arrays friendly) layout for bulk candle data. One
+# record is ~80 bytes versus several hundred for a Candle object, and
+# per-field columns (e.g. arr['close']) are contiguous for vectorized math.
+CANDLE_DTYPE = np.dtype([
+    ('timestamp', 'i8'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8'),
+    ('quote_volume', 'f8'),
+    ('trade_count', 'i8'),
+    ('taker_buy_volume', 'f8'),
+    ('taker_buy_quote_volume', 'f8'),
+])
+
+
+@dataclass(slots=True)
 class Candle:
     """
     Standardized OHLCV candlestick data.
     
     Represents price and volume data for a specific time period,
-    normalized across all market data providers.
+    normalized across all market data providers. Slotted (no per-instance
+    __dict__) since histories routinely hold hundreds of thousands.
     """
     timestamp: int  # Unix timestamp in milliseconds
     symbol: str
@@ -104,7 +124,107 @@ class Candle:
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
+class CandleBatch:
+    """
+    Columnar (structure-of-arrays) batch of candles for one symbol/interval.
+    
+    Each field is a contiguous NumPy column, so scans and DataFrame
+    construction avoid per-candle object overhead. Missing optional values
+    are stored as NaN (trade_count becomes float64 if any are missing).
+    Iterating yields Candle objects for code that expects a list.
+    """
+    symbol: str
+    interval: str
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    quote_volume: np.ndarray
+    trade_count: np.ndarray
+    taker_buy_volume: np.ndarray
+    taker_buy_quote_volume: np.ndarray
+    
+    @classmethod
+    def from_candles(cls, candles: List[Candle]) -> 'CandleBatch':
+        """
+        Gather a list of candles (single symbol/interval) into columns.
+        
+        Raises:
+            ValueError: If candles is empty or mixes symbols or intervals
+        """
+        if not candles:
+            raise ValueError("No candles provided")
+        if len({(c.symbol, c.interval) for c in candles}) > 1:
+            raise ValueError("Candles must share one symbol and interval")
+        columns = list(zip(*(
+            (c.timestamp, c.open, c.high, c.low, c.close, c.volume, c.quote_volume,
+             c.trade_count, c.taker_buy_volume, c.taker_buy_quote_volume)
+            for c in candles
+        )))
+        trade_count = columns[7]
+        return cls(
+            candles[0].symbol,
+            candles[0].interval,
+            np.array(columns[0], dtype=np.int64),
+            *(np.array(column, dtype=np.float64) for column in columns[1:7]),
+            np.array(trade_count, dtype=np.float64 if None in trade_count else np.int64),
+            *(np.array(column, dtype=np.float64) for column in columns[8:])
+        )
+    
+    @classmethod
+    def from_array(cls, arr: np.ndarray, symbol: str, interval: str) -> 'CandleBatch':
+        """Split a CANDLE_DTYPE record array into contiguous columns."""
+        return cls(symbol, interval, *(np.ascontiguousarray(arr[name]) for name in CANDLE_DTYPE.names))
+    
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Numeric columns by field name (no copies)."""
+        return {name: getattr(self, name) for name in CANDLE_DTYPE.names}
+    
+    @property
+    def nbytes(self) -> int:
+        """Total size of the column buffers."""
+        return sum(column.nbytes for column in self.columns().values())
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    def __getitem__(self, index: int) -> Candle:
+        return self._make_candle(
+            *(getattr(self, name)[index].item() for name in CANDLE_DTYPE.names)
+        )
+    
+    def __iter__(self):
+        rows = zip(*(getattr(self, name).tolist() for name in CANDLE_DTYPE.names))
+        return (self._make_candle(*row) for row in rows)
+    
+    def _make_candle(
+        self, timestamp, open, high, low, close, volume,
+        quote_volume, trade_count, taker_buy_volume, taker_buy_quote_volume
+    ) -> Candle:
+        # NaN != NaN, so `x == x` maps missing optional values back to None
+        return Candle(
+            timestamp=int(timestamp),
+            symbol=self.symbol,
+            interval=self.interval,
+            open=open,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            quote_volume=quote_volume if quote_volume == quote_volume else None,
+            trade_count=int(trade_count) if trade_count == trade_count else None,
+            taker_buy_volume=taker_buy_volume if taker_buy_volume == taker_buy_volume else None,
+            taker_buy_quote_volume=(
+                taker_buy_quote_volume if taker_buy_quote_volume == taker_buy_quote_volume else None
+            ),
+            raw_data={}
+        )
+
+
+@dataclass(slots=True)
 class Ticker:
     """
     Real-time ticker data for a symbol.
@@ -171,9 +291,14 @@ class Ticker:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class OrderBookLevel:
-    """Individual price level in order book."""
+    """
+    Individual price level in order book.
+    
+    Slotted because depth snapshots create thousands of these per call;
+    dropping the per-instance __dict__ cuts memory roughly threefold.
+    """
     price: float
     quantity: float
     
@@ -183,7 +308,7 @@ class OrderBookLevel:
         return self.price * self.quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBook:
     """
     Order book snapshot with bids and asks.
@@ -250,7 +375,7 @@ class OrderBook:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Individual trade execution data.
@@ -299,6 +424,7 @@ class MarketDataConfig:
     api_key: Optional[str] = None
     api_secret: Optional[str] = None
     testnet: bool = False
+    share_session: bool = False  # Reuse one HTTP session across providers
     
     # Rate Limiting
     requests_per_minute: int = 1200
@@ -314,23 +440,30 @@ class MarketDataConfig:
     enable_cache: bool = True
     cache_ttl_seconds: int = 60
     cache_max_size: int = 1000
+    exchange_info_ttl_seconds: int = 6 * 3600  # 0 disables the disk cache
+    exchange_info_cache_path: Optional[str] = None  # None uses ~/.cache/trador
     
     # Data Quality
     validate_data: bool = True
     fill_missing_data: bool = True
     remove_outliers: bool = False
     outlier_threshold: float = 3.0  # Standard deviations
+    keep_raw_data: bool = False  # Retain raw exchange payloads on models
     
     # Storage
     enable_storage: bool = False
     storage_path: Optional[str] = None
     storage_format: str = 'parquet'  # 'parquet', 'csv', 'json'
     
+    # Mock Provider
+    simulate_latency: bool = True  # Disable for benchmarks and bulk backtests
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary."""
         return {
             'base_url': self.base_url,
             'testnet': self.testnet,
+            'share_session': self.share_session,
             'requests_per_minute': self.requests_per_minute,
             'burst_limit': self.burst_limit,
             'timeout_seconds': self.timeout_seconds,
@@ -340,13 +473,17 @@ class MarketDataConfig:
             'enable_cache': self.enable_cache,
             'cache_ttl_seconds': self.cache_ttl_seconds,
             'cache_max_size': self.cache_max_size,
+            'exchange_info_ttl_seconds': self.exchange_info_ttl_seconds,
+            'exchange_info_cache_path': self.exchange_info_cache_path,
             'validate_data': self.validate_data,
             'fill_missing_data': self.fill_missing_data,
             'remove_outliers': self.remove_outliers,
             'outlier_threshold': self.outlier_threshold,
+            'keep_raw_data': self.keep_raw_data,
             'enable_storage': self.enable_storage,
             'storage_path': self.storage_path,
-            'storage_format': self.storage_format
+            'storage_format': self.storage_format,
+            'simulate_latency': self.simulate_latency,
         }
 
 
@@ -8,11 +8,21 @@ and recent trades with proper rate limiting and error handling.
 
 import asyncio
 import aiohttp
+import json
+import os
 import time
-from typing import List, Optional, Dict, Any
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 import logging
 
+try:
+    # Optional: orjson parses JSON several times faster than the stdlib
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - fallback when orjson is missing
+    _json_loads = json.loads
+
 from .base import MarketDataProvider, DataProviderError, RateLimitError, SymbolNotFoundError
 from ..models import Candle, Ticker, OrderBook, OrderBookLevel, Trade, MarketDataConfig
 
@@ -20,6 +30,19 @@ from ..models import Candle, Ticker, OrderBook, OrderBookLevel, Trade, MarketDat
 logger = logging.getLogger(__name__)
 
 
+def _parse_retry_after(value: Optional[str]) -> int:
+    """
+    Seconds to wait from a Retry-After header.
+    
+    Binance sends delta-seconds; anything else (missing, HTTP-date,
+    garbage) falls back to 1 second.
+    """
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return 1
+
+
 class BinanceRESTProvider(MarketDataProvider):
     """
     Binance REST API market data provider.
@@ -51,6 +74,23 @@ class BinanceRESTProvider(MarketDataProvider):
         '1d': '1d', '3d': '3d', '1w': '1w', '1M': '1M'
     }
     
+    # Depth limits accepted by the order book endpoint. Anything up to 100
+    # levels has the same request weight, so never fetch fewer than that.
+    ORDER_BOOK_LIMITS = (5, 10, 20, 50, 100, 500, 1000, 5000)
+    ORDER_BOOK_MIN_FETCH = 100
+    ORDER_BOOK_CACHE_TTL = 1.0  # seconds
+    
+    # Symbols missing from exchange info are only rejected locally when the
+    # symbol list was fetched from the API this recently; otherwise it is
+    # refreshed first (new listings may postdate the disk cache)
+    SYMBOL_REFRESH_INTERVAL = 60.0  # seconds
+    
+    # Process-wide HTTP session used by providers with config.share_session,
+    # reference-counted so it is only closed when the last user disconnects
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _session_refcount: int = 0
+    _session_lock: Optional[asyncio.Lock] = None
+    
     def __init__(self, config: Optional[MarketDataConfig] = None):
         """
         Initialize Binance REST provider.
@@ -69,31 +109,37 @@ class BinanceRESTProvider(MarketDataProvider):
         
         self.base_url = self.TESTNET_URL if config.testnet else self.BASE_URL
         self._session: Optional[aiohttp.ClientSession] = None
+        self._uses_shared_session = False
         self._last_request_time = 0
         self._request_count = 0
-        self._request_window_start = time.time()
+        self._request_window_start = time.monotonic()
         
         # Cache for exchange info
         self._exchange_info: Optional[Dict] = None
         self._symbols_cache: Optional[List[str]] = None
         self._symbol_info_cache: Dict[str, Dict] = {}
+        # Every listed symbol (any status), for O(1) validation
+        self._symbols_set: frozenset = frozenset()
+        # Monotonic time exchange info was last fetched from the API (None
+        # while unloaded or loaded from the disk cache)
+        self._exchange_info_fetched_at: Optional[float] = None
+        
+        # Order book snapshots: symbol -> (fetched_at, limit, book) and
+        # symbol -> (limit, task) for requests still in flight
+        self._order_book_cache: Dict[str, Tuple[float, int, OrderBook]] = {}
+        self._order_book_in_flight: Dict[str, Tuple[int, asyncio.Future]] = {}
     
     async def connect(self):
         """Initialize HTTP session and load exchange info."""
         await super().connect()
         
-        # Create HTTP session with custom settings
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
-        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20)
-        
-        self._session = aiohttp.ClientSession(
-            timeout=timeout,
-            connector=connector,
-            headers={
-                'User-Agent': 'TradingBot-MarketData/1.0',
-                'Content-Type': 'application/json'
-            }
-        )
+        if self.config.share_session:
+            # Pool keep-alive connections with every other sharing provider
+            if not self._uses_shared_session:
+                self._session = await self._acquire_shared_session()
+                self._uses_shared_session = True
+        else:
+            self._session = self._create_session()
         
         # Load exchange info for symbol validation
         try:
@@ -105,15 +151,73 @@ class BinanceRESTProvider(MarketDataProvider):
     
     async def disconnect(self):
         """Clean up HTTP session."""
+        # Detach before the base class runs, as it would close the session
+        # outright and break other providers sharing it
+        session, self._session = self._session, None
+        if session is not None:
+            if self._uses_shared_session:
+                self._uses_shared_session = False
+                await self._release_shared_session()
+            else:
+                await session.close()
+        
         await super().disconnect()
-        if self._session:
-            await self._session.close()
-            self._session = None
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session with provider-specific settings."""
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout_seconds)
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20)
+        
+        return aiohttp.ClientSession(
+            timeout=timeout,
+            connector=connector,
+            headers={
+                'User-Agent': 'TradingBot-MarketData/1.0',
+                'Content-Type': 'application/json'
+            }
+        )
+    
+    @staticmethod
+    def _get_session_lock() -> asyncio.Lock:
+        """Return the lock guarding the shared session, creating it lazily."""
+        if BinanceRESTProvider._session_lock is None:
+            BinanceRESTProvider._session_lock = asyncio.Lock()
+        return BinanceRESTProvider._session_lock
+    
+    async def _acquire_shared_session(self) -> aiohttp.ClientSession:
+        """
+        Get the process-wide HTTP session and take a reference to it.
+        
+        The session is created with the settings of the first provider that
+        acquires it.
+        
+        Returns:
+            aiohttp.ClientSession: Shared HTTP session
+        """
+        cls = BinanceRESTProvider
+        async with self._get_session_lock():
+            if cls._shared_session is None or cls._shared_session.closed:
+                cls._shared_session = self._create_session()
+                cls._session_refcount = 0
+            cls._session_refcount += 1
+            return cls._shared_session
+    
+    async def _release_shared_session(self) -> None:
+        """Drop a reference to the shared session, closing it on last release."""
+        cls = BinanceRESTProvider
+        async with self._get_session_lock():
+            cls._session_refcount -= 1
+            if cls._session_refcount <= 0:
+                cls._session_refcount = 0
+                if cls._shared_session is not None:
+                    await cls._shared_session.close()
+                    cls._shared_session = None
     
     async def _make_request(
         self,
         endpoint: str,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
     ) -> Dict[str, Any]:
         """
         Make rate-limited HTTP request to Binance API.
@@ -121,6 +225,7 @@ class BinanceRESTProvider(MarketDataProvider):
         Args:
             endpoint (str): API endpoint
             params (Optional[Dict[str, Any]]): Request parameters
+            stream (bool): Parse large bodies from raw bytes (see _read_json_stream)
             
         Returns:
             Dict[str, Any]: API response data
@@ -132,22 +237,28 @@ class BinanceRESTProvider(MarketDataProvider):
         if not self._session:
             await self.connect()
         
-        # Rate limiting
-        await self._check_rate_limit()
-        
         url = f"{self.base_url}{endpoint}"
         
         for attempt in range(self.config.max_retries):
+            # Rate limiting; retries are debited like any other request
+            await self._check_rate_limit()
+            
+            retry_after = None
             try:
                 async with self._session.get(url, params=params) as response:
                     self._update_rate_limit_counters()
                     
                     if response.status == 200:
+                        if stream:
+                            return await self._read_json_stream(response)
                         return await response.json()
                     elif response.status == 429:
-                        # Rate limit exceeded
-                        retry_after = int(response.headers.get('Retry-After', 60))
-                        raise RateLimitError(f"Rate limit exceeded. Retry after {retry_after} seconds")
+                        # Rate limit exceeded. Binance 429s are usually
+                        # transient, so wait out Retry-After and retry here
+                        # instead of failing the caller outright.
+                        retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                        if attempt == self.config.max_retries - 1:
+                            raise RateLimitError(f"Rate limit exceeded. Retry after {retry_after} seconds")
                     elif response.status == 400:
                         error_data = await response.json()
                         error_msg = error_data.get('msg', 'Bad request')
@@ -164,12 +275,36 @@ class BinanceRESTProvider(MarketDataProvider):
                 # Exponential backoff
                 delay = self.config.retry_delay * (self.config.backoff_factor ** attempt)
                 await asyncio.sleep(delay)
+            
+            if retry_after is not None:
+                # Wait after the response is released, so the connection
+                # goes back to the pool for the duration
+                self.logger.warning(f"Rate limited, retrying in {retry_after}s")
+                await asyncio.sleep(retry_after)
                 
         raise DataProviderError("Max retries exceeded")
     
+    @staticmethod
+    async def _read_json_stream(response: aiohttp.ClientResponse) -> Any:
+        """
+        Read and parse a large JSON body from its raw bytes.
+        
+        response.json() decodes the body to a str before parsing. With
+        orjson installed the bytes are parsed directly, skipping that copy;
+        the stdlib parser decodes to a str internally either way.
+        
+        Args:
+            response (aiohttp.ClientResponse): Successful HTTP response
+            
+        Returns:
+            Any: Parsed JSON payload
+        """
+        return _json_loads(await response.read())
+    
     async def _check_rate_limit(self):
         """Check and enforce rate limiting."""
-        current_time = time.time()
+        # Monotonic clock so NTP adjustments cannot skew the window
+        current_time = time.monotonic()
         
         # Reset window if more than 1 minute has passed
         if current_time - self._request_window_start >= 60:
@@ -183,7 +318,7 @@ class BinanceRESTProvider(MarketDataProvider):
                 self.logger.warning(f"Rate limit reached, sleeping for {sleep_time:.1f}s")
                 await asyncio.sleep(sleep_time)
                 self._request_count = 0
-                self._request_window_start = time.time()
+                self._request_window_start = time.monotonic()
         
         # Minimum delay between requests
         time_since_last = current_time - self._last_request_time
@@ -194,28 +329,162 @@ class BinanceRESTProvider(MarketDataProvider):
     
     def _update_rate_limit_counters(self):
         """Update rate limiting counters."""
-        self._last_request_time = time.time()
+        self._last_request_time = time.monotonic()
         self._request_count += 1
     
-    async def _load_exchange_info(self):
-        """Load and cache exchange information."""
+    async def _load_exchange_info(self, use_disk_cache: bool = True):
+        """
+        Load and cache exchange information.
+        
+        Args:
+            use_disk_cache (bool): Accept a fresh on-disk copy instead of
+                fetching from the API
+        """
         try:
-            self._exchange_info = await self._make_request(self.ENDPOINTS['exchange_info'])
+            # exchangeInfo is a multi-MB payload that rarely changes, so a
+            # fresh on-disk copy saves a full round trip on every cold start
+            exchange_info = self._read_cached_exchange_info() if use_disk_cache else None
+            if exchange_info is None:
+                exchange_info = await self._make_request(self.ENDPOINTS['exchange_info'])
+                self._write_cached_exchange_info(exchange_info)
+                self._exchange_info_fetched_at = time.monotonic()
+            else:
+                self._exchange_info_fetched_at = None
+            self._exchange_info = exchange_info
             
             # Cache symbols list
             symbols_data = self._exchange_info.get('symbols', [])
             self._symbols_cache = [s['symbol'] for s in symbols_data if s['status'] == 'TRADING']
             
             # Cache symbol info
-            for symbol_data in symbols_data:
-                symbol = symbol_data['symbol']
-                self._symbol_info_cache[symbol] = symbol_data
+            self._symbol_info_cache = {
+                symbol_data['symbol']: symbol_data for symbol_data in symbols_data
+            }
+            self._symbols_set = frozenset(self._symbol_info_cache)
                 
             self.logger.info(f"Loaded info for {len(self._symbols_cache)} symbols")
             
         except Exception as e:
             raise DataProviderError(f"Failed to load exchange info: {e}")
     
+    def _exchange_info_cache_file(self) -> Path:
+        """Return the on-disk location of the cached exchange info."""
+        if self.config.exchange_info_cache_path:
+            return Path(self.config.exchange_info_cache_path).expanduser()
+        
+        # Testnet lists different symbols, so keep it in a separate file
+        name = 'binance_testnet_exchange_info.json' if self.config.testnet else 'binance_exchange_info.json'
+        return Path.home() / '.cache' / 'trador' / name
+    
+    def _read_cached_exchange_info(self) -> Optional[Dict]:
+        """
+        Read exchange info from disk if the cached copy is still fresh.
+        
+        Returns:
+            Optional[Dict]: Cached exchange info, or None if missing/stale
+        """
+        ttl = self.config.exchange_info_ttl_seconds
+        if ttl <= 0:
+            return None
+        
+        path = self._exchange_info_cache_file()
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                exchange_info = json.load(f)
+        except (OSError, ValueError):
+            # Missing or corrupt cache simply falls back to the API
+            return None
+        
+        self.logger.debug(f"Loaded exchange info from {path}")
+        return exchange_info
+    
+    def _write_cached_exchange_info(self, exchange_info: Dict) -> None:
+        """
+        Persist exchange info to disk for later cold starts.
+        
+        Args:
+            exchange_info (Dict): Exchange info response to cache
+        """
+        if self.config.exchange_info_ttl_seconds <= 0:
+            return
+        
+        path = self._exchange_info_cache_file()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(exchange_info, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            self.logger.warning(f"Failed to cache exchange info: {e}")
+    
+    def _validate_symbol(self, symbol: str) -> str:
+        """
+        Validate symbol format and, against recently fetched exchange info,
+        existence.
+        
+        Unknown symbols are rejected locally instead of costing a round
+        trip that Binance would answer with a 400. Symbols missing from an
+        older symbol list are let through; see _check_symbol.
+        
+        Args:
+            symbol (str): Symbol to validate
+            
+        Returns:
+            str: Validated symbol
+            
+        Raises:
+            ValueError: If symbol format is invalid
+            SymbolNotFoundError: If symbol is not listed on the exchange
+        """
+        normalized = super()._validate_symbol(symbol)
+        
+        if (normalized not in self._symbols_set and self._symbols_set
+                and self._exchange_info_is_recent()):
+            raise SymbolNotFoundError(f"Symbol not found: {normalized}")
+        
+        return normalized
+    
+    async def _check_symbol(self, symbol: str) -> str:
+        """
+        Validate a symbol, refreshing stale exchange info on a miss.
+        
+        A symbol listed after exchange info was loaded (possibly hours ago,
+        from the disk cache) triggers one API refresh that bypasses the
+        disk cache before it is rejected.
+        
+        Args:
+            symbol (str): Symbol to validate
+            
+        Returns:
+            str: Validated symbol
+            
+        Raises:
+            ValueError: If symbol format is invalid
+            SymbolNotFoundError: If symbol is not listed on the exchange
+        """
+        normalized = self._validate_symbol(symbol)
+        
+        if self._symbols_set and normalized not in self._symbols_set:
+            try:
+                await self._load_exchange_info(use_disk_cache=False)
+            except DataProviderError as e:
+                # Validation is only a shortcut; let Binance decide
+                self.logger.warning(f"Failed to refresh exchange info: {e}")
+                return normalized
+            if normalized not in self._symbols_set:
+                raise SymbolNotFoundError(f"Symbol not found: {normalized}")
+        
+        return normalized
+    
+    def _exchange_info_is_recent(self) -> bool:
+        """Whether exchange info was fetched from the API within SYMBOL_REFRESH_INTERVAL."""
+        fetched_at = self._exchange_info_fetched_at
+        return fetched_at is not None and time.monotonic() - fetched_at < self.SYMBOL_REFRESH_INTERVAL
+    
     def normalize_interval(self, interval: str) -> str:
         """
         Normalize interval to Binance format.
@@ -255,7 +524,7 @@ class BinanceRESTProvider(MarketDataProvider):
         Returns:
             List[Candle]: Historical candles
         """
-        symbol = self._validate_symbol(symbol)
+        symbol = await self._check_symbol(symbol)
         interval = self.normalize_interval(interval)
         
         params = {
@@ -273,26 +542,32 @@ class BinanceRESTProvider(MarketDataProvider):
             params['limit'] = min(limit, 1000)  # Binance max is 1000
         
         try:
-            data = await self._make_request(self.ENDPOINTS['klines'], params)
+            # Kline payloads are the largest responses; keep peak memory down
+            data = await self._make_request(self.ENDPOINTS['klines'], params, stream=True)
             candles = []
+            # Raw payloads duplicate every parsed field; only keep on request
+            keep_raw = self.config.keep_raw_data
+            # Bind builtins/methods locally: avoids global and attribute
+            # lookups per field on large backfills
+            _float, _int, _append = float, int, candles.append
             
             for kline in data:
                 candle = Candle(
-                    timestamp=int(kline[0]),
+                    timestamp=_int(kline[0]),
                     symbol=symbol,
                     interval=interval,
-                    open=float(kline[1]),
-                    high=float(kline[2]),
-                    low=float(kline[3]),
-                    close=float(kline[4]),
-                    volume=float(kline[5]),
-                    quote_volume=float(kline[7]),
-                    trade_count=int(kline[8]),
-                    taker_buy_volume=float(kline[9]),
-                    taker_buy_quote_volume=float(kline[10]),
-                    raw_data={'binance_kline': kline}
+                    open=_float(kline[1]),
+                    high=_float(kline[2]),
+                    low=_float(kline[3]),
+                    close=_float(kline[4]),
+                    volume=_float(kline[5]),
+                    quote_volume=_float(kline[7]),
+                    trade_count=_int(kline[8]),
+                    taker_buy_volume=_float(kline[9]),
+                    taker_buy_quote_volume=_float(kline[10]),
+                    raw_data=({'binance_kline': kline} if keep_raw else None)
                 )
-                candles.append(candle)
+                _append(candle)
             
             self.logger.debug(f"Fetched {len(candles)} candles for {symbol} {interval}")
             return candles
@@ -310,7 +585,7 @@ class BinanceRESTProvider(MarketDataProvider):
         Returns:
             Ticker: Current ticker data
         """
-        symbol = self._validate_symbol(symbol)
+        symbol = await self._check_symbol(symbol)
         
         params = {'symbol': symbol}
         
@@ -332,7 +607,7 @@ class BinanceRESTProvider(MarketDataProvider):
                 low_24h=float(data['lowPrice']),
                 open_24h=float(data['openPrice']),
                 quote_volume_24h=float(data['quoteVolume']),
-                raw_data={'binance_ticker': data}
+                raw_data=({'binance_ticker': data} if self.config.keep_raw_data else None)
             )
             
             return ticker
@@ -344,44 +619,116 @@ class BinanceRESTProvider(MarketDataProvider):
         """
         Get order book snapshot.
         
+        Requests are served from one deeper snapshot per symbol: fetches are
+        snapped up to at least ORDER_BOOK_MIN_FETCH levels (same request
+        weight as shallower books), reused for ORDER_BOOK_CACHE_TTL seconds
+        and shared between concurrent callers, then sliced to the requested
+        depth.
+        
         Args:
             symbol (str): Trading symbol
-            limit (Optional[int]): Number of levels to return (5, 10, 20, 50, 100, 500, 1000, 5000)
+            limit (Optional[int]): Number of levels to return (max 5000)
             
         Returns:
             OrderBook: Order book snapshot
+            
+        Raises:
+            ValueError: If limit is less than 1
         """
-        symbol = self._validate_symbol(symbol)
+        if limit is not None and limit < 1:
+            raise ValueError(f"Order book limit must be at least 1, got {limit}")
+        symbol = await self._check_symbol(symbol)
+        depth = min(limit or self.ORDER_BOOK_MIN_FETCH, self.ORDER_BOOK_LIMITS[-1])
         
-        params = {'symbol': symbol}
+        try:
+            order_book = await self._get_order_book_snapshot(symbol, depth)
+        except Exception as e:
+            raise self._handle_api_error(e, f"Failed to fetch order book for {symbol}")
         
-        if limit:
-            # Binance supports specific limit values
-            valid_limits = [5, 10, 20, 50, 100, 500, 1000, 5000]
-            params['limit'] = min(valid_limits, key=lambda x: abs(x - limit))
+        # New book and levels so callers never mutate the shared snapshot;
+        # raw_data (the API payload) is still shared with it
+        return OrderBook(
+            timestamp=order_book.timestamp,
+            symbol=order_book.symbol,
+            bids=[OrderBookLevel(level.price, level.quantity) for level in order_book.bids[:depth]],
+            asks=[OrderBookLevel(level.price, level.quantity) for level in order_book.asks[:depth]],
+            last_update_id=order_book.last_update_id,
+            raw_data=order_book.raw_data
+        )
+    
+    async def _get_order_book_snapshot(self, symbol: str, depth: int) -> OrderBook:
+        """
+        Return a snapshot with at least `depth` levels, coalescing requests.
         
-        try:
-            data = await self._make_request(self.ENDPOINTS['depth'], params)
-            
-            # Convert bid/ask data to OrderBookLevel objects
-            bids = [OrderBookLevel(float(level[0]), float(level[1])) 
-                   for level in data['bids']]
-            asks = [OrderBookLevel(float(level[0]), float(level[1])) 
-                   for level in data['asks']]
-            
-            order_book = OrderBook(
-                timestamp=int(time.time() * 1000),  # Binance doesn't provide timestamp
-                symbol=symbol,
-                bids=bids,
-                asks=asks,
-                last_update_id=data.get('lastUpdateId'),
-                raw_data={'binance_depth': data}
-            )
+        Args:
+            symbol (str): Validated trading symbol
+            depth (int): Minimum number of levels needed
             
-            return order_book
+        Returns:
+            OrderBook: Cached, in-flight or freshly fetched snapshot
+        """
+        cached = self._order_book_cache.get(symbol)
+        if cached is not None:
+            fetched_at, fetched_limit, order_book = cached
+            if fetched_limit >= depth and time.monotonic() - fetched_at < self.ORDER_BOOK_CACHE_TTL:
+                return order_book
+        
+        # Join an in-flight request if it is deep enough
+        in_flight = self._order_book_in_flight.get(symbol)
+        if in_flight is not None and in_flight[0] >= depth:
+            return await asyncio.shield(in_flight[1])
+        
+        # Smallest Binance-supported limit covering the request
+        fetch_limit = next(
+            (valid for valid in self.ORDER_BOOK_LIMITS
+             if valid >= max(depth, self.ORDER_BOOK_MIN_FETCH)),
+            self.ORDER_BOOK_LIMITS[-1]
+        )
+        task = asyncio.ensure_future(self._fetch_order_book(symbol, fetch_limit))
+        self._order_book_in_flight[symbol] = (fetch_limit, task)
+        # Settle from the task itself: the fetch outlives a cancelled awaiter
+        task.add_done_callback(
+            lambda done: self._order_book_fetched(symbol, fetch_limit, done)
+        )
+        
+        return await asyncio.shield(task)
+    
+    def _order_book_fetched(self, symbol: str, fetch_limit: int, task: asyncio.Future):
+        """Clear the in-flight entry for a finished fetch and cache its snapshot."""
+        if self._order_book_in_flight.get(symbol, (0, None))[1] is task:
+            del self._order_book_in_flight[symbol]
+        
+        if self.config.enable_cache and not task.cancelled() and task.exception() is None:
+            self._order_book_cache[symbol] = (time.monotonic(), fetch_limit, task.result())
+    
+    async def _fetch_order_book(self, symbol: str, limit: int) -> OrderBook:
+        """
+        Fetch an order book snapshot from the depth endpoint.
+        
+        Args:
+            symbol (str): Validated trading symbol
+            limit (int): Binance-supported depth limit
             
-        except Exception as e:
-            raise self._handle_api_error(e, f"Failed to fetch order book for {symbol}")
+        Returns:
+            OrderBook: Order book snapshot
+        """
+        params = {'symbol': symbol, 'limit': limit}
+        data = await self._make_request(self.ENDPOINTS['depth'], params)
+        
+        # Convert bid/ask data to OrderBookLevel objects
+        bids = [OrderBookLevel(float(level[0]), float(level[1])) 
+               for level in data['bids']]
+        asks = [OrderBookLevel(float(level[0]), float(level[1])) 
+               for level in data['asks']]
+        
+        return OrderBook(
+            timestamp=int(time.time() * 1000),  # Binance doesn't provide timestamp
+            symbol=symbol,
+            bids=bids,
+            asks=asks,
+            last_update_id=data.get('lastUpdateId'),
+            raw_data=({'binance_depth': data} if self.config.keep_raw_data else None)
+        )
     
     async def get_recent_trades(
         self,
@@ -398,7 +745,7 @@ class BinanceRESTProvider(MarketDataProvider):
         Returns:
             List[Trade]: Recent trades
         """
-        symbol = self._validate_symbol(symbol)
+        symbol = await self._check_symbol(symbol)
         
         params = {'symbol': symbol}
         
@@ -409,18 +756,20 @@ class BinanceRESTProvider(MarketDataProvider):
             data = await self._make_request(self.ENDPOINTS['trades'], params)
             
             trades = []
+            keep_raw = self.config.keep_raw_data
+            _float, _int, _str, _append = float, int, str, trades.append
             for trade_data in data:
                 trade = Trade(
-                    timestamp=int(trade_data['time']),
+                    timestamp=_int(trade_data['time']),
                     symbol=symbol,
-                    trade_id=str(trade_data['id']),
-                    price=float(trade_data['price']),
-                    quantity=float(trade_data['qty']),
+                    trade_id=_str(trade_data['id']),
+                    price=_float(trade_data['price']),
+                    quantity=_float(trade_data['qty']),
                     side='buy' if trade_data['isBuyerMaker'] else 'sell',
                     is_buyer_maker=trade_data['isBuyerMaker'],
-                    raw_data={'binance_trade': trade_data}
+                    raw_data=({'binance_trade': trade_data} if keep_raw else None)
                 )
-                trades.append(trade)
+                _append(trade)
             
             return trades
             
@@ -449,7 +798,7 @@ class BinanceRESTProvider(MarketDataProvider):
         Returns:
             Dict[str, Any]: Symbol information
         """
-        symbol = self._validate_symbol(symbol)
+        symbol = await self._check_symbol(symbol)
         
         if not self._symbol_info_cache:
             await self._load_exchange_info()
@@ -7,13 +7,162 @@ Generates realistic market data without external API dependencies.
 
 import asyncio
 import random
+import sys
 import time
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union, Iterator, AsyncIterator
 from datetime import datetime, timezone, timedelta
 import math
 
+import numpy as np
+
+try:
+    # Optional: numba compiles the sequential candle kernel to native code
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - falls back to vectorized NumPy
+    njit = None
+
 from .base import MarketDataProvider
-from ..models import Candle, Ticker, OrderBook, OrderBookLevel, Trade, MarketDataConfig
+from ..models import Candle, Ticker, OrderBook, OrderBookLevel, Trade, MarketDataConfig, CANDLE_DTYPE
+
+
+# Module-level bindings for the per-call "now" lookups
+_UTC = timezone.utc
+_now = datetime.now
+
+# Interval durations in seconds, built once at import rather than per call.
+# Also the set of supported intervals (dict membership is O(1)). Keys are
+# interned so lookups with interned strings hit the identity fast path.
+_INTERVAL_SECONDS = {sys.intern(k): v for k, v in {
+        '1m': 60,
+        '3m': 180,
+        '5m': 300,
+        '15m': 900,
+        '30m': 1800,
+        '1h': 3600,
+        '2h': 7200,
+        '4h': 14400,
+        '6h': 21600,
+        '8h': 28800,
+        '12h': 43200,
+        '1d': 86400,
+        '3d': 259200,
+        '1w': 604800,
+        '1M': 2592000  # Approximate month
+    }.items()}
+
+
+# raw_data shared by every generated model instead of a fresh dict per
+# object. A plain dict (not MappingProxyType) so asdict()/pickle keep
+# working; treat it as read-only.
+_MOCK_RAW: Dict[str, Any] = {'mock_provider': True}
+
+# Intervals that normalize_interval maps to themselves ('1M' lowers to '1m')
+_NORMALIZED_INTERVALS = frozenset(k for k in _INTERVAL_SECONDS if k == k.lower())
+
+# Quote assets recognised when splitting mock symbols, checked in order
+_QUOTE_ASSETS = ('USDT', 'BTC', 'ETH')
+
+# Static part of the mock symbol info, built once instead of per call
+_SYMBOL_INFO_TEMPLATE = {
+    'status': 'TRADING',
+    'baseAssetPrecision': 8,
+    'quoteAssetPrecision': 8,
+    'orderTypes': ['LIMIT', 'MARKET', 'STOP_LOSS', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT', 'TAKE_PROFIT_LIMIT'],
+    'icebergAllowed': True,
+    'ocoAllowed': True,
+    'filters': [
+        {
+            'filterType': 'PRICE_FILTER',
+            'minPrice': '0.00000001',
+            'maxPrice': '1000000.00000000',
+            'tickSize': '0.00000001'
+        },
+        {
+            'filterType': 'LOT_SIZE',
+            'minQty': '0.00000001',
+            'maxQty': '9000000.00000000',
+            'stepSize': '0.00000001'
+        },
+        {
+            'filterType': 'MIN_NOTIONAL',
+            'minNotional': '10.00000000'
+        }
+    ]
+}
+
+
+def _copy_symbol_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy symbol info deep enough that callers cannot mutate the cached/template parts."""
+    return dict(
+        info,
+        orderTypes=list(info['orderTypes']),
+        filters=[dict(f) for f in info['filters']]
+    )
+
+
+def _candle_kernel_py(
+    out: np.ndarray,
+    base_price: float,
+    volatility: float,
+    trend: float
+) -> None:
+    """
+    Sequential candle generator, written for Numba's nopython mode.
+    
+    Walks the candles one by one so the trend is clipped at every step
+    and each open is exactly the previous close. Scalar loops like this
+    are slow in CPython but compile to a tight native loop under @njit.
+    
+    Args:
+        out (np.ndarray): CANDLE_DTYPE array to fill (timestamps excluded)
+        base_price (float): Open price of the first candle
+        volatility (float): Per-candle return standard deviation
+        trend (float): Initial trend in [-1, 1]
+    """
+    current_price = base_price
+    for i in range(out.shape[0]):
+        open_price = current_price
+        
+        # Prevent extreme drops
+        price_change = np.random.normal(trend * 0.1, volatility)
+        close_price = max(open_price + price_change * open_price, open_price * 0.95)
+        
+        price_range = abs(close_price - open_price) * np.random.uniform(0.5, 2.0)
+        high_price = max(open_price, close_price) + np.random.uniform(0.0, 1.0) * price_range
+        low_price = min(open_price, close_price) - np.random.uniform(0.0, 1.0) * price_range
+        
+        # Higher volume with bigger moves
+        volume = np.random.uniform(100.0, 5000.0) * (1 + abs(price_change) * 10)
+        quote_volume = volume * ((open_price + close_price) / 2)
+        taker_buy_ratio = np.random.uniform(0.4, 0.6)
+        
+        out[i]['open'] = open_price
+        out[i]['high'] = high_price
+        out[i]['low'] = low_price
+        out[i]['close'] = close_price
+        out[i]['volume'] = volume
+        out[i]['quote_volume'] = quote_volume
+        out[i]['trade_count'] = int(volume / np.random.uniform(0.1, 2.0))
+        out[i]['taker_buy_volume'] = volume * taker_buy_ratio
+        out[i]['taker_buy_quote_volume'] = quote_volume * taker_buy_ratio
+        
+        # Update for next candle, keeping the trend bounded
+        current_price = close_price
+        trend = min(1.0, max(-1.0, trend + np.random.normal(0.0, 0.05)))
+
+
+# Compiled kernels, or None to use the vectorized NumPy path instead
+if njit is not None:
+    _candle_kernel = njit(cache=True)(_candle_kernel_py)
+    
+    @njit(parallel=True, cache=True)
+    def _candle_batch_kernel(out, base_prices, volatilities, trends):
+        """Fill one row of a (symbols, candles) array per symbol, in parallel threads."""
+        for s in prange(out.shape[0]):
+            _candle_kernel(out[s], base_prices[s], volatilities[s], trends[s])
+else:
+    _candle_kernel = None
+    _candle_batch_kernel = None
 
 
 class MockProvider(MarketDataProvider):
@@ -47,7 +196,7 @@ class MockProvider(MarketDataProvider):
         ]
         
         # Base prices for symbols (used for realistic price generation)
-        self.base_prices = {
+        base_prices = {
             'BTCUSDT': 43000.0,
             'ETHUSDT': 2600.0,
             'ADAUSDT': 0.38,
@@ -61,11 +210,10 @@ class MockProvider(MarketDataProvider):
         }
         
         # Market state for consistency
-        self.current_prices = self.base_prices.copy()
         self.price_trends = {symbol: 0.0 for symbol in self.symbols}  # -1 to 1
         
         # Volatility settings
-        self.volatility = {
+        volatility = {
             'BTCUSDT': 0.02,
             'ETHUSDT': 0.025,
             'ADAUSDT': 0.04,
@@ -78,26 +226,71 @@ class MockProvider(MarketDataProvider):
             'BCHUSDT': 0.04
         }
         
+        # Per-symbol state as float64 arrays indexed by symbol id: array
+        # indexing replaces string hashing and suits the vectorized paths
+        self._sym_idx = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._base_price_arr = np.array([base_prices[s] for s in self.symbols], dtype=np.float64)
+        self._volatility_arr = np.array([volatility[s] for s in self.symbols], dtype=np.float64)
+        self._current_price_arr = self._base_price_arr.copy()
+        self._symbol_set = frozenset(self.symbols)
+        
+        # Vectorized random source for bulk data generation
+        self._rng = np.random.default_rng()
+        
         # Supported intervals
-        self.supported_intervals = ['1m', '3m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w', '1M']
+        self.supported_intervals = list(_INTERVAL_SECONDS)
+        
+        # Static metadata caches (symbol info never changes for the mock)
+        self._symbol_info_cache: Dict[str, Dict[str, Any]] = {}
+        self._symbols_cache: Optional[Tuple[str, ...]] = None
+        
+        # Artificial network latency (off for benchmarks and bulk backtests)
+        self._simulate_latency = config.simulate_latency
         
         self.logger.info("Mock provider initialized with simulated market data")
     
+    @property
+    def base_prices(self) -> Dict[str, float]:
+        """Base price per symbol (read-only snapshot)."""
+        return dict(zip(self.symbols, self._base_price_arr.tolist()))
+    
+    @property
+    def current_prices(self) -> Dict[str, float]:
+        """Latest simulated price per symbol (read-only snapshot)."""
+        return dict(zip(self.symbols, self._current_price_arr.tolist()))
+    
+    @property
+    def volatility(self) -> Dict[str, float]:
+        """Volatility setting per symbol (read-only snapshot)."""
+        return dict(zip(self.symbols, self._volatility_arr.tolist()))
+    
     async def connect(self):
         """Initialize mock connection."""
         await super().connect()
         # Simulate connection delay
-        await asyncio.sleep(0.1)
+        await self._maybe_delay(0.1, 0.1)
         self.logger.info("Mock provider connected")
     
+    async def _maybe_delay(self, lo: float, hi: float):
+        """
+        Sleep for a random duration to simulate network latency.
+        
+        Args:
+            lo (float): Minimum delay in seconds
+            hi (float): Maximum delay in seconds
+        """
+        if self._simulate_latency:
+            await asyncio.sleep(random.uniform(lo, hi))
+    
     async def get_historical_candles(
         self,
         symbol: str,
         interval: str,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: Optional[int] = None
-    ) -> List[Candle]:
+        limit: Optional[int] = None,
+        raw: bool = False
+    ) -> Union[List[Candle], np.ndarray]:
         """
         Generate mock historical candlestick data.
         
@@ -107,36 +300,112 @@ class MockProvider(MarketDataProvider):
             start_time (Optional[datetime]): Start time for data range
             end_time (Optional[datetime]): End time for data range
             limit (Optional[int]): Maximum number of candles
+            raw (bool): Return a packed CANDLE_DTYPE array instead of
+                Candle objects (much smaller for bulk generation)
             
         Returns:
-            List[Candle]: Mock historical candles
+            Union[List[Candle], np.ndarray]: Mock historical candles
         """
-        symbol = self._validate_symbol(symbol)
-        interval = self._validate_interval(interval)
+        symbol = self._fast_symbol(symbol)
+        interval = self._fast_interval(interval)
         
         # Simulate API delay
-        await asyncio.sleep(random.uniform(0.05, 0.2))
-        
-        # Determine time range
-        if end_time is None:
-            end_time = datetime.now(timezone.utc)
+        await self._maybe_delay(0.05, 0.2)
         
-        if start_time is None:
-            if limit:
-                # Calculate start time based on limit and interval
-                interval_seconds = self._interval_to_seconds(interval)
-                start_time = end_time - timedelta(seconds=interval_seconds * limit)
-            else:
-                # Default to 1000 candles back
-                interval_seconds = self._interval_to_seconds(interval)
-                start_time = end_time - timedelta(seconds=interval_seconds * 1000)
+        start_time, end_time = self._resolve_time_range(interval, start_time, end_time, limit)
         
         # Generate candles
+        if raw:
+            return self._generate_candle_array(symbol, interval, start_time, end_time, limit)
+        
         candles = self._generate_candles(symbol, interval, start_time, end_time, limit)
         
         self.logger.debug(f"Generated {len(candles)} mock candles for {symbol} {interval}")
         return candles
     
+    async def iter_historical_candles(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Candle]:
+        """
+        Stream mock historical candlestick data one candle at a time.
+        
+        Candle objects are built lazily in chunks from the packed array, so
+        only one chunk is alive at a time. Prefer this over
+        get_historical_candles for long ranges that are consumed once.
+        
+        Args:
+            symbol (str): Trading symbol
+            interval (str): Candle interval
+            start_time (Optional[datetime]): Start time for data range
+            end_time (Optional[datetime]): End time for data range
+            limit (Optional[int]): Maximum number of candles
+            
+        Yields:
+            Candle: Mock historical candles, oldest first
+        """
+        symbol = self._fast_symbol(symbol)
+        interval = self._fast_interval(interval)
+        
+        # Simulate API delay
+        await self._maybe_delay(0.05, 0.2)
+        
+        start_time, end_time = self._resolve_time_range(interval, start_time, end_time, limit)
+        
+        for chunk in self._iter_candles(symbol, interval, start_time, end_time, limit):
+            for candle in chunk:
+                yield candle
+            # Let other tasks run between chunks
+            await asyncio.sleep(0)
+    
+    async def get_historical_candles_batch(
+        self,
+        symbols: List[str],
+        interval: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Generate mock historical candles for several symbols at once.
+        
+        All symbols share one time range. With numba installed the symbols
+        are generated in parallel native threads. Generation runs on the
+        event loop thread and blocks it until done.
+        
+        Args:
+            symbols (List[str]): Trading symbols
+            interval (str): Candle interval
+            start_time (Optional[datetime]): Start time for data range
+            end_time (Optional[datetime]): End time for data range
+            limit (Optional[int]): Maximum number of candles per symbol
+            
+        Returns:
+            Dict[str, np.ndarray]: CANDLE_DTYPE array per symbol
+        """
+        symbols = [self._fast_symbol(symbol) for symbol in symbols]
+        interval = self._fast_interval(interval)
+        
+        # Simulate API delay
+        await self._maybe_delay(0.05, 0.2)
+        
+        start_time, end_time = self._resolve_time_range(interval, start_time, end_time, limit)
+        
+        # Called inline, so the event loop is blocked until the whole batch
+        # is generated; releasing the GIL does not change that. Accepted for
+        # a mock: batches are small, the generator shares the provider's RNG
+        # and price state with the other coroutines, and numba's TBB layer
+        # can hang at interpreter exit when its first parallel launch comes
+        # from a worker thread.
+        candles = self._generate_candle_batch(symbols, interval, start_time, end_time, limit)
+        
+        self.logger.debug(f"Generated {candles.shape[1]} mock candles for {len(symbols)} symbols {interval}")
+        return dict(zip(symbols, candles))
+    
     async def get_current_ticker(self, symbol: str) -> Ticker:
         """
         Generate mock current ticker data.
@@ -147,19 +416,20 @@ class MockProvider(MarketDataProvider):
         Returns:
             Ticker: Mock ticker data
         """
-        symbol = self._validate_symbol(symbol)
+        symbol = self._fast_symbol(symbol)
         
         # Simulate API delay
-        await asyncio.sleep(random.uniform(0.02, 0.1))
+        await self._maybe_delay(0.02, 0.1)
         
         # Get current price (simulate small movement)
-        current_price = self.current_prices[symbol]
-        volatility = self.volatility[symbol]
+        idx = self._sym_idx[symbol]
+        current_price = float(self._current_price_arr[idx])
+        volatility = float(self._volatility_arr[idx])
         
         # Small random price movement
         price_change = random.gauss(0, volatility * current_price * 0.1)
         new_price = max(current_price + price_change, current_price * 0.5)  # Prevent negative prices
-        self.current_prices[symbol] = new_price
+        self._current_price_arr[idx] = new_price
         
         # Generate 24h statistics
         price_24h_change = random.gauss(0, volatility * current_price * 0.5)
@@ -181,7 +451,7 @@ class MockProvider(MarketDataProvider):
         quote_volume_24h = volume_24h * new_price
         
         ticker = Ticker(
-            timestamp=int(time.time() * 1000),
+            timestamp=time.time_ns() // 1_000_000,
             symbol=symbol,
             price=new_price,
             bid=bid,
@@ -195,7 +465,7 @@ class MockProvider(MarketDataProvider):
             low_24h=low_24h,
             open_24h=open_24h,
             quote_volume_24h=quote_volume_24h,
-            raw_data={'mock_provider': True}
+            raw_data=_MOCK_RAW
         )
         
         return ticker
@@ -211,39 +481,34 @@ class MockProvider(MarketDataProvider):
         Returns:
             OrderBook: Mock order book
         """
-        symbol = self._validate_symbol(symbol)
+        symbol = self._fast_symbol(symbol)
         
         # Simulate API delay
-        await asyncio.sleep(random.uniform(0.02, 0.1))
+        await self._maybe_delay(0.02, 0.1)
         
         if limit is None:
             limit = 20
         
-        current_price = self.current_prices[symbol]
+        current_price = float(self._current_price_arr[self._sym_idx[symbol]])
+        rng = self._rng
         
-        # Generate bid levels (below current price)
-        bids = []
-        for i in range(limit):
-            price_offset = (i + 1) * random.uniform(0.0001, 0.001) * current_price
-            price = current_price - price_offset
-            quantity = random.uniform(0.1, 50.0)
-            bids.append(OrderBookLevel(price, quantity))
+        # Levels step away from the current price by cumulative random
+        # offsets, so bids strictly descend and asks strictly ascend
+        bid_prices = current_price - np.cumsum(rng.uniform(0.0001, 0.001, limit) * current_price)
+        ask_prices = current_price + np.cumsum(rng.uniform(0.0001, 0.001, limit) * current_price)
+        bid_quantities = rng.uniform(0.1, 50.0, limit)
+        ask_quantities = rng.uniform(0.1, 50.0, limit)
         
-        # Generate ask levels (above current price)
-        asks = []
-        for i in range(limit):
-            price_offset = (i + 1) * random.uniform(0.0001, 0.001) * current_price
-            price = current_price + price_offset
-            quantity = random.uniform(0.1, 50.0)
-            asks.append(OrderBookLevel(price, quantity))
+        bids = [OrderBookLevel(p, q) for p, q in zip(bid_prices.tolist(), bid_quantities.tolist())]
+        asks = [OrderBookLevel(p, q) for p, q in zip(ask_prices.tolist(), ask_quantities.tolist())]
         
         order_book = OrderBook(
-            timestamp=int(time.time() * 1000),
+            timestamp=time.time_ns() // 1_000_000,
             symbol=symbol,
             bids=bids,
             asks=asks,
             last_update_id=random.randint(1000000, 9999999),
-            raw_data={'mock_provider': True}
+            raw_data=_MOCK_RAW
         )
         
         return order_book
@@ -263,42 +528,57 @@ class MockProvider(MarketDataProvider):
         Returns:
             List[Trade]: Mock recent trades
         """
-        symbol = self._validate_symbol(symbol)
+        symbol = self._fast_symbol(symbol)
         
         # Simulate API delay
-        await asyncio.sleep(random.uniform(0.02, 0.1))
+        await self._maybe_delay(0.02, 0.1)
         
         if limit is None:
             limit = 100
         
-        current_price = self.current_prices[symbol]
-        volatility = self.volatility[symbol]
+        idx = self._sym_idx[symbol]
+        current_price = float(self._current_price_arr[idx])
+        volatility = float(self._volatility_arr[idx])
         
-        trades = []
-        base_timestamp = int(time.time() * 1000)
+        rng = self._rng
+        base_timestamp = time.time_ns() // 1_000_000
         
-        for i in range(limit):
-            # Generate trade price around current price
-            price_variance = random.gauss(0, volatility * current_price * 0.01)
-            trade_price = max(current_price + price_variance, current_price * 0.9)
-            
-            # Generate trade details
-            trade = Trade(
-                timestamp=base_timestamp - (limit - i) * random.randint(100, 5000),
-                symbol=symbol,
-                trade_id=str(random.randint(100000000, 999999999)),
-                price=trade_price,
-                quantity=random.uniform(0.001, 10.0),
-                side=random.choice(['buy', 'sell']),
-                is_buyer_maker=random.choice([True, False]),
-                raw_data={'mock_provider': True}
-            )
-            trades.append(trade)
+        # Draw every per-trade field as one vector instead of per-trade calls
+        prices = np.maximum(
+            current_price + rng.normal(0, volatility * current_price * 0.01, limit),
+            current_price * 0.9
+        )
+        quantities = rng.uniform(0.001, 10.0, limit)
+        
+        # One 2-bit draw per trade: bit 0 picks the side, bit 1 the maker flag
+        bits = rng.integers(0, 4, size=limit, dtype=np.uint8)
+        sides = bits & 1
+        makers = ((bits >> 1) & 1).astype(bool)
+        trade_ids = rng.integers(100_000_000, 1_000_000_000, size=limit)
+        
+        timestamps = base_timestamp - (limit - np.arange(limit)) * rng.integers(100, 5000, limit, endpoint=True)
         
         # Sort by timestamp (oldest first)
-        trades.sort(key=lambda t: t.timestamp)
+        order = np.argsort(timestamps, kind='stable')
+        side_names = ('buy', 'sell')
         
-        return trades
+        return [
+            Trade(
+                timestamp=ts,
+                symbol=symbol,
+                trade_id=str(trade_id),
+                price=price,
+                quantity=quantity,
+                side=side_names[side],
+                is_buyer_maker=maker,
+                raw_data=_MOCK_RAW
+            )
+            for ts, price, quantity, side, maker, trade_id in zip(
+                timestamps[order].tolist(), prices[order].tolist(),
+                quantities[order].tolist(), sides[order].tolist(),
+                makers[order].tolist(), trade_ids.tolist()
+            )
+        ]
     
     async def get_supported_symbols(self) -> List[str]:
         """
@@ -307,9 +587,12 @@ class MockProvider(MarketDataProvider):
         Returns:
             List[str]: List of mock symbols
         """
-        # Simulate API delay
-        await asyncio.sleep(random.uniform(0.01, 0.05))
-        return self.symbols.copy()
+        if self._symbols_cache is None:
+            # Simulate API delay
+            await self._maybe_delay(0.01, 0.05)
+            self._symbols_cache = tuple(self.symbols)
+        
+        return list(self._symbols_cache)
     
     async def get_symbol_info(self, symbol: str) -> Dict[str, Any]:
         """
@@ -321,50 +604,33 @@ class MockProvider(MarketDataProvider):
         Returns:
             Dict[str, Any]: Mock symbol info
         """
-        symbol = self._validate_symbol(symbol)
+        symbol = self._fast_symbol(symbol)
+        
+        cached = self._symbol_info_cache.get(symbol)
+        if cached is not None:
+            return _copy_symbol_info(cached)
         
         # Simulate API delay
-        await asyncio.sleep(random.uniform(0.01, 0.05))
-        
-        base_asset = symbol.replace('USDT', '').replace('BTC', '').replace('ETH', '')
-        quote_asset = 'USDT'
-        
-        if symbol.endswith('BTC'):
-            quote_asset = 'BTC'
-        elif symbol.endswith('ETH'):
-            quote_asset = 'ETH'
-        
-        symbol_info = {
-            'symbol': symbol,
-            'status': 'TRADING',
-            'baseAsset': base_asset,
-            'quoteAsset': quote_asset,
-            'baseAssetPrecision': 8,
-            'quoteAssetPrecision': 8,
-            'orderTypes': ['LIMIT', 'MARKET', 'STOP_LOSS', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT', 'TAKE_PROFIT_LIMIT'],
-            'icebergAllowed': True,
-            'ocoAllowed': True,
-            'filters': [
-                {
-                    'filterType': 'PRICE_FILTER',
-                    'minPrice': '0.00000001',
-                    'maxPrice': '1000000.00000000',
-                    'tickSize': '0.00000001'
-                },
-                {
-                    'filterType': 'LOT_SIZE',
-                    'minQty': '0.00000001',
-                    'maxQty': '9000000.00000000',
-                    'stepSize': '0.00000001'
-                },
-                {
-                    'filterType': 'MIN_NOTIONAL',
-                    'minNotional': '10.00000000'
-                }
-            ]
-        }
+        await self._maybe_delay(0.01, 0.05)
+        
+        # Split on the first matching quote suffix (single scan per quote)
+        base_asset, quote_asset = symbol, 'USDT'
+        for quote in _QUOTE_ASSETS:
+            if symbol.endswith(quote):
+                base_asset, quote_asset = symbol[:-len(quote)], quote
+                break
+        
+        # Nested orderTypes/filters are shared with the template; callers
+        # only ever get copies of them
+        info = dict(
+            _SYMBOL_INFO_TEMPLATE,
+            symbol=symbol,
+            baseAsset=base_asset,
+            quoteAsset=quote_asset
+        )
+        self._symbol_info_cache[symbol] = info
         
-        return symbol_info
+        return _copy_symbol_info(info)
     
     async def ping(self) -> bool:
         """
@@ -373,7 +639,7 @@ class MockProvider(MarketDataProvider):
         Returns:
             bool: Always True for mock provider
         """
-        await asyncio.sleep(random.uniform(0.01, 0.03))
+        await self._maybe_delay(0.01, 0.03)
         return True
     
     async def get_server_time(self) -> Optional[datetime]:
@@ -383,8 +649,26 @@ class MockProvider(MarketDataProvider):
         Returns:
             Optional[datetime]: Current time
         """
-        await asyncio.sleep(random.uniform(0.01, 0.03))
-        return datetime.now(timezone.utc)
+        await self._maybe_delay(0.01, 0.03)
+        return _now(_UTC)
+    
+    def _resolve_time_range(
+        self,
+        interval: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: Optional[int]
+    ) -> Tuple[datetime, datetime]:
+        """Fill in a default start/end time for a candle request."""
+        if end_time is None:
+            end_time = _now(_UTC)
+        
+        if start_time is None:
+            # Go back `limit` candles, defaulting to 1000
+            interval_seconds = self._interval_to_seconds(interval)
+            start_time = end_time - timedelta(seconds=interval_seconds * (limit or 1000))
+        
+        return start_time, end_time
     
     def _generate_candles(
         self,
@@ -395,120 +679,245 @@ class MockProvider(MarketDataProvider):
         limit: Optional[int] = None
     ) -> List[Candle]:
         """Generate realistic mock candle data."""
+        return [
+            candle
+            for chunk in self._iter_candles(symbol, interval, start_time, end_time, limit)
+            for candle in chunk
+        ]
+    
+    def _iter_candles(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: datetime,
+        end_time: datetime,
+        limit: Optional[int] = None,
+        chunk_size: int = 1024
+    ) -> Iterator[List[Candle]]:
+        """
+        Generate mock candles lazily in chunks.
+        
+        The price path is produced up front as a packed CANDLE_DTYPE array
+        (~80 bytes per candle); Candle objects are only built chunk_size at
+        a time as the caller consumes them.
+        
+        Args:
+            symbol (str): Trading symbol
+            interval (str): Candle interval
+            start_time (datetime): Start time for data range
+            end_time (datetime): End time for data range
+            limit (Optional[int]): Maximum number of candles
+            chunk_size (int): Candles per yielded chunk
+            
+        Yields:
+            List[Candle]: Consecutive chunks of candles, oldest first
+        """
+        candle_array = self._generate_candle_array(symbol, interval, start_time, end_time, limit)
+        
+        for offset in range(0, len(candle_array), chunk_size):
+            # tolist() yields one tuple of native ints/floats per record
+            yield [
+                Candle(
+                    timestamp=ts,
+                    symbol=symbol,
+                    interval=interval,
+                    open=o,
+                    high=h,
+                    low=l,
+                    close=c,
+                    volume=v,
+                    quote_volume=qv,
+                    trade_count=tc,
+                    taker_buy_volume=tbv,
+                    taker_buy_quote_volume=tbqv,
+                    raw_data=_MOCK_RAW
+                )
+                for ts, o, h, l, c, v, qv, tc, tbv, tbqv
+                in candle_array[offset:offset + chunk_size].tolist()
+            ]
+    
+    def _generate_candle_array(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: datetime,
+        end_time: datetime,
+        limit: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Generate realistic mock candle data as a CANDLE_DTYPE array.
+        
+        Uses the Numba-compiled sequential kernel when numba is installed,
+        otherwise an equivalent vectorized NumPy formulation.
+        """
+        timestamps = self._candle_timestamps(interval, start_time, end_time, limit)
+        out = np.empty(len(timestamps), dtype=CANDLE_DTYPE)
+        if len(out) == 0:
+            return out
+        
+        out['timestamp'] = timestamps
+        
+        idx = self._sym_idx[symbol]
+        base_price = float(self._base_price_arr[idx])
+        volatility = float(self._volatility_arr[idx])
+        initial_trend = self._rng.normal(0, 0.3)  # Overall trend direction
+        
+        if _candle_kernel is not None:
+            _candle_kernel(out, base_price, volatility, initial_trend)
+        else:
+            self._fill_candle_array(out, base_price, volatility, initial_trend)
+        
+        # Update current price for this symbol
+        self._current_price_arr[idx] = out['close'][-1]
+        
+        return out
+    
+    def _generate_candle_batch(
+        self,
+        symbols: List[str],
+        interval: str,
+        start_time: datetime,
+        end_time: datetime,
+        limit: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Generate candles for several symbols over the same time range.
+        
+        Args:
+            symbols (List[str]): Normalized trading symbols
+            interval (str): Candle interval
+            start_time (datetime): Start time for data range
+            end_time (datetime): End time for data range
+            limit (Optional[int]): Maximum number of candles per symbol
+            
+        Returns:
+            np.ndarray: CANDLE_DTYPE array of shape (len(symbols), num_candles)
+        """
+        timestamps = self._candle_timestamps(interval, start_time, end_time, limit)
+        out = np.empty((len(symbols), len(timestamps)), dtype=CANDLE_DTYPE)
+        if out.size == 0:
+            return out
+        
+        out['timestamp'] = timestamps
+        
+        idx = np.array([self._sym_idx[s] for s in symbols], dtype=np.intp)
+        base_prices = self._base_price_arr[idx]
+        volatilities = self._volatility_arr[idx]
+        trends = self._rng.normal(0, 0.3, len(symbols))
+        
+        if _candle_batch_kernel is not None:
+            # Runs without the GIL, one symbol per thread
+            _candle_batch_kernel(out, base_prices, volatilities, trends)
+        else:
+            for row, base_price, volatility, trend in zip(out, base_prices, volatilities, trends):
+                self._fill_candle_array(row, base_price, volatility, trend)
+        
+        self._current_price_arr[idx] = out['close'][:, -1]
+        
+        return out
+    
+    def _candle_timestamps(
+        self,
+        interval: str,
+        start_time: datetime,
+        end_time: datetime,
+        limit: Optional[int] = None
+    ) -> np.ndarray:
+        """Open times (ms) of the candles covering [start_time, end_time)."""
         interval_seconds = self._interval_to_seconds(interval)
         
         # Calculate number of candles needed
         total_seconds = (end_time - start_time).total_seconds()
-        num_candles = int(total_seconds // interval_seconds)
+        num_candles = max(int(total_seconds // interval_seconds), 0)
         
         if limit:
             num_candles = min(num_candles, limit)
         
-        candles = []
-        current_time = start_time
-        current_price = self.base_prices[symbol]
-        volatility = self.volatility[symbol]
-        
-        # Generate trend for this period
-        trend = random.gauss(0, 0.3)  # Overall trend direction
-        
-        for i in range(num_candles):
-            # Generate OHLC with realistic relationships
-            
-            # Open price (close of previous candle or current price)
-            open_price = current_price
-            
-            # Generate price movement for this candle
-            price_change = random.gauss(trend * 0.1, volatility)
-            close_change = price_change * current_price
-            close_price = max(open_price + close_change, open_price * 0.95)  # Prevent extreme drops
-            
-            # Generate high and low
-            range_multiplier = random.uniform(0.5, 2.0)
-            price_range = abs(close_price - open_price) * range_multiplier
-            
-            high_offset = random.uniform(0, price_range)
-            low_offset = random.uniform(0, price_range)
-            
-            high_price = max(open_price, close_price) + high_offset
-            low_price = min(open_price, close_price) - low_offset
-            
-            # Ensure OHLC relationships are valid
-            high_price = max(high_price, open_price, close_price)
-            low_price = min(low_price, open_price, close_price)
-            
-            # Generate volume
-            base_volume = random.uniform(100, 5000)
-            volume_multiplier = 1 + abs(price_change) * 10  # Higher volume with bigger moves
-            volume = base_volume * volume_multiplier
-            
-            quote_volume = volume * ((open_price + close_price) / 2)
-            
-            # Generate trade count
-            trade_count = int(volume / random.uniform(0.1, 2.0))
-            
-            # Generate taker buy volumes (typically 40-60% of total volume)
-            taker_buy_ratio = random.uniform(0.4, 0.6)
-            taker_buy_volume = volume * taker_buy_ratio
-            taker_buy_quote_volume = quote_volume * taker_buy_ratio
-            
-            candle = Candle(
-                timestamp=int(current_time.timestamp() * 1000),
-                symbol=symbol,
-                interval=interval,
-                open=open_price,
-                high=high_price,
-                low=low_price,
-                close=close_price,
-                volume=volume,
-                quote_volume=quote_volume,
-                trade_count=trade_count,
-                taker_buy_volume=taker_buy_volume,
-                taker_buy_quote_volume=taker_buy_quote_volume,
-                raw_data={'mock_provider': True}
-            )
-            
-            candles.append(candle)
-            
-            # Update for next candle
-            current_price = close_price
-            current_time += timedelta(seconds=interval_seconds)
-            
-            # Add some noise to trend
-            trend += random.gauss(0, 0.05)
-            trend = max(-1, min(1, trend))  # Keep trend bounded
-        
-        # Update current price for this symbol
-        if candles:
-            self.current_prices[symbol] = candles[-1].close
+        # Integer millisecond arithmetic: no per-candle datetime/timedelta math
+        start_ms = int(start_time.timestamp() * 1000)
+        interval_ms = interval_seconds * 1000
+        return start_ms + np.arange(num_candles, dtype=np.int64) * interval_ms
+    
+    def _fill_candle_array(
+        self,
+        out: np.ndarray,
+        base_price: float,
+        volatility: float,
+        initial_trend: float
+    ) -> None:
+        """
+        Vectorized NumPy fallback for _candle_kernel_py.
         
-        return candles
+        Args:
+            out (np.ndarray): CANDLE_DTYPE array to fill (timestamps excluded)
+            base_price (float): Open price of the first candle
+            volatility (float): Per-candle return standard deviation
+            initial_trend (float): Initial trend in [-1, 1]
+        """
+        rng = self._rng
+        num_candles = len(out)
+        
+        # Trend noise kept within [-1, 1]. Clipping the cumulative walk
+        # (rather than each step) is close enough for simulated data and
+        # keeps this a single array pass.
+        trend_steps = np.zeros(num_candles)
+        trend_steps[1:] = rng.normal(0, 0.05, num_candles - 1)
+        trend = np.clip(initial_trend + np.cumsum(trend_steps), -1, 1)
+        
+        # Each candle opens at the previous close; closes are a cumulative
+        # product of per-candle moves, floored at -5% to prevent extreme drops
+        price_change = rng.normal(trend * 0.1, volatility)
+        close_prices = base_price * np.cumprod(np.maximum(1 + price_change, 0.95))
+        open_prices = np.empty(num_candles)
+        open_prices[0] = base_price
+        open_prices[1:] = close_prices[:-1]
+        
+        # Generate high and low around the open/close body, reusing the
+        # body arrays in place instead of allocating temporaries
+        price_range = np.abs(close_prices - open_prices)
+        price_range *= rng.uniform(0.5, 2.0, num_candles)
+        high_prices = np.maximum(open_prices, close_prices)
+        high_prices += rng.uniform(0, 1, num_candles) * price_range
+        low_prices = np.minimum(open_prices, close_prices)
+        low_prices -= rng.uniform(0, 1, num_candles) * price_range
+        
+        # Higher volume with bigger moves
+        volumes = rng.uniform(100, 5000, num_candles) * (1 + np.abs(price_change) * 10)
+        quote_volumes = volumes * ((open_prices + close_prices) / 2)
+        
+        # Taker buy volumes are typically 40-60% of total volume
+        taker_buy_ratio = rng.uniform(0.4, 0.6, num_candles)
+        
+        out['open'] = open_prices
+        out['high'] = high_prices
+        out['low'] = low_prices
+        out['close'] = close_prices
+        out['volume'] = volumes
+        out['quote_volume'] = quote_volumes
+        out['trade_count'] = volumes / rng.uniform(0.1, 2.0, num_candles)
+        out['taker_buy_volume'] = volumes * taker_buy_ratio
+        out['taker_buy_quote_volume'] = quote_volumes * taker_buy_ratio
+    
+    def _fast_symbol(self, symbol: str) -> str:
+        """Return symbol as-is if already a known normalized symbol, else validate it."""
+        if symbol in self._symbol_set:
+            return symbol
+        return self._validate_symbol(symbol)
     
-    def _interval_to_seconds(self, interval: str) -> int:
+    def _fast_interval(self, interval: str) -> str:
+        """Return interval as-is if already normalized, else validate it."""
+        if interval in _NORMALIZED_INTERVALS:
+            return interval
+        return self._validate_interval(interval)
+    
+    @staticmethod
+    def _interval_to_seconds(interval: str) -> int:
         """Convert interval string to seconds."""
-        interval_map = {
-            '1m': 60,
-            '3m': 180,
-            '5m': 300,
-            '15m': 900,
-            '30m': 1800,
-            '1h': 3600,
-            '2h': 7200,
-            '4h': 14400,
-            '6h': 21600,
-            '8h': 28800,
-            '12h': 43200,
-            '1d': 86400,
-            '3d': 259200,
-            '1w': 604800,
-            '1M': 2592000  # Approximate month
-        }
-        
-        return interval_map.get(interval, 3600)  # Default to 1 hour
+        return _INTERVAL_SECONDS.get(interval, 3600)  # Default to 1 hour
     
     def normalize_interval(self, interval: str) -> str:
         """Normalize interval format."""
-        normalized = interval.lower()
-        if normalized not in self.supported_intervals:
+        normalized = sys.intern(interval.lower())
+        if normalized not in _INTERVAL_SECONDS:
             raise ValueError(f"Unsupported interval: {interval}")
         return normalized
\ No newline at end of file
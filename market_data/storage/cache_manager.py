@@ -5,36 +5,282 @@ Intelligent caching system for market data with TTL, LRU eviction,
 and memory management. Supports both in-memory and persistent caching.
 """
 
+import mmap
+import os
+import struct
+import sys
 import time
 import json
 import hashlib
+import heapq
+import itertools
 import pickle
-from typing import Any, Optional, Dict, List, Tuple
-from dataclasses import dataclass
+from typing import Any, Optional, Dict, List, Tuple, Hashable
+from dataclasses import dataclass, field
 from pathlib import Path
 import threading
+import queue
+import weakref
 import logging
+from collections import OrderedDict, deque
 
-from ..models import Candle, Ticker, OrderBook, Trade
+from ..models import Candle, CandleBatch, Ticker, OrderBook, Trade
 
 
 logger = logging.getLogger(__name__)
 
+# Buffered cache hits replayed per batch by a reader that finds the lock free
+READ_BUFFER_DRAIN_THRESHOLD = 64
 
-@dataclass
+# Fraction of max memory freed beyond the incoming value on memory eviction
+MEMORY_EVICTION_HEADROOM = 0.05
+
+# Pending disk operations before put()/invalidate() block on the writer
+PERSIST_QUEUE_SIZE = 1024
+
+_PERSIST_STOP = object()
+
+# Persistent cache: one append-only log of length-prefixed records
+# (key length, value length, expiry, value size, key, pickled entry). An
+# empty value is a tombstone. Only headers are read on startup; values are
+# decoded on first get. The log is compacted on startup when it holds dead
+# records.
+PERSIST_LOG_NAME = "cache.log"
+PERSIST_LOG_MAGIC = b"TRCACHE2"
+_RECORD_HEADER = struct.Struct('<HIdQ')
+
+# Published index updates the writer may hold back before flushing early
+PERSIST_INDEX_BATCH = 256
+
+
+def _encode_record(key: str, payload: bytes, expires_at: float = 0.0, size: int = 0) -> bytes:
+    """Encode one persistent cache log record."""
+    key_bytes = key.encode()
+    return _RECORD_HEADER.pack(len(key_bytes), len(payload), expires_at, size) + key_bytes + payload
+
+
+def _stop_persist_worker(persist_queue: queue.Queue, thread: threading.Thread):
+    """Flush queued disk operations and stop the writer thread."""
+    persist_queue.put(_PERSIST_STOP)
+    thread.join()
+
+
+class _PersistentLog:
+    """
+    Writer side of the persistent cache log.
+    
+    Owns the log file, the read descriptor and the on-disk index, and runs
+    the background writer thread. It holds no reference to its CacheManager,
+    so an unclosed manager can still be collected and its finalizer can stop
+    the thread.
+    
+    The index maps keys to values on disk (offset, length, expiry, size) and
+    is only updated by the writer once records are flushed; keys with queued
+    writes are "unsynced" and never read from disk, so a stale value cannot
+    be served.
+    """
+    
+    def __init__(self, log_path: Path, index: Dict[str, Tuple[int, int, float, int]]):
+        self.queue: queue.Queue = queue.Queue(maxsize=PERSIST_QUEUE_SIZE)
+        self.index = index
+        self.index_lock = threading.Lock()
+        self.unsynced: Dict[str, int] = {}
+        self.unsynced_clears = 0
+        self._pending_index: List[Tuple[str, Optional[str], Optional[Tuple[int, int, float, int]]]] = []
+        # Writes go through a buffered append handle; lazy reads use
+        # positional reads on a separate descriptor
+        self._log_file = open(log_path, 'ab')
+        self.read_fd: Optional[int] = os.open(log_path, os.O_RDONLY)
+    
+    def enqueue(self, action: str, key: Optional[str], entry: Optional["CacheEntry"]):
+        """Queue a disk operation, marking its key unsynced until the writer publishes it."""
+        with self.index_lock:
+            if action == 'clear':
+                self.unsynced_clears += 1
+            else:
+                self.unsynced[key] = self.unsynced.get(key, 0) + 1
+        self.queue.put((action, key, entry))
+    
+    def contains(self, key: str) -> bool:
+        """Whether key is on disk or has a queued write."""
+        with self.index_lock:
+            return key in self.index or key in self.unsynced
+    
+    def read(self, key: str) -> Optional[Tuple[bytes, int]]:
+        """
+        Read the pickled value for key from the log.
+        
+        Args:
+            key (str): Cache key
+            
+        Returns:
+            Optional[Tuple[bytes, int]]: Payload and recorded size, or None
+            if the key is missing, expired, unsynced or unreadable
+        """
+        with self.index_lock:
+            if self.unsynced_clears or key in self.unsynced or self.read_fd is None:
+                return None
+            location = self.index.get(key)
+            if location is None:
+                return None
+            offset, length, expires_at, size = location
+            if time.time() > expires_at:
+                del self.index[key]
+                return None
+            try:
+                payload = os.pread(self.read_fd, length, offset)
+            except OSError:
+                return None
+        
+        if len(payload) != length:
+            return None
+        return payload, size
+    
+    def run(self):
+        """Apply queued persistent cache operations in order (writer thread)."""
+        persist_queue = self.queue
+        while True:
+            op = persist_queue.get()
+            try:
+                if op is _PERSIST_STOP:
+                    self._publish_index()
+                    self._log_file.close()
+                    with self.index_lock:
+                        read_fd, self.read_fd = self.read_fd, None
+                    if read_fd is not None:
+                        os.close(read_fd)
+                    return
+                action, key, entry = op
+                if action == 'save':
+                    self._save(key, entry)
+                elif action == 'remove':
+                    self._remove(key)
+                elif action == 'clear':
+                    self._clear()
+                
+                # Hand data to the OS once the backlog is drained, then let
+                # readers see the new records
+                if persist_queue.empty() or len(self._pending_index) >= PERSIST_INDEX_BATCH:
+                    self._publish_index()
+            except Exception as e:
+                logger.warning(f"Persistent cache operation failed: {e}")
+            finally:
+                persist_queue.task_done()
+    
+    def _publish_index(self):
+        """Flush written records and apply their index updates (writer thread only)."""
+        self._log_file.flush()
+        pending = self._pending_index
+        if not pending:
+            return
+        with self.index_lock:
+            index = self.index
+            unsynced = self.unsynced
+            for action, key, location in pending:
+                if action == 'clear':
+                    index.clear()
+                    self.unsynced_clears -= 1
+                    continue
+                if location is None:
+                    index.pop(key, None)
+                else:
+                    index[key] = location
+                remaining = unsynced[key] - 1
+                if remaining:
+                    unsynced[key] = remaining
+                else:
+                    del unsynced[key]
+        pending.clear()
+    
+    def _save(self, key: str, entry: "CacheEntry"):
+        """Append entry to the log (writer thread only)."""
+        try:
+            payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            record = _encode_record(key, payload, entry.expires_at, entry.size)
+        except Exception as e:
+            logger.warning(f"Failed to save to persistent cache: {e}")
+            # Shadow any older value for the key on disk
+            self._remove(key)
+            return
+        
+        try:
+            value_offset = self._log_file.tell() + len(record) - len(payload)
+            self._log_file.write(record)
+        except Exception as e:
+            logger.warning(f"Failed to save to persistent cache: {e}")
+            self._pending_index.append(('remove', key, None))
+            return
+        self._pending_index.append(
+            ('save', key, (value_offset, len(payload), entry.expires_at, entry.size))
+        )
+    
+    def _clear(self):
+        """Truncate the log (writer thread only)."""
+        self._pending_index.append(('clear', None, None))
+        self._log_file.seek(0)
+        self._log_file.truncate()
+        self._log_file.write(PERSIST_LOG_MAGIC)
+    
+    def _remove(self, key: str):
+        """Append a tombstone for key to the log (writer thread only)."""
+        try:
+            self._log_file.write(_encode_record(key, b''))
+        except Exception as e:
+            logger.warning(f"Failed to remove from persistent cache: {e}")
+        self._pending_index.append(('remove', key, None))
+
+
+# Per-class sizes for flat market-data models, measured on first use
+_MODEL_SIZES: Dict[type, int] = {}
+
+
+def _model_size(obj: Any) -> int:
+    """Approximate size of a flat model dataclass (Candle, Ticker, Trade)."""
+    size = _MODEL_SIZES.get(type(obj))
+    if size is None:
+        size = sys.getsizeof(obj) + sum(
+            sys.getsizeof(getattr(obj, name)) for name in obj.__dataclass_fields__
+        )
+        _MODEL_SIZES[type(obj)] = size
+    return size
+
+
+def _order_book_size(book: OrderBook) -> int:
+    """Approximate size of an OrderBook including its price levels."""
+    num_levels = len(book.bids) + len(book.asks)
+    if not num_levels:
+        return _model_size(book)
+    sample = book.bids[0] if book.bids else book.asks[0]
+    return _model_size(book) + num_levels * _model_size(sample)
+
+
+_MODEL_SIZERS = {
+    Candle: _model_size,
+    Ticker: _model_size,
+    Trade: _model_size,
+    OrderBook: _order_book_size,
+    CandleBatch: lambda batch: batch.nbytes,
+}
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """Cache entry with metadata."""
-    key: str
+    key: Hashable
     value: Any
     timestamp: float
     ttl: float
     access_count: int = 0
-    last_access: float = 0.0
+    size: int = 0  # Estimated value size in bytes, computed once on put
+    expires_at: float = field(init=False)  # timestamp + ttl, precomputed
+    
+    def __post_init__(self):
+        self.expires_at = self.timestamp + self.ttl
     
     @property
     def is_expired(self) -> bool:
         """Check if cache entry is expired."""
-        return time.time() - self.timestamp > self.ttl
+        return time.time() > self.expires_at
     
     @property
     def age(self) -> float:
@@ -44,7 +290,6 @@ class CacheEntry:
     def touch(self):
         """Update access statistics."""
         self.access_count += 1
-        self.last_access = time.time()
 
 
 class CacheManager:
@@ -82,15 +327,39 @@ class CacheManager:
         self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
         self.persistent = persistent
         
-        self._cache: Dict[str, CacheEntry] = {}
+        # Ordered oldest -> most recently used; LRU eviction pops the front
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._lock = threading.RLock()
         self._memory_usage = 0
         
-        # Persistent cache setup
+        # Keys of lock-free cache hits, replayed into LRU order under the lock
+        self._read_buffer: deque = deque()
+        
+        # Min-heap of (expiry time, key); stale records are skipped lazily
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._expiry_seq = itertools.count()  # tie-breaker; keys may not be mutually orderable
+        
+        # Persistent cache setup; disk writes happen on a background thread,
+        # in mutation order
+        self._persist_log: Optional[_PersistentLog] = None
+        self._persist_thread: Optional[threading.Thread] = None
         if persistent:
             self.cache_dir = Path(cache_dir or "./cache")
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            self._load_persistent_cache()
+            index = self._load_persistent_cache()
+            
+            # The thread runs on the log, not on self, so the finalizer can
+            # fire for a manager that was never closed
+            self._persist_log = _PersistentLog(self.cache_dir / PERSIST_LOG_NAME, index)
+            self._persist_thread = threading.Thread(
+                target=self._persist_log.run,
+                name="CacheManager-persist",
+                daemon=True
+            )
+            self._persist_thread.start()
+            self._persist_finalizer = weakref.finalize(
+                self, _stop_persist_worker, self._persist_log.queue, self._persist_thread
+            )
         else:
             self.cache_dir = None
         
@@ -102,38 +371,57 @@ class CacheManager:
             'memory_evictions': 0
         }
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """
         Get value from cache.
         
+        Hits do not take the lock: the key is appended to a read buffer and
+        the LRU reordering is replayed in batches under the lock later. For
+        persistent caches, keys not in memory are decoded from disk on demand.
+        
         Args:
-            key (str): Cache key
+            key (Hashable): Cache key (must be a str when persistent)
             
         Returns:
             Optional[Any]: Cached value or None
         """
-        with self._lock:
-            if key not in self._cache:
-                self._stats['misses'] += 1
-                return None
-            
-            entry = self._cache[key]
-            
-            # Check expiration
-            if entry.is_expired:
-                self._remove_entry(key)
-                self._stats['misses'] += 1
-                return None
-            
-            # Update access statistics
-            entry.touch()
-            self._stats['hits'] += 1
-            
-            return entry.value
+        entry = self._cache.get(key)
+        
+        if entry is None or entry.is_expired:
+            with self._lock:
+                # Re-check under the lock; a concurrent put may have landed
+                entry = self._cache.get(key)
+                if entry is not None and entry.is_expired:
+                    self._remove_entry(key)
+                    entry = None
+                elif entry is None and self._persist_log is not None:
+                    entry = self._load_from_persistent(key)
+                elif entry is not None:
+                    self._cache.move_to_end(key)
+                
+                if entry is None:
+                    self._stats['misses'] += 1
+                    return None
+                self._stats['hits'] += 1
+                entry.touch()
+                return entry.value
+        
+        # Record the hit; deque.append is atomic
+        entry.touch()
+        self._read_buffer.append(key)
+        
+        # Opportunistically replay reads, never waiting on a writer
+        if len(self._read_buffer) >= READ_BUFFER_DRAIN_THRESHOLD and self._lock.acquire(blocking=False):
+            try:
+                self._drain_reads()
+            finally:
+                self._lock.release()
+        
+        return entry.value
     
     def put(
         self,
-        key: str,
+        key: Hashable,
         value: Any,
         ttl: Optional[float] = None
     ):
@@ -141,7 +429,7 @@ class CacheManager:
         Store value in cache.
         
         Args:
-            key (str): Cache key
+            key (Hashable): Cache key (must be a str when persistent)
             value (Any): Value to cache
             ttl (Optional[float]): Custom TTL, uses default if None
         """
@@ -149,9 +437,16 @@ class CacheManager:
             ttl = self.default_ttl
         
         with self._lock:
+            # Apply pending reads so eviction sees the true LRU order
+            self._drain_reads()
+            
             # Calculate memory usage
             value_size = self._estimate_size(value)
             
+            # Remove old entry if exists (re-inserting moves it to the MRU end)
+            if key in self._cache:
+                self._remove_entry(key, persist=False)
+            
             # Check if we need to evict entries
             self._ensure_capacity(value_size)
             
@@ -160,27 +455,24 @@ class CacheManager:
                 key=key,
                 value=value,
                 timestamp=time.time(),
-                ttl=ttl
+                ttl=ttl,
+                size=value_size
             )
             
-            # Remove old entry if exists
-            if key in self._cache:
-                self._remove_entry(key)
-            
             # Add new entry
             self._cache[key] = entry
             self._memory_usage += value_size
+            self._push_expiry(key, entry)
             
-            # Save to persistent cache if enabled
-            if self.persistent:
-                self._save_to_persistent(key, entry)
+            # Queue write to persistent cache if enabled
+            self._queue_persist('save', key, entry)
     
-    def invalidate(self, key: str) -> bool:
+    def invalidate(self, key: Hashable) -> bool:
         """
         Remove specific key from cache.
         
         Args:
-            key (str): Cache key to remove
+            key (Hashable): Cache key to remove
             
         Returns:
             bool: True if key was removed
@@ -189,18 +481,22 @@ class CacheManager:
             if key in self._cache:
                 self._remove_entry(key)
                 return True
+            if self._persist_log is not None and self._persist_log.contains(key):
+                # Only on disk (or about to be); write the tombstone directly
+                self._queue_persist('remove', key, None)
+                return True
             return False
     
     def clear(self):
         """Clear all cache entries."""
         with self._lock:
+            self._drain_reads()
             self._cache.clear()
+            self._expiry_heap.clear()
             self._memory_usage = 0
             
-            if self.persistent and self.cache_dir:
-                # Clear persistent cache
-                for cache_file in self.cache_dir.glob("*.cache"):
-                    cache_file.unlink()
+            # Clear persistent cache
+            self._queue_persist('clear', None, None)
     
     def cleanup_expired(self) -> int:
         """
@@ -210,46 +506,138 @@ class CacheManager:
             int: Number of entries removed
         """
         with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items() 
-                if entry.is_expired
-            ]
+            self._drain_reads()
             
-            for key in expired_keys:
-                self._remove_entry(key)
+            # Pop only the due part of the expiry heap instead of scanning
+            # every entry
+            heap = self._expiry_heap
+            now = time.time()
+            removed = 0
+            while heap and heap[0][0] < now:
+                _, _, key = heapq.heappop(heap)
+                entry = self._cache.get(key)
+                # Skip records for keys since removed or re-put with a later expiry
+                if entry is not None and entry.expires_at < now:
+                    self._remove_entry(key)
+                    removed += 1
             
-            return len(expired_keys)
+            return removed
     
     def get_stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
         
+        Lock-free: reads a copy of the counters (dict.copy is atomic under
+        the GIL), so monitoring never contends with writers. Buffered hits
+        not yet replayed are counted from the read buffer.
+        
         Returns:
             Dict[str, Any]: Cache statistics
         """
+        stats = self._stats.copy()
+        hits = stats['hits'] + len(self._read_buffer)
+        total_requests = hits + stats['misses']
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+        
+        return {
+            'size': len(self._cache),
+            'max_size': self.max_size,
+            'memory_usage_mb': self._memory_usage / (1024 * 1024),
+            'max_memory_mb': self.max_memory_bytes / (1024 * 1024),
+            'hit_rate_percent': hit_rate,
+            'total_hits': hits,
+            'total_misses': stats['misses'],
+            'total_evictions': stats['evictions'],
+            'memory_evictions': stats['memory_evictions']
+        }
+    
+    def flush(self):
+        """Block until all queued persistent cache writes have been applied."""
+        persist_log = self._persist_log
+        if persist_log is not None:
+            persist_log.queue.join()
+    
+    def close(self):
+        """
+        Flush pending persistent cache writes and stop the writer thread.
+        
+        The manager stays usable as an in-memory cache; later mutations are
+        no longer written to disk.
+        """
         with self._lock:
-            total_requests = self._stats['hits'] + self._stats['misses']
-            hit_rate = (self._stats['hits'] / total_requests * 100) if total_requests > 0 else 0
-            
-            return {
-                'size': len(self._cache),
-                'max_size': self.max_size,
-                'memory_usage_mb': self._memory_usage / (1024 * 1024),
-                'max_memory_mb': self.max_memory_bytes / (1024 * 1024),
-                'hit_rate_percent': hit_rate,
-                'total_hits': self._stats['hits'],
-                'total_misses': self._stats['misses'],
-                'total_evictions': self._stats['evictions'],
-                'memory_evictions': self._stats['memory_evictions']
-            }
+            # Detach the log first so no later call queues work that no
+            # thread will consume
+            self._persist_log = None
+            if self._persist_thread is not None:
+                self._persist_finalizer()
+    
+    def _queue_persist(self, action: str, key: Optional[str], entry: Optional[CacheEntry]):
+        """Queue a disk operation on the persistent log writer, if still open."""
+        if self._persist_log is not None:
+            self._persist_log.enqueue(action, key, entry)
+    
+    def _load_from_persistent(self, key: Hashable) -> Optional[CacheEntry]:
+        """Decode an entry from the persistent log into memory (lock held)."""
+        record = self._persist_log.read(key)
+        if record is None:
+            return None
+        payload, size = record
+        try:
+            entry = pickle.loads(payload)
+            entry.expires_at = entry.timestamp + entry.ttl
+        except Exception as e:
+            logger.warning(f"Failed to load cache entry {key}: {e}")
+            return None
+        
+        entry.size = size or self._estimate_size(entry.value)
+        self._ensure_capacity(entry.size)
+        self._cache[key] = entry
+        self._memory_usage += entry.size
+        self._push_expiry(key, entry)
+        return entry
+    
+    def _push_expiry(self, key: Hashable, entry: CacheEntry):
+        """Track entry expiry in the heap (lock held)."""
+        heap = self._expiry_heap
+        heapq.heappush(heap, (entry.expires_at, next(self._expiry_seq), key))
+        
+        # Rebuild when stale records from overwritten/removed keys pile up
+        if len(heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [
+                (cached.expires_at, next(self._expiry_seq), cached_key)
+                for cached_key, cached in self._cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+    
+    def _drain_reads(self):
+        """Replay buffered cache hits into LRU order and hit statistics (lock held)."""
+        buffer = self._read_buffer
+        cache = self._cache
+        hits = 0
+        while True:
+            try:
+                key = buffer.popleft()
+            except IndexError:
+                break
+            hits += 1
+            if key in cache:
+                cache.move_to_end(key)
+        self._stats['hits'] += hits
     
     def _ensure_capacity(self, new_value_size: int):
         """Ensure cache has capacity for new value."""
-        # Memory-based eviction
-        while (self._memory_usage + new_value_size > self.max_memory_bytes and 
-               len(self._cache) > 0):
-            self._evict_lru()
-            self._stats['memory_evictions'] += 1
+        # Common case: room on both counts, nothing to evict
+        if (len(self._cache) < self.max_size and
+                self._memory_usage + new_value_size <= self.max_memory_bytes):
+            return
+        
+        # Memory-based eviction, in a batch down to a little headroom so the
+        # next puts do not immediately evict again
+        if self._memory_usage + new_value_size > self.max_memory_bytes:
+            target = self.max_memory_bytes - int(self.max_memory_bytes * MEMORY_EVICTION_HEADROOM)
+            while self._memory_usage + new_value_size > target and self._cache:
+                self._evict_lru()
+                self._stats['memory_evictions'] += 1
         
         # Size-based eviction
         while len(self._cache) >= self.max_size:
@@ -261,44 +649,49 @@ class CacheManager:
         if not self._cache:
             return
         
-        # Find LRU entry
-        lru_key = min(
-            self._cache.keys(),
-            key=lambda k: self._cache[k].last_access or self._cache[k].timestamp
-        )
-        
-        self._remove_entry(lru_key)
+        # Least recently used entry is always at the front: O(1). Evicted
+        # entries stay on disk and can be decoded again on a later get.
+        lru_key = next(iter(self._cache))
+        self._remove_entry(lru_key, persist=False)
     
-    def _remove_entry(self, key: str):
-        """Remove entry and update memory usage."""
+    def _remove_entry(self, key: Hashable, persist: bool = True):
+        """Remove entry and update memory usage, also from disk if persist."""
         if key in self._cache:
             entry = self._cache[key]
-            size = self._estimate_size(entry.value)
-            self._memory_usage = max(0, self._memory_usage - size)
+            self._memory_usage = max(0, self._memory_usage - entry.size)
             del self._cache[key]
             
             # Remove from persistent cache
-            if self.persistent:
-                self._remove_from_persistent(key)
+            if persist:
+                self._queue_persist('remove', key, None)
     
     def _estimate_size(self, obj: Any) -> int:
-        """Estimate memory size of object."""
+        """
+        Estimate memory size of object.
+        
+        Cheap structural estimate (no serialization). Containers are sized
+        from their first element rather than walked in full.
+        """
         try:
-            if isinstance(obj, (Candle, Ticker, OrderBook, Trade)):
-                # Use pickle size for dataclass objects
-                return len(pickle.dumps(obj))
+            sizer = _MODEL_SIZERS.get(type(obj))
+            if sizer is not None:
+                return sizer(obj)
             elif isinstance(obj, (str, bytes)):
                 return len(obj)
             elif isinstance(obj, (list, tuple)):
-                return sum(self._estimate_size(item) for item in obj)
+                if not obj:
+                    return sys.getsizeof(obj)
+                return sys.getsizeof(obj) + len(obj) * self._estimate_size(obj[0])
             elif isinstance(obj, dict):
-                return sum(
-                    self._estimate_size(k) + self._estimate_size(v) 
-                    for k, v in obj.items()
+                if not obj:
+                    return sys.getsizeof(obj)
+                k, v = next(iter(obj.items()))
+                return sys.getsizeof(obj) + len(obj) * (
+                    self._estimate_size(k) + self._estimate_size(v)
                 )
             else:
-                # Fallback to pickle size
-                return len(pickle.dumps(obj))
+                # Objects like DataFrames/ndarrays report their own size
+                return sys.getsizeof(obj)
         except Exception:
             # Conservative estimate
             return 1024
@@ -310,63 +703,141 @@ class CacheManager:
             'kwargs': sorted(kwargs.items())
         }
         key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return _digest(key_str)
     
-    def _save_to_persistent(self, key: str, entry: CacheEntry):
-        """Save entry to persistent cache."""
-        if not self.cache_dir:
-            return
+    def _load_persistent_cache(self) -> Dict[str, Tuple[int, int, float, int]]:
+        """
+        Index live records in the persistent cache log, compacting it if needed.
         
-        try:
-            cache_file = self.cache_dir / f"{key}.cache"
-            with open(cache_file, 'wb') as f:
-                pickle.dump(entry, f)
-        except Exception as e:
-            logger.warning(f"Failed to save to persistent cache: {e}")
-    
-    def _load_persistent_cache(self):
-        """Load entries from persistent cache."""
-        if not self.cache_dir or not self.cache_dir.exists():
-            return
+        Returns:
+            Dict[str, Tuple[int, int, float, int]]: Value locations by key
+        """
+        log_path = self.cache_dir / PERSIST_LOG_NAME
+        if not log_path.exists():
+            return self._write_log(log_path, b'', {})
         
-        loaded_count = 0
-        for cache_file in self.cache_dir.glob("*.cache"):
-            try:
-                with open(cache_file, 'rb') as f:
-                    entry = pickle.load(f)
-                
-                # Check if entry is still valid
-                if not entry.is_expired:
-                    key = cache_file.stem
-                    self._cache[key] = entry
-                    self._memory_usage += self._estimate_size(entry.value)
-                    loaded_count += 1
+        with open(log_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                data = b''
+            else:
+                # Map rather than read: only headers are touched
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        # Replay the log headers: later records win, empty payloads are
+        # tombstones, expired records are dropped. Re-inserting keeps the
+        # index in last-write order. Values stay on disk.
+        now = time.time()
+        locations: Dict[str, Tuple[int, int, float, int]] = {}
+        dead_records = 0
+        if data[:len(PERSIST_LOG_MAGIC)] == PERSIST_LOG_MAGIC:
+            offset = len(PERSIST_LOG_MAGIC)
+            while offset + _RECORD_HEADER.size <= len(data):
+                key_len, value_len, expires_at, size = _RECORD_HEADER.unpack_from(data, offset)
+                offset += _RECORD_HEADER.size
+                end = offset + key_len + value_len
+                if end > len(data):
+                    break  # Truncated tail from an interrupted write
+                key = data[offset:offset + key_len].decode()
+                if locations.pop(key, None) is not None:
+                    dead_records += 1
+                if value_len and expires_at > now:
+                    locations[key] = (offset + key_len, value_len, expires_at, size)
                 else:
-                    # Remove expired persistent cache file
-                    cache_file.unlink()
-                    
-            except Exception as e:
-                logger.warning(f"Failed to load cache file {cache_file}: {e}")
-                # Remove corrupted cache file
-                try:
-                    cache_file.unlink()
-                except:
-                    pass
-        
-        if loaded_count > 0:
-            logger.info(f"Loaded {loaded_count} entries from persistent cache")
-    
-    def _remove_from_persistent(self, key: str):
-        """Remove entry from persistent cache."""
-        if not self.cache_dir:
-            return
+                    dead_records += 1
+                offset = end
+            if offset != len(data):
+                dead_records += 1
+        else:
+            if data:
+                logger.warning(f"Unrecognized persistent cache log {log_path}, discarding")
+            dead_records += 1
         
+        # Compact: rewrite the log with only live records
+        if dead_records:
+            locations = self._write_log(log_path, data, locations)
+        if isinstance(data, mmap.mmap):
+            data.close()
+        
+        if locations:
+            logger.info(f"Indexed {len(locations)} entries from persistent cache")
+        return locations
+    
+    def _write_log(
+        self,
+        log_path: Path,
+        data: Any,
+        locations: Dict[str, Tuple[int, int, float, int]]
+    ) -> Dict[str, Tuple[int, int, float, int]]:
+        """
+        Atomically replace the persistent cache log with the given records.
+        
+        Args:
+            log_path (Path): Log file to replace
+            data (Any): Buffer (bytes or mmap) holding the record values
+            locations (Dict[str, Tuple[int, int, float, int]]): Records to keep
+            
+        Returns:
+            Dict[str, Tuple[int, int, float, int]]: Record locations in the new log
+        """
+        new_locations = {}
+        tmp_path = log_path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(PERSIST_LOG_MAGIC)
+            for key, (start, length, expires_at, size) in locations.items():
+                payload = data[start:start + length]
+                record = _encode_record(key, payload, expires_at, size)
+                new_locations[key] = (f.tell() + len(record) - length, length, expires_at, size)
+                f.write(record)
+        os.replace(tmp_path, log_path)
+        return new_locations
+
+
+def _digest(key_str: str) -> str:
+    """Hash a key string to a fixed-length hex digest (blake2b, 128-bit)."""
+    return hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
+
+
+def _call_cache_key(func, key_prefix: str, args: tuple, kwargs: dict) -> str:
+    """Generate a string cache key for a function call (JSON + digest)."""
+    key_data = {
+        'func': func.__name__,
+        'args': args,
+        'kwargs': sorted(kwargs.items())
+    }
+    key_str = json.dumps(key_data, sort_keys=True, default=str)
+    return f"{key_prefix}_{_digest(key_str)}"
+
+
+def _call_cache_key_fast(
+    cache_manager: CacheManager, func, key_prefix: str, args: tuple, kwargs: dict
+) -> Hashable:
+    """
+    Generate cache key for a function call.
+    
+    Uses the call arguments as a tuple key when they are hashable, so lookups
+    cost a C-level tuple hash. Each argument is paired with its type, since
+    equal values of different types (1, True, 1.0) hash alike and would
+    otherwise share an entry. Falls back to the string digest for unhashable
+    arguments, and always for persistent caches (the log stores string keys).
+    
+    Tuple keys hold strong references to the call arguments for as long as
+    the entry stays cached.
+    """
+    if not cache_manager.persistent:
+        key = (
+            key_prefix,
+            func.__name__,
+            tuple([(type(arg), arg) for arg in args]),
+            tuple([
+                (name, type(value), value) for name, value in sorted(kwargs.items())
+            ]) if kwargs else ()
+        )
         try:
-            cache_file = self.cache_dir / f"{key}.cache"
-            if cache_file.exists():
-                cache_file.unlink()
-        except Exception as e:
-            logger.warning(f"Failed to remove from persistent cache: {e}")
+            hash(key)
+            return key
+        except TypeError:
+            pass
+    return _call_cache_key(func, key_prefix, args, kwargs)
 
 
 # Decorator for automatic caching
@@ -385,14 +856,7 @@ def cached(
     """
     def decorator(func):
         def wrapper(*args, **kwargs):
-            # Generate cache key
-            key_data = {
-                'func': func.__name__,
-                'args': args,
-                'kwargs': sorted(kwargs.items())
-            }
-            key_str = json.dumps(key_data, sort_keys=True, default=str)
-            cache_key = f"{key_prefix}_{hashlib.md5(key_str.encode()).hexdigest()}"
+            cache_key = _call_cache_key_fast(cache_manager, func, key_prefix, args, kwargs)
             
             # Try to get from cache
             result = cache_manager.get(cache_key)
@@ -407,14 +871,7 @@ def cached(
         
         # For async functions
         async def async_wrapper(*args, **kwargs):
-            # Generate cache key
-            key_data = {
-                'func': func.__name__,
-                'args': args,
-                'kwargs': sorted(kwargs.items())
-            }
-            key_str = json.dumps(key_data, sort_keys=True, default=str)
-            cache_key = f"{key_prefix}_{hashlib.md5(key_str.encode()).hexdigest()}"
+            cache_key = _call_cache_key_fast(cache_manager, func, key_prefix, args, kwargs)
             
             # Try to get from cache
             result = cache_manager.get(cache_key)
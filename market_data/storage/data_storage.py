@@ -8,23 +8,67 @@ including Parquet, CSV, and JSON. Provides efficient data archival and retrieval
 import pandas as pd
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Tuple
 from datetime import datetime, timezone
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import attrgetter
 import logging
 
-from ..models import Candle, Ticker, OrderBook, Trade
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pa_ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - falls back to pandas reads/writes
+    pa = pa_ds = pq = None
+
+from ..models import Candle, CandleBatch, Ticker, OrderBook, Trade
 
 
 logger = logging.getLogger(__name__)
 
+# Parquet frames larger than this are written one row group at a time
+PARQUET_STREAM_THRESHOLD = 100_000
+PARQUET_ROW_GROUP_SIZE = 65_536
+
+
+def _model_columns(model: type) -> Tuple[str, ...]:
+    """Stored column names for a model: every field except raw_data."""
+    return tuple(f.name for f in fields(model) if f.name != 'raw_data')
+
+
+_CANDLE_COLUMNS = _model_columns(Candle)
+_TICKER_COLUMNS = _model_columns(Ticker)
+_TRADE_COLUMNS = _model_columns(Trade)
+
+
+def _models_to_dataframe(items: List[Any], columns: Tuple[str, ...]) -> pd.DataFrame:
+    """
+    Build a DataFrame column-wise from model objects.
+    
+    Gathers each row with a single attrgetter call and transposes, avoiding
+    asdict() (which deep-copies every field, including raw_data).
+    """
+    get_row = attrgetter(*columns)
+    column_values = list(zip(*map(get_row, items))) or [()] * len(columns)
+    return pd.DataFrame(dict(zip(columns, column_values)))
+
+
+def _optional_column(df: pd.DataFrame, name: str) -> List[Any]:
+    """Column values as a list, with missing columns/values mapped to None."""
+    if name not in df:
+        return [None] * len(df)
+    column = df[name]
+    if column.hasnans:
+        column = column.astype(object).where(column.notna(), None)
+    return column.tolist()
+
 
 @dataclass
 class StorageConfig:
     """Configuration for data storage."""
     base_path: str = "./data"
     format: str = "parquet"  # parquet, csv, json
-    compression: Optional[str] = "snappy"  # For parquet: snappy, gzip, lz4
+    compression: Optional[str] = "zstd"  # For parquet: zstd, snappy, gzip, lz4
     partition_by: str = "date"  # date, symbol, interval
     max_file_size_mb: int = 100
     enable_indexing: bool = True
@@ -64,7 +108,7 @@ class DataStorage:
     
     def store_candles(
         self,
-        candles: List[Candle],
+        candles: Union[List[Candle], CandleBatch],
         symbol: Optional[str] = None,
         interval: Optional[str] = None
     ) -> str:
@@ -72,28 +116,35 @@ class DataStorage:
         Store candlestick data.
         
         Args:
-            candles (List[Candle]): List of candles to store
+            candles (Union[List[Candle], CandleBatch]): Candles to store, as a list or columnar batch
             symbol (Optional[str]): Symbol for filename (extracted from candles if None)
             interval (Optional[str]): Interval for filename (extracted from candles if None)
             
         Returns:
             str: Path to stored file
         """
-        if not candles:
+        if not len(candles):
             raise ValueError("No candles provided")
         
-        # Extract metadata if not provided
+        # Extract metadata if not provided. Lists keep per-row symbol and
+        # interval columns, since they may mix several of each.
+        if isinstance(candles, CandleBatch):
+            first_symbol, first_interval = candles.symbol, candles.interval
+            start_ms, end_ms = int(candles.timestamp[0]), int(candles.timestamp[-1])
+        else:
+            first_symbol, first_interval = candles[0].symbol, candles[0].interval
+            start_ms, end_ms = candles[0].timestamp, candles[-1].timestamp
         if symbol is None:
-            symbol = candles[0].symbol
+            symbol = first_symbol
         if interval is None:
-            interval = candles[0].interval
+            interval = first_interval
         
         # Convert to DataFrame
         df = self._candles_to_dataframe(candles)
         
         # Generate filename
-        start_time = datetime.fromtimestamp(candles[0].timestamp / 1000)
-        end_time = datetime.fromtimestamp(candles[-1].timestamp / 1000)
+        start_time = datetime.fromtimestamp(start_ms / 1000)
+        end_time = datetime.fromtimestamp(end_ms / 1000)
         
         filename = self._generate_filename(
             "candles",
@@ -137,37 +188,69 @@ class DataStorage:
         if not matching_files:
             return []
         
-        # Load and concatenate data
-        all_candles = []
-        for file_path in matching_files:
+        # Time range as millisecond bounds, comparable to the timestamp column
+        start_ms = int(start_time.timestamp() * 1000) if start_time else None
+        end_ms = int(end_time.timestamp() * 1000) if end_time else None
+        
+        df = None
+        if self.config.format == "parquet" and pa_ds is not None:
             try:
-                df = self._load_dataframe(file_path)
-                candles = self._dataframe_to_candles(df)
-                all_candles.extend(candles)
+                df = self._scan_parquet_candles(matching_files, start_ms, end_ms)
             except Exception as e:
-                logger.warning(f"Failed to load {file_path}: {e}")
-        
-        # Filter by time range if specified
-        if start_time or end_time:
-            filtered_candles = []
-            for candle in all_candles:
-                candle_time = datetime.fromtimestamp(candle.timestamp / 1000)
-                
-                if start_time and candle_time < start_time:
-                    continue
-                if end_time and candle_time > end_time:
-                    continue
-                
-                filtered_candles.append(candle)
+                logger.warning(f"Parquet dataset scan failed, loading files individually: {e}")
+        
+        if df is None:
+            # Load, filter and concatenate per file
+            frames = []
+            for file_path in matching_files:
+                try:
+                    frame = self._load_dataframe(file_path)
+                    if start_ms is not None:
+                        frame = frame[frame['timestamp'] >= start_ms]
+                    if end_ms is not None:
+                        frame = frame[frame['timestamp'] <= end_ms]
+                    frames.append(frame)
+                except Exception as e:
+                    logger.warning(f"Failed to load {file_path}: {e}")
             
-            all_candles = filtered_candles
+            if not frames:
+                return []
+            df = pd.concat(frames, ignore_index=True).sort_values('timestamp', kind='stable')
         
-        # Sort by timestamp
-        all_candles.sort(key=lambda c: c.timestamp)
+        all_candles = self._dataframe_to_candles(df)
         
         logger.info(f"Loaded {len(all_candles)} candles for {symbol} {interval}")
         return all_candles
     
+    def _scan_parquet_candles(
+        self,
+        files: List[Path],
+        start_ms: Optional[int],
+        end_ms: Optional[int]
+    ) -> pd.DataFrame:
+        """
+        Read candle files as one Arrow dataset with the time range pushed down.
+        
+        Args:
+            files (List[Path]): Parquet files to scan
+            start_ms (Optional[int]): Inclusive lower timestamp bound
+            end_ms (Optional[int]): Inclusive upper timestamp bound
+            
+        Returns:
+            pd.DataFrame: Matching rows sorted by timestamp
+        """
+        dataset = pa_ds.dataset([str(f) for f in files], format='parquet')
+        
+        filt = None
+        if start_ms is not None:
+            filt = pa_ds.field('timestamp') >= start_ms
+        if end_ms is not None:
+            upper = pa_ds.field('timestamp') <= end_ms
+            filt = upper if filt is None else filt & upper
+        
+        table = dataset.to_table(filter=filt).sort_by('timestamp')
+        return table.to_pandas(self_destruct=True)
+    
     def store_tickers(self, tickers: List[Ticker]) -> str:
         """
         Store ticker data.
@@ -362,16 +445,16 @@ class DataStorage:
         except:
             return "unknown"
     
-    def _candles_to_dataframe(self, candles: List[Candle]) -> pd.DataFrame:
+    def _candles_to_dataframe(self, candles: Union[List[Candle], CandleBatch]) -> pd.DataFrame:
         """Convert candles to DataFrame."""
-        data = []
-        for candle in candles:
-            row = asdict(candle)
-            # Remove raw_data for storage efficiency
-            row.pop('raw_data', None)
-            data.append(row)
-        
-        df = pd.DataFrame(data)
+        if isinstance(candles, CandleBatch):
+            columns = candles.columns()
+            df = pd.DataFrame({
+                name: columns[name] if name in columns else getattr(candles, name)
+                for name in _CANDLE_COLUMNS
+            }, copy=False)
+        else:
+            df = _models_to_dataframe(candles, _CANDLE_COLUMNS)
         
         # Convert timestamp to datetime for better indexing
         df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
@@ -380,48 +463,31 @@ class DataStorage:
     
     def _dataframe_to_candles(self, df: pd.DataFrame) -> List[Candle]:
         """Convert DataFrame to candles."""
-        candles = []
-        for _, row in df.iterrows():
-            candle = Candle(
-                timestamp=int(row['timestamp']),
-                symbol=row['symbol'],
-                interval=row['interval'],
-                open=float(row['open']),
-                high=float(row['high']),
-                low=float(row['low']),
-                close=float(row['close']),
-                volume=float(row['volume']),
-                quote_volume=row.get('quote_volume'),
-                trade_count=row.get('trade_count'),
-                taker_buy_volume=row.get('taker_buy_volume'),
-                taker_buy_quote_volume=row.get('taker_buy_quote_volume')
+        # Pull whole columns as native Python values; no per-row Series boxing
+        columns = [
+            df['timestamp'].astype('int64').tolist(),
+            df['symbol'].tolist(),
+            df['interval'].tolist(),
+            *(df[name].astype('float64').tolist() for name in ('open', 'high', 'low', 'close', 'volume')),
+            *(
+                _optional_column(df, name)
+                for name in ('quote_volume', 'trade_count', 'taker_buy_volume', 'taker_buy_quote_volume')
             )
-            candles.append(candle)
+        ]
         
-        return candles
+        # Positional order matches the Candle field order
+        return [Candle(*row) for row in zip(*columns)]
     
     def _tickers_to_dataframe(self, tickers: List[Ticker]) -> pd.DataFrame:
         """Convert tickers to DataFrame."""
-        data = []
-        for ticker in tickers:
-            row = asdict(ticker)
-            row.pop('raw_data', None)
-            data.append(row)
-        
-        df = pd.DataFrame(data)
+        df = _models_to_dataframe(tickers, _TICKER_COLUMNS)
         df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
         
         return df
     
     def _trades_to_dataframe(self, trades: List[Trade]) -> pd.DataFrame:
         """Convert trades to DataFrame."""
-        data = []
-        for trade in trades:
-            row = asdict(trade)
-            row.pop('raw_data', None)
-            data.append(row)
-        
-        df = pd.DataFrame(data)
+        df = _models_to_dataframe(trades, _TRADE_COLUMNS)
         df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
         
         return df
@@ -429,6 +495,9 @@ class DataStorage:
     def _save_dataframe(self, df: pd.DataFrame, file_path: Path):
         """Save DataFrame to file."""
         if self.config.format == "parquet":
+            if pq is not None and len(df) > PARQUET_STREAM_THRESHOLD:
+                self._write_parquet_row_groups(df, file_path)
+                return
             df.to_parquet(
                 file_path,
                 compression=self.config.compression,
@@ -441,6 +510,19 @@ class DataStorage:
         else:
             raise ValueError(f"Unsupported format: {self.config.format}")
     
+    def _write_parquet_row_groups(self, df: pd.DataFrame, file_path: Path):
+        """
+        Write a large DataFrame to Parquet in row-group sized slices.
+        
+        Only one slice is converted to Arrow at a time, so peak memory does
+        not double with the size of the frame.
+        """
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        with pq.ParquetWriter(file_path, schema, compression=self.config.compression) as writer:
+            for start in range(0, len(df), PARQUET_ROW_GROUP_SIZE):
+                chunk = df.iloc[start:start + PARQUET_ROW_GROUP_SIZE]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    
     def _load_dataframe(self, file_path: Path) -> pd.DataFrame:
         """Load DataFrame from file."""
         if self.config.format == "parquet":
@@ -448,6 +530,7 @@ class DataStorage:
         elif self.config.format == "csv":
             return pd.read_csv(file_path)
         elif self.config.format == "json":
-            return pd.read_json(file_path, orient='records')
+            # Keep epoch-ms 'timestamp' numeric instead of auto-parsing dates
+            return pd.read_json(file_path, orient='records', convert_dates=False)
         else:
             raise ValueError(f"Unsupported format: {self.config.format}")
\ No newline at end of file
@@ -5,7 +5,7 @@ Real-time market data streaming infrastructure with WebSocket support,
 data normalization, and event-driven architecture for live trading systems.
 """
 
-from .data_stream import DataStream, StreamConfig, StreamEvent
+from .data_stream import DataStream, StreamConfig, StreamEvent, install_fast_loop
 from .stream_manager import StreamManager
 from .event_dispatcher import EventDispatcher
 
@@ -13,6 +13,7 @@ __all__ = [
     'DataStream',
     'StreamConfig', 
     'StreamEvent',
+    'install_fast_loop',
     'StreamManager',
     'EventDispatcher'
 ]
\ No newline at end of file
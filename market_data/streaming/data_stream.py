@@ -9,17 +9,69 @@ import asyncio
 import aiohttp
 import json
 import time
-from typing import Dict, List, Optional, Callable, Any, AsyncIterator
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Callable, Any, AsyncIterator, Union, Set, Tuple
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 import logging
+from collections import deque
+
+try:
+    # Optional: orjson parses/serializes JSON several times faster than the stdlib
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - fallback when orjson is missing
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 from ..models import Candle, Ticker, OrderBook, Trade
 
 
 logger = logging.getLogger(__name__)
 
+# Binance stream-name markers -> message type, checked in order
+_STREAM_TYPE_MARKERS = (
+    ('@kline_', 'kline'),
+    ('@ticker', 'ticker'),
+    ('@depth', 'depth'),
+    ('@trade', 'trade'),
+)
+
+# Distinct stream names whose type is memoized per stream
+STREAM_TYPE_CACHE_SIZE = 1024
+
+# Minimum seconds between "message queue full" warnings
+DROP_LOG_INTERVAL = 5.0
+
+
+def install_fast_loop() -> bool:
+    """
+    Use uvloop's event loop for subsequently created loops, if installed.
+    
+    Opt-in (call before asyncio.run); streams run on any asyncio loop, but
+    uvloop's libuv-based I/O paths are considerably faster for WebSocket
+    heavy workloads.
+    
+    Returns:
+        bool: True if uvloop was installed as the event loop policy
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not installed, keeping the default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _uvloop_active() -> bool:
+    """Whether the current event loop policy is uvloop's."""
+    return type(asyncio.get_event_loop_policy()).__module__.startswith('uvloop')
+
 
 class StreamEvent(Enum):
     """Stream event types."""
@@ -44,7 +96,7 @@ class StreamConfig:
     
     # Heartbeat and keepalive
     heartbeat_interval: float = 30.0
-    ping_interval: float = 20.0
+    ping_interval: float = 20.0  # Unused: keepalive pings follow heartbeat_interval
     pong_timeout: float = 10.0
     
     # Data handling
@@ -54,6 +106,7 @@ class StreamConfig:
     # Quality of Service
     enable_compression: bool = True
     subscription_timeout: float = 10.0
+    share_session: bool = True  # Pool the HTTP session/connector across streams
     
     # Authentication (if needed)
     api_key: Optional[str] = None
@@ -73,18 +126,28 @@ class StreamConfig:
             'buffer_size': self.buffer_size,
             'max_message_size': self.max_message_size,
             'enable_compression': self.enable_compression,
-            'subscription_timeout': self.subscription_timeout
+            'subscription_timeout': self.subscription_timeout,
+            'share_session': self.share_session
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamMessage:
-    """Wrapper for stream messages with metadata."""
+    """Wrapper for stream messages with metadata (slotted; one per inbound frame)."""
     data: Any
-    timestamp: datetime
+    timestamp_ns: int  # Receive time, Unix epoch nanoseconds (time.time_ns())
     stream_id: str
     message_type: str
-    raw_message: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Receive time as a UTC datetime (built on access)."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, timezone.utc)
+    
+    @property
+    def raw_message(self) -> Dict[str, Any]:
+        """Parsed JSON message as received (same object as data)."""
+        return self.data
 
 
 class DataStream:
@@ -95,6 +158,12 @@ class DataStream:
     reconnection, heartbeat monitoring, and event-driven architecture.
     """
     
+    # Process-wide HTTP session used by streams with config.share_session,
+    # reference-counted so it is only closed when the last stream disconnects
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _session_refcount: int = 0
+    _session_lock: Optional[asyncio.Lock] = None
+    
     def __init__(
         self,
         config: StreamConfig,
@@ -113,35 +182,49 @@ class DataStream:
         # Connection state
         self._websocket: Optional[aiohttp.ClientWebSocketResponse] = None
         self._session: Optional[aiohttp.ClientSession] = None
+        self._uses_shared_session = False
         self._connected = False
         self._running = False
         self._reconnect_count = 0
         
         # Message handling
-        self._message_queue: asyncio.Queue = asyncio.Queue(maxsize=config.buffer_size)
-        self._subscriptions: Dict[str, Dict[str, Any]] = {}
-        
-        # Event handlers
-        self._event_handlers: Dict[StreamEvent, List[Callable]] = {
+        # Single producer (_enqueue_message) / single consumer (get_messages)
+        # on one event loop: a bare deque plus a wakeup event, no per-message
+        # Future. The event is also set when the stream stops.
+        self._message_buffer: deque = deque()
+        self._message_event = asyncio.Event()
+        # (subscription type, symbols) -> subscription info
+        self._subscriptions: Dict[Tuple[str, Tuple[str, ...]], Dict[str, Any]] = {}
+        self._stream_type_cache: Dict[str, Optional[str]] = {}  # stream name -> type
+        
+        # Event handlers, split by kind at registration so dispatch does
+        # not re-inspect each handler per event
+        self._sync_handlers: Dict[StreamEvent, List[Callable]] = {
+            event: [] for event in StreamEvent
+        }
+        self._async_handlers: Dict[StreamEvent, List[Callable]] = {
             event: [] for event in StreamEvent
         }
         
         # Tasks
         self._connection_task: Optional[asyncio.Task] = None
-        self._heartbeat_task: Optional[asyncio.Task] = None
-        self._message_handler_task: Optional[asyncio.Task] = None
+        self._handler_tasks: Set[asyncio.Task] = set()  # In-flight async event handlers
         
         # Statistics
         self._stats = {
             'messages_received': 0,
             'messages_sent': 0,
+            'messages_dropped': 0,
             'connection_count': 0,
             'reconnection_count': 0,
             'last_heartbeat': None,
             'uptime_start': None
         }
+        self._uptime_monotonic_start: Optional[float] = None  # For uptime arithmetic
+        self._last_drop_log = float('-inf')
         
-        logger.info(f"Data stream {self.stream_id} initialized")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Data stream %s initialized (uvloop: %s)", self.stream_id, _uvloop_active())
     
     async def connect(self) -> bool:
         """
@@ -151,58 +234,70 @@ class DataStream:
             bool: True if connection successful
         """
         if self._connected:
-            logger.warning(f"Stream {self.stream_id} already connected")
+            logger.warning("Stream %s already connected", self.stream_id)
             return True
         
         try:
-            # Create HTTP session if needed
+            # Create HTTP session if needed (kept across reconnects)
             if not self._session:
-                timeout = aiohttp.ClientTimeout(total=30)
-                self._session = aiohttp.ClientSession(timeout=timeout)
+                if self.config.share_session:
+                    self._session = await self._acquire_shared_session()
+                    self._uses_shared_session = True
+                else:
+                    self._session = self._create_session()
             
             # Establish WebSocket connection
-            logger.info(f"Connecting stream {self.stream_id} to {self.config.url}")
+            logger.info("Connecting stream %s to %s", self.stream_id, self.config.url)
             
             self._websocket = await self._session.ws_connect(
                 self.config.url,
                 max_msg_size=self.config.max_message_size,
-                compress=self.config.enable_compression,
-                heartbeat=self.config.heartbeat_interval
+                # aiohttp takes the deflate window size here, not a flag
+                compress=15 if self.config.enable_compression else 0,
+                heartbeat=self.config.heartbeat_interval,
+                # PINGs/PONGs are delivered to _connection_handler so PONGs
+                # can be recorded as heartbeats
+                autoping=False
             )
             
             self._connected = True
             self._running = True
             self._stats['connection_count'] += 1
             self._stats['uptime_start'] = datetime.now(timezone.utc)
+            self._uptime_monotonic_start = time.monotonic()
             
             # Start background tasks
             self._connection_task = asyncio.create_task(self._connection_handler())
-            self._heartbeat_task = asyncio.create_task(self._heartbeat_handler())
-            self._message_handler_task = asyncio.create_task(self._message_handler())
             
             # Trigger connected event
             await self._trigger_event(StreamEvent.CONNECTED, {'stream_id': self.stream_id})
             
-            logger.info(f"Stream {self.stream_id} connected successfully")
+            logger.info("Stream %s connected successfully", self.stream_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect stream {self.stream_id}: {e}")
+            logger.error("Failed to connect stream %s: %s", self.stream_id, e)
+            # Don't hold a reference to the shared session while disconnected
+            if self._uses_shared_session:
+                await self._close_session()
             await self._trigger_event(StreamEvent.ERROR, {'error': str(e)})
             return False
     
     async def disconnect(self):
         """Disconnect and cleanup resources."""
-        if not self._connected:
+        was_connected = self._connected
+        if not was_connected and self._session is None:
             return
         
-        logger.info(f"Disconnecting stream {self.stream_id}")
+        if was_connected:
+            logger.info("Disconnecting stream %s", self.stream_id)
         
         self._running = False
         self._connected = False
+        self._message_event.set()  # Wake consumers so they see the stop
         
         # Cancel background tasks
-        for task in [self._connection_task, self._heartbeat_task, self._message_handler_task]:
+        for task in [self._connection_task]:
             if task and not task.done():
                 task.cancel()
                 try:
@@ -214,17 +309,72 @@ class DataStream:
         if self._websocket and not self._websocket.closed:
             await self._websocket.close()
         
-        # Close session
-        if self._session and not self._session.closed:
-            await self._session.close()
+        # Released even if a connect attempt failed or reconnection gave up
+        await self._close_session()
         
         self._websocket = None
-        self._session = None
         
-        # Trigger disconnected event
-        await self._trigger_event(StreamEvent.DISCONNECTED, {'stream_id': self.stream_id})
+        # Trigger disconnected event (already sent if the connection was lost)
+        if was_connected:
+            await self._trigger_event(StreamEvent.DISCONNECTED, {'stream_id': self.stream_id})
+        
+        # Let scheduled async handlers (including the one above) finish
+        if self._handler_tasks:
+            await asyncio.gather(*self._handler_tasks, return_exceptions=True)
         
-        logger.info(f"Stream {self.stream_id} disconnected")
+        if was_connected:
+            logger.info("Stream %s disconnected", self.stream_id)
+    
+    async def _close_session(self):
+        """Close our HTTP session, or drop our reference to the shared one."""
+        session, self._session = self._session, None
+        if session is not None:
+            if self._uses_shared_session:
+                self._uses_shared_session = False
+                await self._release_shared_session()
+            elif not session.closed:
+                await session.close()
+    
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Create an HTTP session for WebSocket connections."""
+        timeout = aiohttp.ClientTimeout(total=30)
+        # No connection limit: every open stream holds one connection
+        connector = aiohttp.TCPConnector(limit=0, ttl_dns_cache=300)
+        return aiohttp.ClientSession(timeout=timeout, connector=connector)
+    
+    @staticmethod
+    def _get_session_lock() -> asyncio.Lock:
+        """Return the lock guarding the shared session, creating it lazily."""
+        if DataStream._session_lock is None:
+            DataStream._session_lock = asyncio.Lock()
+        return DataStream._session_lock
+    
+    async def _acquire_shared_session(self) -> aiohttp.ClientSession:
+        """
+        Get the process-wide HTTP session and take a reference to it.
+        
+        Returns:
+            aiohttp.ClientSession: Shared HTTP session
+        """
+        cls = DataStream
+        async with self._get_session_lock():
+            if cls._shared_session is None or cls._shared_session.closed:
+                cls._shared_session = self._create_session()
+                cls._session_refcount = 0
+            cls._session_refcount += 1
+            return cls._shared_session
+    
+    async def _release_shared_session(self) -> None:
+        """Drop a reference to the shared session, closing it on last release."""
+        cls = DataStream
+        async with self._get_session_lock():
+            cls._session_refcount -= 1
+            if cls._session_refcount <= 0:
+                cls._session_refcount = 0
+                if cls._shared_session is not None:
+                    await cls._shared_session.close()
+                    cls._shared_session = None
     
     async def subscribe(
         self,
@@ -268,24 +418,26 @@ class DataStream:
                 'id': int(time.time() * 1000)
             }
             
-            # Send subscription message
-            await self._send_message(subscription_msg)
+            # Serialize once; the payload is replayed as-is on reconnect
+            payload = _json_dumps(subscription_msg)
+            await self._send_raw(payload)
             
             # Store subscription info
-            subscription_key = f"{subscription_type}_{'-'.join(symbols)}"
+            subscription_key = (subscription_type, tuple(symbols))
             self._subscriptions[subscription_key] = {
                 'type': subscription_type,
                 'symbols': symbols,
                 'streams': streams,
                 'timestamp': datetime.now(timezone.utc),
+                'payload': payload,
                 **kwargs
             }
             
-            logger.info(f"Subscribed to {subscription_type} for {symbols}")
+            logger.info("Subscribed to %s for %s", subscription_type, symbols)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to subscribe to {subscription_type}: {e}")
+            logger.error("Failed to subscribe to %s: %s", subscription_type, e)
             return False
     
     async def unsubscribe(
@@ -311,12 +463,12 @@ class DataStream:
         
         try:
             # Find subscription
-            subscription_key = f"{subscription_type}_{'-'.join(symbols)}"
-            if subscription_key not in self._subscriptions:
-                logger.warning(f"Subscription not found: {subscription_key}")
+            subscription_key = (subscription_type, tuple(symbols))
+            subscription = self._subscriptions.get(subscription_key)
+            if subscription is None:
+                logger.warning("Subscription not found: %s", subscription_key)
                 return False
             
-            subscription = self._subscriptions[subscription_key]
             streams = subscription['streams']
             
             unsubscribe_msg = {
@@ -329,37 +481,57 @@ class DataStream:
             await self._send_message(unsubscribe_msg)
             
             # Remove subscription
-            del self._subscriptions[subscription_key]
+            self._subscriptions.pop(subscription_key, None)
             
-            logger.info(f"Unsubscribed from {subscription_type} for {symbols}")
+            logger.info("Unsubscribed from %s for %s", subscription_type, symbols)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to unsubscribe from {subscription_type}: {e}")
+            logger.error("Failed to unsubscribe from %s: %s", subscription_type, e)
             return False
     
     async def get_messages(self) -> AsyncIterator[StreamMessage]:
         """
         Get stream messages as async iterator.
         
+        Waits only when the queue is empty; messages already buffered are
+        drained without further awaiting. Stops as soon as the stream stops.
+        
         Yields:
             StreamMessage: Stream messages with parsed data
         """
+        buffer = self._message_buffer
+        message_event = self._message_event
         while self._running:
-            try:
-                # Get message from queue with timeout
-                message = await asyncio.wait_for(
-                    self._message_queue.get(),
-                    timeout=1.0
-                )
-                yield message
-                
-            except asyncio.TimeoutError:
-                # No message received, continue
+            if not buffer:
+                # Sleep until the producer appends (or the stream stops)
+                message_event.clear()
+                await message_event.wait()
                 continue
-            except Exception as e:
-                logger.error(f"Error getting message: {e}")
-                break
+            
+            yield buffer.popleft()
+    
+    async def get_messages_batched(self, max_batch: int = 64) -> AsyncIterator[List[StreamMessage]]:
+        """
+        Get stream messages in batches of whatever is already buffered.
+        
+        Args:
+            max_batch (int): Maximum messages per batch
+            
+        Yields:
+            List[StreamMessage]: Non-empty batch of stream messages
+        """
+        max_batch = max(1, max_batch)
+        buffer = self._message_buffer
+        message_event = self._message_event
+        while self._running:
+            if not buffer:
+                # Sleep until the producer appends (or the stream stops)
+                message_event.clear()
+                await message_event.wait()
+                continue
+            
+            yield [buffer.popleft() for _ in range(min(max_batch, len(buffer)))]
     
     def add_event_handler(
         self,
@@ -373,7 +545,10 @@ class DataStream:
             event (StreamEvent): Event type to handle
             handler (Callable): Event handler function
         """
-        self._event_handlers[event].append(handler)
+        if asyncio.iscoroutinefunction(handler):
+            self._async_handlers[event].append(handler)
+        else:
+            self._sync_handlers[event].append(handler)
     
     def remove_event_handler(
         self,
@@ -387,8 +562,9 @@ class DataStream:
             event (StreamEvent): Event type
             handler (Callable): Handler to remove
         """
-        if handler in self._event_handlers[event]:
-            self._event_handlers[event].remove(handler)
+        for handlers in (self._sync_handlers[event], self._async_handlers[event]):
+            if handler in handlers:
+                handlers.remove(handler)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -397,117 +573,141 @@ class DataStream:
         Returns:
             Dict[str, Any]: Stream statistics
         """
-        uptime = None
-        if self._stats['uptime_start']:
-            uptime = (datetime.now(timezone.utc) - self._stats['uptime_start']).total_seconds()
-        
-        return {
-            'stream_id': self.stream_id,
-            'connected': self._connected,
-            'running': self._running,
-            'subscriptions': len(self._subscriptions),
-            'queue_size': self._message_queue.qsize(),
-            'uptime_seconds': uptime,
-            **self._stats
-        }
+        stats = self._stats.copy()
+        
+        # Stored as epoch nanoseconds; reported as a datetime
+        if stats['last_heartbeat'] is not None:
+            stats['last_heartbeat'] = datetime.fromtimestamp(stats['last_heartbeat'] / 1e9, timezone.utc)
+        
+        stats['stream_id'] = self.stream_id
+        stats['connected'] = self._connected
+        stats['running'] = self._running
+        stats['subscriptions'] = len(self._subscriptions)
+        stats['queue_size'] = len(self._message_buffer)
+        stats['uptime_seconds'] = (
+            time.monotonic() - self._uptime_monotonic_start
+            if self._uptime_monotonic_start is not None else None
+        )
+        return stats
     
     async def _connection_handler(self):
         """Handle WebSocket connection and messages."""
+        websocket = self._websocket
+        receive = websocket.receive
+        TEXT, BINARY = aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY
         try:
-            while self._running and self._websocket:
-                async for msg in self._websocket:
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        await self._process_message(msg.data)
-                    elif msg.type == aiohttp.WSMsgType.ERROR:
-                        logger.error(f"WebSocket error: {self._websocket.exception()}")
-                        break
-                    elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING):
-                        logger.info("WebSocket connection closed")
-                        break
+            # Plain receive() loop: data frames are parsed and queued inline,
+            # without a coroutine per message unless someone is listening
+            while self._running:
+                msg = await receive()
+                msg_type = msg.type
+                if msg_type is TEXT or msg_type is BINARY:
+                    stream_message = self._enqueue_message(msg.data)
+                    if stream_message is not None and self._has_listeners(StreamEvent.DATA_RECEIVED):
+                        await self._trigger_event(
+                            StreamEvent.DATA_RECEIVED, self._data_received_payload(stream_message)
+                        )
+                elif msg_type == aiohttp.WSMsgType.PING:
+                    await websocket.pong(msg.data)
+                elif msg_type == aiohttp.WSMsgType.PONG:
+                    await self._record_heartbeat()
+                elif msg_type == aiohttp.WSMsgType.ERROR:
+                    logger.error("WebSocket error: %s", websocket.exception())
+                    break
+                elif msg_type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
+                    logger.info("WebSocket connection closed")
+                    break
         except Exception as e:
-            logger.error(f"Connection handler error: {e}")
+            logger.error("Connection handler error: %s", e)
         
         if self._running:
             # Connection lost, attempt reconnection
             await self._handle_disconnection()
     
-    async def _heartbeat_handler(self):
-        """Handle periodic heartbeat/ping."""
-        try:
-            while self._running and self._connected:
-                await asyncio.sleep(self.config.ping_interval)
-                
-                if self._websocket and not self._websocket.closed:
-                    try:
-                        await self._websocket.ping()
-                        self._stats['last_heartbeat'] = datetime.now(timezone.utc)
-                        await self._trigger_event(StreamEvent.HEARTBEAT, {
-                            'timestamp': self._stats['last_heartbeat']
-                        })
-                    except Exception as e:
-                        logger.warning(f"Heartbeat failed: {e}")
-                        break
-        except Exception as e:
-            logger.error(f"Heartbeat handler error: {e}")
-    
-    async def _message_handler(self):
-        """Process queued messages."""
-        try:
-            while self._running:
-                # This task processes messages from the queue
-                # In this implementation, messages are processed directly
-                # in _process_message, but this could be used for batching
-                # or additional processing
-                await asyncio.sleep(0.1)
-        except Exception as e:
-            logger.error(f"Message handler error: {e}")
+    async def _record_heartbeat(self):
+        """Record a PONG answering aiohttp's keepalive PING."""
+        self._stats['last_heartbeat'] = time.time_ns()
+        if self._has_listeners(StreamEvent.HEARTBEAT):
+            await self._trigger_event(StreamEvent.HEARTBEAT, {
+                'timestamp': datetime.fromtimestamp(
+                    self._stats['last_heartbeat'] / 1e9, timezone.utc
+                )
+            })
     
-    async def _process_message(self, message_data: str):
-        """Process incoming WebSocket message."""
+    def _enqueue_message(self, message_data: Union[str, bytes]) -> Optional[StreamMessage]:
+        """
+        Parse a WebSocket data frame and add it to the message buffer.
+        
+        Args:
+            message_data (Union[str, bytes]): Text or binary frame payload
+            
+        Returns:
+            Optional[StreamMessage]: Parsed message, or None if it could not be parsed
+        """
         try:
-            # Parse JSON message
-            raw_message = json.loads(message_data)
+            # Parse JSON message (text or binary frame)
+            raw_message = _json_loads(message_data)
             self._stats['messages_received'] += 1
             
-            # Create stream message
+            # Positional construction; field order matches StreamMessage
             stream_message = StreamMessage(
-                data=raw_message,
-                timestamp=datetime.now(timezone.utc),
-                stream_id=self.stream_id,
-                message_type=self._determine_message_type(raw_message),
-                raw_message=raw_message
+                raw_message,
+                time.time_ns(),
+                self.stream_id,
+                self._determine_message_type(raw_message)
             )
             
             # Add to queue (non-blocking)
-            try:
-                self._message_queue.put_nowait(stream_message)
-            except asyncio.QueueFull:
-                logger.warning("Message queue full, dropping message")
+            # buffer_size <= 0 means unbounded, as with asyncio.Queue
+            if self.config.buffer_size <= 0 or len(self._message_buffer) < self.config.buffer_size:
+                self._message_buffer.append(stream_message)
+                self._message_event.set()
+            else:
+                # Count drops; log a summary at most every DROP_LOG_INTERVAL
+                # seconds rather than per message while overloaded
+                self._stats['messages_dropped'] += 1
+                now = time.monotonic()
+                if now - self._last_drop_log >= DROP_LOG_INTERVAL:
+                    self._last_drop_log = now
+                    logger.warning(
+                        "Message queue full, %d messages dropped so far", self._stats['messages_dropped']
+                    )
             
-            # Trigger data received event
-            await self._trigger_event(StreamEvent.DATA_RECEIVED, {
-                'message_type': stream_message.message_type,
-                'timestamp': stream_message.timestamp
-            })
+            return stream_message
             
         except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse message: {e}")
+            logger.warning("Failed to parse message: %s", e)
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            logger.error("Error processing message: %s", e)
+        return None
+    
+    @staticmethod
+    def _data_received_payload(stream_message: StreamMessage) -> Dict[str, Any]:
+        """Event data for DATA_RECEIVED."""
+        return {
+            'message_type': stream_message.message_type,
+            'timestamp': stream_message.timestamp
+        }
     
     def _determine_message_type(self, message: Dict[str, Any]) -> str:
         """Determine message type from raw message."""
-        # Binance WebSocket message format detection
-        if 'stream' in message:
-            stream_name = message['stream']
-            if '@kline_' in stream_name:
-                return 'kline'
-            elif '@ticker' in stream_name:
-                return 'ticker'
-            elif '@depth' in stream_name:
-                return 'depth'
-            elif '@trade' in stream_name:
-                return 'trade'
+        # Binance WebSocket message format detection. Streams repeat, so the
+        # type is resolved once per stream name and memoized.
+        stream_name = message.get('stream')
+        if stream_name is not None:
+            cache = self._stream_type_cache
+            try:
+                message_type = cache[stream_name]
+            except KeyError:
+                message_type = next(
+                    (t for marker, t in _STREAM_TYPE_MARKERS if marker in stream_name),
+                    None
+                )
+                if len(cache) >= STREAM_TYPE_CACHE_SIZE:
+                    cache.clear()
+                cache[stream_name] = message_type
+            if message_type is not None:
+                return message_type
         
         if 'result' in message or 'id' in message:
             return 'response'
@@ -516,11 +716,14 @@ class DataStream:
     
     async def _send_message(self, message: Dict[str, Any]):
         """Send message to WebSocket."""
+        await self._send_raw(_json_dumps(message))
+    
+    async def _send_raw(self, payload: str):
+        """Send an already serialized JSON message to WebSocket."""
         if not self._websocket or self._websocket.closed:
             raise ConnectionError("WebSocket not connected")
         
-        message_str = json.dumps(message)
-        await self._websocket.send_str(message_str)
+        await self._websocket.send_str(payload)
         self._stats['messages_sent'] += 1
     
     async def _handle_disconnection(self):
@@ -534,8 +737,9 @@ class DataStream:
         if self._reconnect_count < self.config.reconnect_attempts:
             await self._attempt_reconnection()
         else:
-            logger.error(f"Max reconnection attempts reached for stream {self.stream_id}")
+            logger.error("Max reconnection attempts reached for stream %s", self.stream_id)
             self._running = False
+            self._message_event.set()
     
     async def _attempt_reconnection(self):
         """Attempt to reconnect with exponential backoff."""
@@ -547,8 +751,8 @@ class DataStream:
             self.config.max_reconnect_delay
         )
         
-        logger.info(f"Attempting reconnection {self._reconnect_count}/{self.config.reconnect_attempts} "
-                   f"for stream {self.stream_id} in {delay:.1f}s")
+        logger.info("Attempting reconnection %d/%d for stream %s in %.1fs",
+                    self._reconnect_count, self.config.reconnect_attempts, self.stream_id, delay)
         
         await self._trigger_event(StreamEvent.RECONNECTING, {
             'attempt': self._reconnect_count,
@@ -565,30 +769,45 @@ class DataStream:
     
     async def _restore_subscriptions(self):
         """Restore subscriptions after reconnection."""
-        logger.info(f"Restoring {len(self._subscriptions)} subscriptions")
+        logger.info("Restoring %s subscriptions", len(self._subscriptions))
         
         for subscription_key, subscription in self._subscriptions.copy().items():
             try:
-                await self.subscribe(
-                    subscription['type'],
-                    subscription['symbols'],
-                    **{k: v for k, v in subscription.items() 
-                       if k not in ['type', 'symbols', 'streams', 'timestamp']}
-                )
+                # Replay the stored SUBSCRIBE payload; nothing to rebuild
+                await self._send_raw(subscription['payload'])
             except Exception as e:
-                logger.error(f"Failed to restore subscription {subscription_key}: {e}")
+                logger.error("Failed to restore subscription %s: %s", subscription_key, e)
+    
+    def _has_listeners(self, event: StreamEvent) -> bool:
+        """Whether any handler is registered for event; gate payload construction on it."""
+        return bool(self._sync_handlers[event] or self._async_handlers[event])
     
     async def _trigger_event(self, event: StreamEvent, data: Dict[str, Any]):
-        """Trigger event handlers."""
-        handlers = self._event_handlers.get(event, [])
-        for handler in handlers:
+        """
+        Trigger event handlers.
+        
+        Sync handlers run inline, in order. Async handlers are scheduled as
+        tasks rather than awaited, so a slow handler never stalls reading
+        from the WebSocket; disconnect() waits for any still running.
+        """
+        for handler in self._sync_handlers[event]:
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(data)
-                else:
-                    handler(data)
+                handler(data)
             except Exception as e:
-                logger.error(f"Error in event handler for {event}: {e}")
+                logger.error("Error in event handler for %s: %s", event, e)
+        
+        for handler in self._async_handlers[event]:
+            task = asyncio.create_task(self._run_async_handler(handler, event, data))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+    
+    @staticmethod
+    async def _run_async_handler(handler: Callable, event: StreamEvent, data: Dict[str, Any]):
+        """Run one async event handler, logging instead of raising errors."""
+        try:
+            await handler(data)
+        except Exception as e:
+            logger.error("Error in event handler for %s: %s", event, e)
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -0,0 +1,279 @@
+"""
+Test Cache Manager
+
+Unit tests for the in-memory cache and its persistent append-only log:
+round-trips across restarts, tombstones, truncation, expiry and recovery.
+"""
+
+import time
+
+import pytest
+
+from ..models import Candle
+from ..storage.cache_manager import (
+    CacheManager, PERSIST_LOG_NAME, PERSIST_LOG_MAGIC, cached
+)
+
+
+@pytest.fixture
+def open_cache(tmp_path):
+    """Factory for persistent managers on tmp_path, closed after the test."""
+    managers = []
+    
+    def factory(**kwargs):
+        manager = CacheManager(persistent=True, cache_dir=str(tmp_path), **kwargs)
+        managers.append(manager)
+        return manager
+    
+    yield factory
+    for manager in managers:
+        manager.close()
+
+
+def reopen(cache, open_cache, **kwargs):
+    """Flush and close cache, then open a new manager on the same directory."""
+    cache.flush()
+    cache.close()
+    return open_cache(**kwargs)
+
+
+class TestPersistentCache:
+    """Test cases for the persistent cache log."""
+    
+    def test_round_trip_across_reopen(self, open_cache):
+        """Test values written before close are read back after reopen."""
+        candle = Candle(
+            timestamp=1640995200000,
+            symbol="BTCUSDT",
+            interval="1h",
+            open=47000.0,
+            high=47500.0,
+            low=46500.0,
+            close=47200.0,
+            volume=1000.0
+        )
+        cache = open_cache()
+        cache.put("candle", candle)
+        cache.put("levels", [1, 2, 3])
+        
+        cache = reopen(cache, open_cache)
+        
+        assert cache.get("candle") == candle
+        assert cache.get("levels") == [1, 2, 3]
+    
+    def test_invalidate_survives_reopen(self, open_cache):
+        """Test tombstones hide values from in-memory and disk-only keys."""
+        cache = open_cache()
+        cache.put("memory", 1)
+        cache.put("disk", 2)
+        cache.put("kept", 3)
+        cache = reopen(cache, open_cache)
+        
+        # "memory" is decoded into memory first; "disk" is only on disk
+        assert cache.get("memory") == 1
+        assert cache.invalidate("memory") is True
+        assert cache.invalidate("disk") is True
+        assert cache.invalidate("missing") is False
+        
+        cache = reopen(cache, open_cache)
+        
+        assert cache.get("memory") is None
+        assert cache.get("disk") is None
+        assert cache.get("kept") == 3
+    
+    def test_clear_truncates_log(self, open_cache, tmp_path):
+        """Test clear() empties memory and truncates the log to its header."""
+        cache = open_cache()
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.clear()
+        cache.flush()
+        
+        assert cache.get("a") is None
+        assert (tmp_path / PERSIST_LOG_NAME).read_bytes() == PERSIST_LOG_MAGIC
+        
+        cache.put("c", 3)
+        cache = reopen(cache, open_cache)
+        
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+    
+    def test_expired_records_dropped_on_load(self, open_cache, tmp_path):
+        """Test expired records are skipped and compacted away on startup."""
+        cache = open_cache()
+        cache.put("short", 1, ttl=0.05)
+        cache.put("long", 2, ttl=60.0)
+        cache.flush()
+        cache.close()
+        size_before = (tmp_path / PERSIST_LOG_NAME).stat().st_size
+        time.sleep(0.1)
+        
+        cache = open_cache()
+        
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        assert (tmp_path / PERSIST_LOG_NAME).stat().st_size < size_before
+    
+    def test_truncated_tail_discarded(self, open_cache, tmp_path):
+        """Test a partially written last record is dropped on startup."""
+        cache = open_cache()
+        cache.put("complete", 1)
+        cache.put("partial", 2)
+        cache.flush()
+        cache.close()
+        
+        log_path = tmp_path / PERSIST_LOG_NAME
+        data = log_path.read_bytes()
+        log_path.write_bytes(data[:-3])
+        
+        cache = open_cache()
+        
+        assert cache.get("complete") == 1
+        assert cache.get("partial") is None
+        
+        # The log was rewritten without the torn record, so new appends
+        # are readable after another restart
+        cache.put("after", 3)
+        cache = reopen(cache, open_cache)
+        
+        assert cache.get("complete") == 1
+        assert cache.get("after") == 3
+    
+    def test_evicted_key_reloaded_from_disk(self, open_cache):
+        """Test LRU-evicted entries are decoded again from the log."""
+        cache = open_cache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        cache.flush()
+        
+        assert "a" not in cache._cache
+        assert cache.get("a") == 1
+        assert "a" in cache._cache
+        assert cache.get_stats()['size'] == 2
+    
+    def test_use_after_close_does_not_block(self, open_cache):
+        """Test a closed manager keeps caching in memory without persisting."""
+        cache = open_cache()
+        cache.put("a", 1)
+        cache.close()
+        
+        # More puts than the writer queue holds; none may wait on it
+        for i in range(1100):
+            cache.put(f"k{i}", i)
+        cache.put("a", 2)
+        cache.flush()
+        assert cache.invalidate("a") is True
+        cache.clear()
+        cache.close()
+        
+        assert cache.get("k1099") is None
+        cache.put("b", 3)
+        assert cache.get("b") == 3
+        
+        # Nothing after close reached the log
+        cache = open_cache()
+        assert cache.get("a") == 1
+        assert cache.get("k0") is None
+
+
+class TestCacheManager:
+    """Test cases for the in-memory cache."""
+    
+    def test_get_returns_value_put_concurrently(self):
+        """Test a put landing between the lock-free miss and the locked re-check is a hit."""
+        cache = CacheManager()
+        real_lock = cache._lock
+        
+        class RacingLock:
+            """Lock whose acquisition is preceded by another thread's put."""
+            
+            def __enter__(self):
+                cache._lock = real_lock
+                cache.put("key", "value")
+                return real_lock.__enter__()
+            
+            def __exit__(self, *exc_info):
+                return real_lock.__exit__(*exc_info)
+        
+        cache._lock = RacingLock()
+        
+        assert cache.get("key") == "value"
+        stats = cache.get_stats()
+        assert stats['total_hits'] == 1
+        assert stats['total_misses'] == 0
+
+
+class TestCachedDecorator:
+    """Test cases for the @cached decorator keys."""
+    
+    def test_equal_values_of_different_types_cached_separately(self):
+        """Test f(1), f(True) and f(1.0) do not share an entry."""
+        cache = CacheManager()
+        
+        @cached(cache)
+        def describe(value):
+            return type(value).__name__
+        
+        assert describe(1) == "int"
+        assert describe(True) == "bool"
+        assert describe(1.0) == "float"
+        assert describe(1) == "int"
+        assert cache.get_stats()['size'] == 3
+    
+    def test_unhashable_arguments_use_digest_key(self):
+        """Test unhashable arguments fall back to the string digest key."""
+        cache = CacheManager()
+        calls = []
+        
+        @cached(cache, key_prefix="sum")
+        def total(values, scale=1):
+            calls.append(values)
+            return sum(values) * scale
+        
+        assert total([1, 2, 3]) == 6
+        assert total([1, 2, 3]) == 6
+        assert total([1, 2, 3], scale=2) == 12
+        assert len(calls) == 2
+        
+        keys = list(cache._cache)
+        assert len(keys) == 2
+        assert all(isinstance(key, str) and key.startswith("sum_") for key in keys)
+    
+    def test_hashable_arguments_use_tuple_key(self):
+        """Test hashable arguments are cached under a tuple key."""
+        cache = CacheManager()
+        
+        @cached(cache)
+        def double(value):
+            return value * 2
+        
+        assert double(21) == 42
+        assert isinstance(next(iter(cache._cache)), tuple)
+    
+    def test_persistent_manager_uses_string_keys(self, open_cache):
+        """Test persistent managers always get string keys, even for hashable arguments."""
+        cache = open_cache()
+        calls = []
+        
+        @cached(cache)
+        def double(value):
+            calls.append(value)
+            return value * 2
+        
+        assert double(21) == 42
+        assert double(21) == 42
+        assert calls == [21]
+        assert all(isinstance(key, str) for key in cache._cache)
+        
+        # String keys round-trip through the log
+        cache = reopen(cache, open_cache)
+        
+        @cached(cache)
+        def double(value):
+            calls.append(value)
+            return value * 2
+        
+        assert double(21) == 42
+        assert calls == [21]
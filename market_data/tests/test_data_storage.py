@@ -0,0 +1,56 @@
+"""
+Test Data Storage
+
+Unit tests for candle storage round-trips across file formats.
+"""
+
+import pandas as pd
+import pytest
+
+from ..models import Candle
+from ..storage.data_storage import DataStorage, StorageConfig
+
+
+def mixed_candles():
+    """Two candles with different symbols and intervals."""
+    return [
+        Candle(
+            timestamp=1640995200000,
+            symbol="BTCUSDT",
+            interval="1h",
+            open=47000.0,
+            high=47500.0,
+            low=46500.0,
+            close=47200.0,
+            volume=1000.0
+        ),
+        Candle(
+            timestamp=1640998800000,
+            symbol="ETHUSDT",
+            interval="4h",
+            open=3700.0,
+            high=3750.0,
+            low=3650.0,
+            close=3720.0,
+            volume=500.0
+        )
+    ]
+
+
+class TestDataStorage:
+    """Test cases for DataStorage."""
+    
+    @pytest.mark.parametrize("file_format", ["parquet", "csv"])
+    def test_store_mixed_candle_list_keeps_row_labels(self, tmp_path, file_format):
+        """Test a list mixing symbols/intervals is stored with per-row labels."""
+        if file_format == "parquet":
+            pytest.importorskip("pyarrow")
+        storage = DataStorage(StorageConfig(base_path=str(tmp_path), format=file_format))
+        candles = mixed_candles()
+        
+        path = storage.store_candles(candles)
+        
+        df = pd.read_parquet(path) if file_format == "parquet" else pd.read_csv(path)
+        assert df['symbol'].tolist() == ["BTCUSDT", "ETHUSDT"]
+        assert df['interval'].tolist() == ["1h", "4h"]
+        assert "candles_BTCUSDT_1h_" in path
@@ -0,0 +1,212 @@
+"""
+Test Data Stream
+
+Integration tests for DataStream against a local aiohttp WebSocket server:
+connection, subscription, buffering, shared sessions and shutdown.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+
+from ..streaming.data_stream import DataStream, StreamConfig, StreamEvent
+
+
+def kline_message(index: int) -> str:
+    """Combined-stream kline frame as sent by Binance."""
+    return json.dumps({
+        'stream': 'btcusdt@kline_1m',
+        'data': {'e': 'kline', 's': 'BTCUSDT', 'k': {'t': index}}
+    })
+
+
+@asynccontextmanager
+async def websocket_server(on_subscribe_messages: int = 1, close_after_send: bool = False):
+    """
+    Serve a WebSocket on localhost that answers each SUBSCRIBE with klines.
+    
+    Yields:
+        str: Base URL of the server (the WebSocket lives at /ws)
+    """
+    async def handle(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            request_data = json.loads(msg.data)
+            if request_data.get('method') == 'SUBSCRIBE':
+                await ws.send_str(json.dumps({'result': None, 'id': request_data['id']}))
+                for i in range(on_subscribe_messages):
+                    await ws.send_str(kline_message(i))
+                if close_after_send:
+                    await ws.close()
+        return ws
+    
+    app = web.Application()
+    app.router.add_get('/ws', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    """Poll condition until it holds or timeout expires."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+class TestDataStream:
+    """Test cases for DataStream."""
+    
+    @pytest.mark.asyncio
+    async def test_connect_subscribe_receive(self):
+        """Test a stream connects, subscribes and yields parsed messages."""
+        async with websocket_server(on_subscribe_messages=3) as base_url:
+            stream = DataStream(StreamConfig(url=f"{base_url}/ws"), stream_id="test")
+            assert await stream.connect() is True
+            assert await stream.subscribe('kline', ['BTCUSDT'], interval='1m') is True
+            
+            messages = []
+            async for message in stream.get_messages():
+                messages.append(message)
+                if len(messages) == 4:
+                    break
+            
+            assert messages[0].message_type == 'response'
+            assert [m.message_type for m in messages[1:]] == ['kline'] * 3
+            assert messages[1].data['data']['k']['t'] == 0
+            assert messages[1].stream_id == "test"
+            
+            stats = stream.get_stats()
+            assert stats['messages_received'] == 4
+            assert stats['messages_sent'] == 1
+            assert stats['subscriptions'] == 1
+            
+            await stream.disconnect()
+            assert stream.get_stats()['connected'] is False
+    
+    @pytest.mark.asyncio
+    async def test_messages_dropped_when_buffer_full(self):
+        """Test frames beyond buffer_size are counted as dropped, not queued."""
+        async with websocket_server(on_subscribe_messages=9) as base_url:
+            stream = DataStream(StreamConfig(url=f"{base_url}/ws", buffer_size=4))
+            await stream.connect()
+            await stream.subscribe('kline', ['BTCUSDT'])
+            
+            # One subscription response plus nine klines
+            await wait_for(lambda: stream.get_stats()['messages_received'] == 10)
+            
+            stats = stream.get_stats()
+            assert stats['queue_size'] == 4
+            assert stats['messages_dropped'] == 6
+            
+            await stream.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_shared_session_released_after_disconnect(self):
+        """Test the shared session refcount returns to zero once streams disconnect."""
+        async with websocket_server() as base_url:
+            first = DataStream(StreamConfig(url=f"{base_url}/ws"))
+            second = DataStream(StreamConfig(url=f"{base_url}/ws"))
+            await first.connect()
+            await second.connect()
+            
+            assert DataStream._session_refcount == 2
+            shared = DataStream._shared_session
+            assert first._session is shared and second._session is shared
+            
+            await first.disconnect()
+            assert DataStream._session_refcount == 1
+            assert not shared.closed
+            
+            await second.disconnect()
+            assert DataStream._session_refcount == 0
+            assert DataStream._shared_session is None
+            assert shared.closed
+    
+    @pytest.mark.asyncio
+    async def test_shared_session_released_after_failed_connect(self):
+        """Test a failed connect does not keep a reference to the shared session."""
+        async with websocket_server() as base_url:
+            errors = []
+            stream = DataStream(StreamConfig(url=f"{base_url}/missing"))
+            stream.add_event_handler(StreamEvent.ERROR, errors.append)
+            
+            assert await stream.connect() is False
+            
+            assert len(errors) == 1
+            assert DataStream._session_refcount == 0
+            assert DataStream._shared_session is None
+            assert stream._session is None
+            
+            await stream.disconnect()
+            assert DataStream._session_refcount == 0
+    
+    @pytest.mark.asyncio
+    async def test_disconnect_awaits_async_handlers(self):
+        """Test disconnect() waits for scheduled async event handlers."""
+        finished = []
+        
+        async def slow_handler(data):
+            await asyncio.sleep(0.05)
+            finished.append(data['stream_id'])
+        
+        async with websocket_server() as base_url:
+            stream = DataStream(StreamConfig(url=f"{base_url}/ws"), stream_id="handlers")
+            stream.add_event_handler(StreamEvent.CONNECTED, slow_handler)
+            stream.add_event_handler(StreamEvent.DISCONNECTED, slow_handler)
+            await stream.connect()
+            
+            await stream.disconnect()
+            
+            assert finished == ["handlers", "handlers"]
+            assert not stream._handler_tasks
+    
+    @pytest.mark.asyncio
+    async def test_get_messages_stops_on_disconnect(self):
+        """Test a consumer waiting on an empty buffer exits when the stream stops."""
+        async with websocket_server() as base_url:
+            stream = DataStream(StreamConfig(url=f"{base_url}/ws"))
+            await stream.connect()
+            
+            async def consume():
+                return [message async for message in stream.get_messages()]
+            
+            consumer = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            assert not consumer.done()
+            
+            await stream.disconnect()
+            
+            assert await asyncio.wait_for(consumer, timeout=1.0) == []
+    
+    @pytest.mark.asyncio
+    async def test_get_messages_stops_when_connection_lost(self):
+        """Test consumers exit once the server closes and reconnection is exhausted."""
+        async with websocket_server(on_subscribe_messages=2, close_after_send=True) as base_url:
+            stream = DataStream(StreamConfig(url=f"{base_url}/ws", reconnect_attempts=0))
+            await stream.connect()
+            await stream.subscribe('kline', ['BTCUSDT'])
+            
+            async def consume():
+                return [message async for message in stream.get_messages()]
+            
+            # The queued frames are not required to be drained after a stop
+            messages = await asyncio.wait_for(consume(), timeout=2.0)
+            
+            assert len(messages) <= 3
+            assert stream.get_stats()['running'] is False
+            
+            await stream.disconnect()
+            assert DataStream._session_refcount == 0
@@ -6,30 +6,101 @@ OrderBook, and Trade data structures with validation.
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime, timezone
 import json
 
 from ..models import (
-    Candle, Ticker, OrderBook, OrderBookLevel, Trade,
+    Candle, CandleBatch, Ticker, OrderBook, OrderBookLevel, Trade,
     MarketDataConfig, validate_candle, validate_ticker
 )
 
 
+# Decoded JSON form of the base_candle fixture
+EXPECTED_CANDLE_JSON = {
+    'timestamp': 1640995200000,
+    'symbol': "BTCUSDT",
+    'interval': "1h",
+    'open': 47000.0,
+    'high': 47500.0,
+    'low': 46500.0,
+    'close': 47200.0,
+    'volume': 1000.0,
+    'quote_volume': None,
+    'trade_count': None,
+    'taker_buy_volume': None,
+    'taker_buy_quote_volume': None,
+    'price_change': 200.0,
+    'price_change_percent': (200.0 / 47000.0) * 100
+}
+
+
+@pytest.fixture(scope="module")
+def base_candle():
+    """Shared candle for tests; derive variants with dataclasses.replace."""
+    return Candle(
+        timestamp=1640995200000,  # 2022-01-01 00:00:00 UTC
+        symbol="BTCUSDT",
+        interval="1h",
+        open=47000.0,
+        high=47500.0,
+        low=46500.0,
+        close=47200.0,
+        volume=1000.0
+    )
+
+
+@pytest.fixture(scope="module")
+def base_ticker():
+    """Shared ticker for tests; derive variants with dataclasses.replace."""
+    return Ticker(
+        timestamp=1640995200000,
+        symbol="BTCUSDT",
+        price=47200.0,
+        bid=47180.0,
+        ask=47220.0,
+        volume_24h=50000.0
+    )
+
+
+@pytest.fixture(scope="module")
+def base_trade():
+    """Shared trade for tests; derive variants with dataclasses.replace."""
+    return Trade(
+        timestamp=1640995200000,
+        symbol="BTCUSDT",
+        trade_id="12345",
+        price=47200.0,
+        quantity=1.5,
+        side="buy"
+    )
+
+
+@pytest.fixture(scope="module")
+def base_order_book():
+    """Shared three-level order book for tests."""
+    return OrderBook(
+        timestamp=1640995200000,
+        symbol="BTCUSDT",
+        bids=[
+            OrderBookLevel(47180.0, 1.5),
+            OrderBookLevel(47170.0, 2.0),
+            OrderBookLevel(47160.0, 1.8)
+        ],
+        asks=[
+            OrderBookLevel(47220.0, 1.2),
+            OrderBookLevel(47230.0, 2.5),
+            OrderBookLevel(47240.0, 1.7)
+        ]
+    )
+
+
 class TestCandle:
     """Test cases for Candle model."""
     
-    def test_candle_creation(self):
+    def test_candle_creation(self, base_candle):
         """Test basic candle creation."""
-        candle = Candle(
-            timestamp=1640995200000,  # 2022-01-01 00:00:00 UTC
-            symbol="BTCUSDT",
-            interval="1h",
-            open=47000.0,
-            high=47500.0,
-            low=46500.0,
-            close=47200.0,
-            volume=1000.0
-        )
+        candle = base_candle
         
         assert candle.symbol == "BTCUSDT"
         assert candle.interval == "1h"
@@ -39,18 +110,9 @@ class TestCandle:
         assert candle.close == 47200.0
         assert candle.volume == 1000.0
     
-    def test_candle_properties(self):
+    def test_candle_properties(self, base_candle):
         """Test candle calculated properties."""
-        candle = Candle(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            interval="1h",
-            open=47000.0,
-            high=47500.0,
-            low=46500.0,
-            close=47200.0,
-            volume=1000.0
-        )
+        candle = base_candle
         
         # Test datetime conversion
         expected_datetime = datetime.fromtimestamp(1640995200)
@@ -62,18 +124,9 @@ class TestCandle:
         assert candle.typical_price == (47500.0 + 46500.0 + 47200.0) / 3
         assert candle.weighted_price == (47500.0 + 46500.0 + 47200.0 * 2) / 4
     
-    def test_candle_to_dict(self):
+    def test_candle_to_dict(self, base_candle):
         """Test candle to dictionary conversion."""
-        candle = Candle(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            interval="1h",
-            open=47000.0,
-            high=47500.0,
-            low=46500.0,
-            close=47200.0,
-            volume=1000.0
-        )
+        candle = base_candle
         
         candle_dict = candle.to_dict()
         
@@ -101,54 +154,63 @@ class TestCandle:
         assert candle.open == 47000.0
         assert candle.close == 47200.0
     
-    def test_candle_json_serialization(self):
+    def test_candle_json_serialization(self, base_candle):
         """Test JSON serialization."""
-        candle = Candle(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            interval="1h",
-            open=47000.0,
-            high=47500.0,
-            low=46500.0,
-            close=47200.0,
-            volume=1000.0
-        )
+        assert json.loads(base_candle.to_json()) == EXPECTED_CANDLE_JSON
+
+
+class TestCandleBatch:
+    """Test cases for CandleBatch columnar model."""
+    
+    def test_round_trip_from_candles(self):
+        """Test gathering candles into columns and iterating back."""
+        candles = [
+            Candle(
+                timestamp=1640995200000 + i * 3600000,
+                symbol="BTCUSDT",
+                interval="1h",
+                open=47000.0 + i,
+                high=47500.0 + i,
+                low=46500.0 + i,
+                close=47200.0 + i,
+                volume=1000.0,
+                trade_count=10 if i else None
+            )
+            for i in range(3)
+        ]
         
-        json_str = candle.to_json()
-        data = json.loads(json_str)
+        batch = CandleBatch.from_candles(candles)
         
-        assert data['symbol'] == "BTCUSDT"
-        assert data['open'] == 47000.0
+        assert len(batch) == 3
+        assert batch.symbol == "BTCUSDT"
+        assert batch.close.tolist() == [47200.0, 47201.0, 47202.0]
+        assert list(batch) == candles
+        assert batch[1] == candles[1]
+        assert batch[0].quote_volume is None
+    
+    def test_from_candles_rejects_mixed_series(self, base_candle):
+        """Test candles of different symbols or intervals cannot share a batch."""
+        with pytest.raises(ValueError):
+            CandleBatch.from_candles([base_candle, replace(base_candle, symbol="ETHUSDT")])
+        with pytest.raises(ValueError):
+            CandleBatch.from_candles([base_candle, replace(base_candle, interval="4h")])
 
 
 class TestTicker:
     """Test cases for Ticker model."""
     
-    def test_ticker_creation(self):
+    def test_ticker_creation(self, base_ticker):
         """Test basic ticker creation."""
-        ticker = Ticker(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            price=47200.0,
-            bid=47180.0,
-            ask=47220.0,
-            volume_24h=50000.0
-        )
+        ticker = base_ticker
         
         assert ticker.symbol == "BTCUSDT"
         assert ticker.price == 47200.0
         assert ticker.bid == 47180.0
         assert ticker.ask == 47220.0
     
-    def test_ticker_properties(self):
+    def test_ticker_properties(self, base_ticker):
         """Test ticker calculated properties."""
-        ticker = Ticker(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            price=47200.0,
-            bid=47180.0,
-            ask=47220.0
-        )
+        ticker = base_ticker
         
         # Test spread calculations
         assert ticker.spread == 40.0  # 47220 - 47180
@@ -156,15 +218,9 @@ class TestTicker:
         expected_spread_percent = (40.0 / mid_price) * 100
         assert abs(ticker.spread_percent - expected_spread_percent) < 0.001
     
-    def test_ticker_to_dict(self):
+    def test_ticker_to_dict(self, base_ticker):
         """Test ticker to dictionary conversion."""
-        ticker = Ticker(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            price=47200.0,
-            bid=47180.0,
-            ask=47220.0
-        )
+        ticker = base_ticker
         
         ticker_dict = ticker.to_dict()
         
@@ -176,49 +232,17 @@ class TestTicker:
 class TestOrderBook:
     """Test cases for OrderBook model."""
     
-    def test_order_book_creation(self):
+    def test_order_book_creation(self, base_order_book):
         """Test basic order book creation."""
-        bids = [
-            OrderBookLevel(47180.0, 1.5),
-            OrderBookLevel(47170.0, 2.0),
-            OrderBookLevel(47160.0, 1.8)
-        ]
-        
-        asks = [
-            OrderBookLevel(47220.0, 1.2),
-            OrderBookLevel(47230.0, 2.5),
-            OrderBookLevel(47240.0, 1.7)
-        ]
-        
-        order_book = OrderBook(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            bids=bids,
-            asks=asks
-        )
+        order_book = base_order_book
         
         assert order_book.symbol == "BTCUSDT"
         assert len(order_book.bids) == 3
         assert len(order_book.asks) == 3
     
-    def test_order_book_properties(self):
+    def test_order_book_properties(self, base_order_book):
         """Test order book calculated properties."""
-        bids = [
-            OrderBookLevel(47180.0, 1.5),
-            OrderBookLevel(47170.0, 2.0)
-        ]
-        
-        asks = [
-            OrderBookLevel(47220.0, 1.2),
-            OrderBookLevel(47230.0, 2.5)
-        ]
-        
-        order_book = OrderBook(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            bids=bids,
-            asks=asks
-        )
+        order_book = base_order_book
         
         # Test best bid/ask
         assert order_book.best_bid.price == 47180.0
@@ -234,16 +258,12 @@ class TestOrderBook:
         assert bid_depth == 3.5  # 1.5 + 2.0
         assert ask_depth == 3.7  # 1.2 + 2.5
     
-    def test_order_book_imbalance(self):
+    def test_order_book_imbalance(self, base_order_book):
         """Test order book imbalance calculation."""
-        bids = [OrderBookLevel(47180.0, 3.0)]
-        asks = [OrderBookLevel(47220.0, 1.0)]
-        
-        order_book = OrderBook(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            bids=bids,
-            asks=asks
+        order_book = replace(
+            base_order_book,
+            bids=[OrderBookLevel(47180.0, 3.0)],
+            asks=[OrderBookLevel(47220.0, 1.0)]
         )
         
         imbalance = order_book.get_imbalance_ratio(1)
@@ -265,16 +285,9 @@ class TestOrderBookLevel:
 class TestTrade:
     """Test cases for Trade model."""
     
-    def test_trade_creation(self):
+    def test_trade_creation(self, base_trade):
         """Test basic trade creation."""
-        trade = Trade(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            trade_id="12345",
-            price=47200.0,
-            quantity=1.5,
-            side="buy"
-        )
+        trade = base_trade
         
         assert trade.symbol == "BTCUSDT"
         assert trade.trade_id == "12345"
@@ -282,16 +295,9 @@ class TestTrade:
         assert trade.quantity == 1.5
         assert trade.side == "buy"
     
-    def test_trade_properties(self):
+    def test_trade_properties(self, base_trade):
         """Test trade calculated properties."""
-        trade = Trade(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            trade_id="12345",
-            price=47200.0,
-            quantity=1.5,
-            side="buy"
-        )
+        trade = base_trade
         
         # Test datetime conversion
         expected_datetime = datetime.fromtimestamp(1640995200)
@@ -300,16 +306,9 @@ class TestTrade:
         # Test notional value
         assert trade.notional_value == 70800.0  # 47200 * 1.5
     
-    def test_trade_to_dict(self):
+    def test_trade_to_dict(self, base_trade):
         """Test trade to dictionary conversion."""
-        trade = Trade(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            trade_id="12345",
-            price=47200.0,
-            quantity=1.5,
-            side="buy"
-        )
+        trade = base_trade
         
         trade_dict = trade.to_dict()
         
@@ -359,99 +358,24 @@ class TestMarketDataConfig:
 class TestValidation:
     """Test cases for data validation functions."""
     
-    def test_validate_candle_valid(self):
-        """Test validation of valid candle."""
-        candle = Candle(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            interval="1h",
-            open=47000.0,
-            high=47500.0,
-            low=46500.0,
-            close=47200.0,
-            volume=1000.0
-        )
-        
-        assert validate_candle(candle) == True
+    @pytest.mark.parametrize("override,expected", [
+        ({}, True),
+        ({"high": 46000.0}, False),  # High < Open (invalid)
+        ({"open": -47000.0}, False),  # Negative price (invalid)
+        ({"volume": -1000.0}, False),  # Negative volume (invalid)
+    ], ids=["valid", "invalid_ohlc", "negative_price", "negative_volume"])
+    def test_validate_candle(self, base_candle, override, expected):
+        """Test candle validation against valid and invalid variants."""
+        assert validate_candle(replace(base_candle, **override)) is expected
     
-    def test_validate_candle_invalid_ohlc(self):
-        """Test validation of candle with invalid OHLC relationships."""
-        candle = Candle(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            interval="1h",
-            open=47000.0,
-            high=46000.0,  # High < Open (invalid)
-            low=46500.0,
-            close=47200.0,
-            volume=1000.0
-        )
-        
-        assert validate_candle(candle) == False
-    
-    def test_validate_candle_negative_price(self):
-        """Test validation of candle with negative prices."""
-        candle = Candle(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            interval="1h",
-            open=-47000.0,  # Negative price (invalid)
-            high=47500.0,
-            low=46500.0,
-            close=47200.0,
-            volume=1000.0
-        )
-        
-        assert validate_candle(candle) == False
-    
-    def test_validate_candle_negative_volume(self):
-        """Test validation of candle with negative volume."""
-        candle = Candle(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            interval="1h",
-            open=47000.0,
-            high=47500.0,
-            low=46500.0,
-            close=47200.0,
-            volume=-1000.0  # Negative volume (invalid)
-        )
-        
-        assert validate_candle(candle) == False
-    
-    def test_validate_ticker_valid(self):
-        """Test validation of valid ticker."""
-        ticker = Ticker(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            price=47200.0,
-            bid=47180.0,
-            ask=47220.0
-        )
-        
-        assert validate_ticker(ticker) == True
-    
-    def test_validate_ticker_invalid_spread(self):
-        """Test validation of ticker with invalid spread."""
-        ticker = Ticker(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            price=47200.0,
-            bid=47220.0,  # Bid > Ask (invalid)
-            ask=47180.0
-        )
-        
-        assert validate_ticker(ticker) == False
-    
-    def test_validate_ticker_negative_price(self):
-        """Test validation of ticker with negative price."""
-        ticker = Ticker(
-            timestamp=1640995200000,
-            symbol="BTCUSDT",
-            price=-47200.0  # Negative price (invalid)
-        )
-        
-        assert validate_ticker(ticker) == False
+    @pytest.mark.parametrize("override,expected", [
+        ({}, True),
+        ({"bid": 47220.0, "ask": 47180.0}, False),  # Bid > Ask (invalid)
+        ({"price": -47200.0, "bid": None, "ask": None}, False),  # Negative price (invalid)
+    ], ids=["valid", "invalid_spread", "negative_price"])
+    def test_validate_ticker(self, base_ticker, override, expected):
+        """Test ticker validation against valid and invalid variants."""
+        assert validate_ticker(replace(base_ticker, **override)) is expected
 
 
 if __name__ == "__main__":
@@ -7,12 +7,90 @@ BinanceRESTProvider and MockProvider functionality.
 
 import pytest
 import asyncio
+import json
+import time
 from datetime import datetime, timezone, timedelta
+from operator import attrgetter
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, AsyncMock
 
+import aiohttp
+from aiohttp import web
+
+from ..providers import binance_rest
 from ..providers.binance_rest import BinanceRESTProvider
 from ..providers.mock import MockProvider
-from ..models import MarketDataConfig, Candle, Ticker, OrderBook, Trade
+from ..providers.base import RateLimitError, SymbolNotFoundError
+from ..models import (
+    MarketDataConfig, Candle, Ticker, OrderBook, OrderBookLevel, Trade, CANDLE_DTYPE
+)
+
+
+# Mocked Binance REST payloads shared by the table-driven provider tests
+CANDLES_PAYLOAD = [
+    [
+        1640995200000,  # Open time
+        "47000.0",      # Open
+        "47500.0",      # High
+        "46500.0",      # Low
+        "47200.0",      # Close
+        "1000.0",       # Volume
+        1640998799999,  # Close time
+        "47200000.0",   # Quote volume
+        100,            # Trade count
+        "500.0",        # Taker buy base volume
+        "23600000.0"    # Taker buy quote volume
+    ]
+]
+
+TICKER_PAYLOAD = {
+    'symbol': 'BTCUSDT',
+    'lastPrice': '47200.0',
+    'bidPrice': '47180.0',
+    'askPrice': '47220.0',
+    'bidQty': '1.5',
+    'askQty': '2.0',
+    'volume': '50000.0',
+    'priceChange': '200.0',
+    'priceChangePercent': '0.42',
+    'highPrice': '47500.0',
+    'lowPrice': '46500.0',
+    'openPrice': '47000.0',
+    'quoteVolume': '2360000000.0',
+    'closeTime': 1640995200000
+}
+
+ORDER_BOOK_PAYLOAD = {
+    'lastUpdateId': 12345,
+    'bids': [
+        ['47180.0', '1.5'],
+        ['47170.0', '2.0']
+    ],
+    'asks': [
+        ['47220.0', '1.2'],
+        ['47230.0', '2.5']
+    ]
+}
+
+# (method, kwargs, payload, expected type, expected attribute values)
+REST_MOCK_CASES = [
+    ("get_historical_candles",
+     {"symbol": "BTCUSDT", "interval": "1h", "limit": 1},
+     CANDLES_PAYLOAD, Candle,
+     {"symbol": "BTCUSDT", "interval": "1h", "open": 47000.0, "high": 47500.0,
+      "low": 46500.0, "close": 47200.0, "volume": 1000.0}),
+    ("get_current_ticker",
+     {"symbol": "BTCUSDT"},
+     TICKER_PAYLOAD, Ticker,
+     {"symbol": "BTCUSDT", "price": 47200.0, "bid": 47180.0, "ask": 47220.0}),
+    ("get_order_book",
+     {"symbol": "BTCUSDT"},
+     ORDER_BOOK_PAYLOAD, OrderBook,
+     {"symbol": "BTCUSDT",
+      "bids": [OrderBookLevel(47180.0, 1.5), OrderBookLevel(47170.0, 2.0)],
+      "asks": [OrderBookLevel(47220.0, 1.2), OrderBookLevel(47230.0, 2.5)],
+      "best_bid.price": 47180.0}),
+]
 
 
 class TestBinanceRESTProvider:
@@ -25,7 +103,8 @@ class TestBinanceRESTProvider:
             base_url="https://testnet.binance.vision",
             testnet=True,
             requests_per_minute=100,
-            timeout_seconds=5
+            timeout_seconds=5,
+            exchange_info_ttl_seconds=0
         )
     
     @pytest.fixture
@@ -52,6 +131,44 @@ class TestBinanceRESTProvider:
         with pytest.raises(ValueError):
             provider._validate_symbol("BT")  # Too short
     
+    @pytest.mark.asyncio
+    async def test_symbol_validation_against_exchange_info(self, provider):
+        """Test that unlisted symbols are rejected once exchange info is loaded."""
+        with patch.object(provider, '_make_request') as mock_request:
+            mock_request.return_value = {
+                'symbols': [{'symbol': 'BTCUSDT', 'status': 'TRADING'}]
+            }
+            await provider._load_exchange_info()
+        
+        assert provider._validate_symbol("btcusdt") == "BTCUSDT"
+        with pytest.raises(SymbolNotFoundError):
+            provider._validate_symbol("FOOUSDT")
+    
+    @pytest.mark.asyncio
+    async def test_symbol_check_refreshes_disk_cached_exchange_info(self, provider):
+        """Test a symbol missing from disk-cached exchange info triggers one API refresh."""
+        cached_info = {'symbols': [{'symbol': 'BTCUSDT', 'status': 'TRADING'}]}
+        with patch.object(provider, '_read_cached_exchange_info', return_value=cached_info):
+            await provider._load_exchange_info()
+        
+        # The disk copy may predate a listing, so it is not trusted to reject
+        assert provider._validate_symbol("NEWUSDT") == "NEWUSDT"
+        
+        fresh_info = {'symbols': [
+            {'symbol': 'BTCUSDT', 'status': 'TRADING'},
+            {'symbol': 'NEWUSDT', 'status': 'TRADING'}
+        ]}
+        with patch.object(provider, '_make_request', AsyncMock(return_value=fresh_info)) as mock_request:
+            assert await provider._check_symbol("NEWUSDT") == "NEWUSDT"
+            assert await provider._check_symbol("BTCUSDT") == "BTCUSDT"
+            with pytest.raises(SymbolNotFoundError):
+                await provider._check_symbol("FOOUSDT")
+        
+        # Refreshed once, from the API; later misses are rejected locally
+        mock_request.assert_awaited_once()
+        with pytest.raises(SymbolNotFoundError):
+            provider._validate_symbol("FOOUSDT")
+    
     def test_interval_normalization(self, provider):
         """Test interval normalization."""
         assert provider.normalize_interval("1m") == "1m"
@@ -81,115 +198,236 @@ class TestBinanceRESTProvider:
             await provider.disconnect()
             assert provider._session is None
     
+    @pytest.mark.asyncio
+    async def test_shared_session(self, config):
+        """Test that providers can share one reference-counted session."""
+        config.share_session = True
+        first = BinanceRESTProvider(config)
+        second = BinanceRESTProvider(config)
+        
+        with patch.object(BinanceRESTProvider, '_load_exchange_info', AsyncMock()):
+            await first.connect()
+            await second.connect()
+        
+        assert first._session is second._session
+        shared = first._session
+        
+        await first.disconnect()
+        assert not shared.closed
+        
+        await second.disconnect()
+        assert shared.closed
+        assert BinanceRESTProvider._shared_session is None
+    
     @pytest.mark.asyncio
     async def test_rate_limiting(self, provider):
         """Test rate limiting functionality."""
         # Set very low rate limit for testing
         provider.config.requests_per_minute = 2
         
-        start_time = asyncio.get_event_loop().time()
-        
-        # Make multiple requests quickly
-        for _ in range(3):
-            await provider._check_rate_limit()
-            provider._update_rate_limit_counters()
-        
-        end_time = asyncio.get_event_loop().time()
-        
-        # Should have taken some time due to rate limiting
-        assert end_time - start_time > 0.5
+        # Virtual clock: sleeps advance it instead of blocking the test
+        clock = [1000.0]
+        
+        async def fake_sleep(delay):
+            clock[0] += delay
+        
+        fake_time = SimpleNamespace(monotonic=lambda: clock[0], time=time.time)
+        sleep = AsyncMock(side_effect=fake_sleep)
+        provider._request_window_start = clock[0]
+        
+        with patch.object(binance_rest, 'time', fake_time), \
+                patch.object(binance_rest.asyncio, 'sleep', sleep):
+            # Make multiple requests quickly
+            for _ in range(3):
+                await provider._check_rate_limit()
+                provider._update_rate_limit_counters()
+        
+        # Should have requested throttling delays within the 60s window
+        assert sleep.await_count >= 1
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert max(delays) == pytest.approx(60.0 / 2)
+        assert all(0 < delay <= 60 for delay in delays)
+        assert clock[0] - 1000.0 >= 60.0
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_response_retried(self, provider):
+        """Test that a 429 response is retried after Retry-After."""
+        def make_response(status):
+            response = AsyncMock()
+            response.status = status
+            response.headers = {'Retry-After': '0'}
+            response.json.return_value = {'serverTime': 1640995200000}
+            response.__aenter__.return_value = response
+            return response
+
+        session = Mock()
+        session.get.side_effect = [make_response(429), make_response(200)]
+        provider._session = session
+
+        data = await provider._make_request(provider.ENDPOINTS['time'])
+
+        assert data == {'serverTime': 1640995200000}
+        assert session.get.call_count == 2
     
     @pytest.mark.asyncio
-    async def test_get_historical_candles_mock(self, provider):
-        """Test historical candles with mocked API response."""
-        # Mock API response
-        mock_response = [
-            [
-                1640995200000,  # Open time
-                "47000.0",      # Open
-                "47500.0",      # High
-                "46500.0",      # Low
-                "47200.0",      # Close
-                "1000.0",       # Volume
-                1640998799999,  # Close time
-                "47200000.0",   # Quote volume
-                100,            # Trade count
-                "500.0",        # Taker buy base volume
-                "23600000.0"    # Taker buy quote volume
-            ]
+    async def test_rate_limit_retries_exhausted(self, provider):
+        """Test 429s are retried outside the response, then raise RateLimitError."""
+        events = []
+        
+        def make_response(retry_after):
+            response = AsyncMock()
+            response.status = 429
+            response.headers = {'Retry-After': retry_after}
+            response.__aenter__.return_value = response
+            response.__aexit__.side_effect = lambda *exc: events.append('released')
+            return response
+        
+        async def record_sleep(delay):
+            events.append(('sleep', delay))
+        
+        async def record_rate_check():
+            events.append('rate_check')
+        
+        session = Mock()
+        session.get.side_effect = [
+            make_response('2'),
+            make_response('Wed, 21 Oct 2015 07:28:00 GMT'),  # HTTP-date falls back to 1s
+            make_response('2')
         ]
-        
-        with patch.object(provider, '_make_request', return_value=mock_response):
-            candles = await provider.get_historical_candles(
-                symbol="BTCUSDT",
-                interval="1h",
-                limit=1
-            )
-            
-            assert len(candles) == 1
-            candle = candles[0]
-            assert isinstance(candle, Candle)
-            assert candle.symbol == "BTCUSDT"
-            assert candle.interval == "1h"
-            assert candle.open == 47000.0
-            assert candle.high == 47500.0
-            assert candle.low == 46500.0
-            assert candle.close == 47200.0
-            assert candle.volume == 1000.0
+        provider._session = session
+        
+        with patch.object(binance_rest.asyncio, 'sleep', side_effect=record_sleep), \
+                patch.object(provider, '_check_rate_limit', side_effect=record_rate_check):
+            with pytest.raises(RateLimitError):
+                await provider._make_request(provider.ENDPOINTS['time'])
+        
+        assert session.get.call_count == provider.config.max_retries == 3
+        assert events == [
+            'rate_check', 'released', ('sleep', 2),
+            'rate_check', 'released', ('sleep', 1),
+            'rate_check', 'released'
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,kwargs,payload,expected_type,expected",
+        REST_MOCK_CASES,
+        ids=[case[0] for case in REST_MOCK_CASES]
+    )
+    async def test_rest_mock(self, provider, method, kwargs, payload,
+                             expected_type, expected):
+        """Test REST data methods against mocked API responses."""
+        with patch.object(provider, '_make_request', return_value=payload):
+            result = await getattr(provider, method)(**kwargs)
+        
+        # Candle endpoints return a list; the payload holds a single row
+        if isinstance(result, list):
+            assert len(result) == 1
+            result = result[0]
+        
+        assert isinstance(result, expected_type)
+        for attr, value in expected.items():
+            assert attrgetter(attr)(result) == value
     
     @pytest.mark.asyncio
-    async def test_get_current_ticker_mock(self, provider):
-        """Test current ticker with mocked API response."""
+    @pytest.mark.parametrize("json_loads", [binance_rest._json_loads, json.loads],
+                             ids=["default", "stdlib"])
+    async def test_streamed_klines_from_local_server(self, provider, json_loads):
+        """Test the stream=True kline path against a real HTTP response."""
+        requests = []
+        
+        async def klines(request):
+            requests.append(dict(request.query))
+            return web.json_response(CANDLES_PAYLOAD * 3)
+        
+        app = web.Application()
+        app.router.add_get(provider.ENDPOINTS['klines'], klines)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        provider.base_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        provider._session = aiohttp.ClientSession()
+        try:
+            with patch.object(binance_rest, '_json_loads', json_loads):
+                candles = await provider.get_historical_candles("BTCUSDT", "1h", limit=3)
+        finally:
+            await provider._session.close()
+            await runner.cleanup()
+        
+        assert requests == [{'symbol': 'BTCUSDT', 'interval': '1h', 'limit': '3'}]
+        assert len(candles) == 3
+        assert candles[0].close == 47200.0
+        assert candles[0].trade_count == 100
+    
+    @pytest.mark.asyncio
+    async def test_order_book_requests_coalesced(self, provider):
+        """Test that shallower order book requests reuse one deep snapshot."""
         mock_response = {
-            'symbol': 'BTCUSDT',
-            'lastPrice': '47200.0',
-            'bidPrice': '47180.0',
-            'askPrice': '47220.0',
-            'bidQty': '1.5',
-            'askQty': '2.0',
-            'volume': '50000.0',
-            'priceChange': '200.0',
-            'priceChangePercent': '0.42',
-            'highPrice': '47500.0',
-            'lowPrice': '46500.0',
-            'openPrice': '47000.0',
-            'quoteVolume': '2360000000.0',
-            'closeTime': 1640995200000
+            'lastUpdateId': 12345,
+            'bids': [[str(47180.0 - i), '1.0'] for i in range(100)],
+            'asks': [[str(47220.0 + i), '1.0'] for i in range(100)]
         }
         
-        with patch.object(provider, '_make_request', return_value=mock_response):
-            ticker = await provider.get_current_ticker("BTCUSDT")
-            
-            assert isinstance(ticker, Ticker)
-            assert ticker.symbol == "BTCUSDT"
-            assert ticker.price == 47200.0
-            assert ticker.bid == 47180.0
-            assert ticker.ask == 47220.0
+        with patch.object(provider, '_make_request', return_value=mock_response) as mock_request:
+            shallow, deep = await asyncio.gather(
+                provider.get_order_book("BTCUSDT", limit=20),
+                provider.get_order_book("BTCUSDT", limit=100)
+            )
+            cached = await provider.get_order_book("BTCUSDT", limit=5)
+        
+        assert mock_request.call_count == 1
+        assert mock_request.call_args[0][1]['limit'] == 100
+        assert len(shallow.bids) == 20
+        assert len(deep.asks) == 100
+        assert len(cached.bids) == 5
+        
+        # Levels are copies; one caller's edits do not reach the snapshot
+        cached.bids[0].quantity = 0.0
+        assert (await provider.get_order_book("BTCUSDT", limit=5)).bids[0].quantity == 1.0
     
     @pytest.mark.asyncio
-    async def test_get_order_book_mock(self, provider):
-        """Test order book with mocked API response."""
+    @pytest.mark.parametrize("limit", [0, -3])
+    async def test_order_book_rejects_non_positive_limit(self, provider, limit):
+        """Test limits below 1 are rejected instead of reinterpreted."""
+        with patch.object(provider, '_make_request') as mock_request:
+            with pytest.raises(ValueError):
+                await provider.get_order_book("BTCUSDT", limit=limit)
+        mock_request.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_order_book_fetch_survives_cancelled_caller(self, provider):
+        """Test cancelling the first caller neither duplicates nor discards its fetch."""
+        release = asyncio.Event()
         mock_response = {
             'lastUpdateId': 12345,
-            'bids': [
-                ['47180.0', '1.5'],
-                ['47170.0', '2.0']
-            ],
-            'asks': [
-                ['47220.0', '1.2'],
-                ['47230.0', '2.5']
-            ]
+            'bids': [['47180.0', '1.0']],
+            'asks': [['47220.0', '1.0']]
         }
         
-        with patch.object(provider, '_make_request', return_value=mock_response):
-            order_book = await provider.get_order_book("BTCUSDT")
+        async def slow_request(endpoint, params):
+            await release.wait()
+            return mock_response
+        
+        with patch.object(provider, '_make_request', side_effect=slow_request) as mock_request:
+            first = asyncio.create_task(provider.get_order_book("BTCUSDT"))
+            await asyncio.sleep(0)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
             
-            assert isinstance(order_book, OrderBook)
-            assert order_book.symbol == "BTCUSDT"
-            assert len(order_book.bids) == 2
-            assert len(order_book.asks) == 2
-            assert order_book.best_bid.price == 47180.0
-            assert order_book.best_ask.price == 47220.0
+            # A later caller joins the fetch still in flight
+            second = asyncio.create_task(provider.get_order_book("BTCUSDT"))
+            await asyncio.sleep(0)
+            release.set()
+            book = await second
+            
+            # ...and its result was cached
+            await provider.get_order_book("BTCUSDT")
+        
+        assert mock_request.call_count == 1
+        assert book.last_update_id == 12345
+        assert not provider._order_book_in_flight
     
     @pytest.mark.asyncio
     async def test_error_handling(self, provider):
@@ -203,9 +441,15 @@ class TestBinanceRESTProvider:
 class TestMockProvider:
     """Test cases for MockProvider."""
     
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def provider():
+        """Provider shared across the class; tests must not rely on its price state."""
+        return MockProvider()
+    
     @pytest.fixture
-    def provider(self):
-        """Test provider instance."""
+    def fresh_provider(self):
+        """Per-test provider for tests that depend on untouched price state."""
         return MockProvider()
     
     def test_provider_initialization(self, provider):
@@ -214,21 +458,34 @@ class TestMockProvider:
         assert "BTCUSDT" in provider.symbols
         assert provider.base_prices["BTCUSDT"] > 0
     
+    @pytest.mark.asyncio
+    async def test_latency_simulation_disabled(self):
+        """Test that disabling simulated latency skips all sleeps."""
+        config = MarketDataConfig(base_url="mock://localhost", simulate_latency=False)
+        provider = MockProvider(config)
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            await provider.get_current_ticker("BTCUSDT")
+            await provider.get_order_book("BTCUSDT")
+            await provider.ping()
+        
+        mock_sleep.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_get_historical_candles(self, provider):
         """Test historical candles generation."""
         end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(hours=24)
+        start_time = end_time - timedelta(hours=3)
         
         candles = await provider.get_historical_candles(
             symbol="BTCUSDT",
             interval="1h",
             start_time=start_time,
             end_time=end_time,
-            limit=24
+            limit=3
         )
         
-        assert len(candles) <= 24
+        assert len(candles) <= 3
         assert all(isinstance(c, Candle) for c in candles)
         assert all(c.symbol == "BTCUSDT" for c in candles)
         assert all(c.interval == "1h" for c in candles)
@@ -239,6 +496,62 @@ class TestMockProvider:
             assert candle.low <= candle.close <= candle.high
             assert candle.volume >= 0
     
+    @pytest.mark.asyncio
+    async def test_get_historical_candles_raw(self, provider):
+        """Test historical candles returned as a packed array."""
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(hours=24)
+        
+        candles = await provider.get_historical_candles(
+            symbol="BTCUSDT",
+            interval="1h",
+            start_time=start_time,
+            end_time=end_time,
+            limit=24,
+            raw=True
+        )
+        
+        assert candles.dtype == CANDLE_DTYPE
+        assert 0 < len(candles) <= 24
+        assert (candles['low'] <= candles['open']).all()
+        assert (candles['high'] >= candles['close']).all()
+        assert (candles['open'][1:] == candles['close'][:-1]).all()
+    
+    @pytest.mark.asyncio
+    async def test_iter_historical_candles(self, provider):
+        """Test streaming historical candles."""
+        candles = [
+            candle async for candle in provider.iter_historical_candles(
+                symbol="BTCUSDT",
+                interval="1m",
+                limit=2500
+            )
+        ]
+        
+        assert len(candles) == 2500
+        assert all(isinstance(c, Candle) for c in candles)
+        assert all(
+            candles[i].timestamp > candles[i - 1].timestamp
+            for i in range(1, len(candles))
+        )
+    
+    @pytest.mark.asyncio
+    async def test_get_historical_candles_batch(self, provider):
+        """Test multi-symbol candle generation."""
+        symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+        
+        batch = await provider.get_historical_candles_batch(symbols, "1h", limit=48)
+        
+        assert list(batch) == symbols
+        for symbol, candles in batch.items():
+            assert candles.dtype == CANDLE_DTYPE
+            assert len(candles) == 48
+            assert (candles['open'][1:] == candles['close'][:-1]).all()
+            assert provider.current_prices[symbol] == candles['close'][-1]
+        
+        # All symbols share the same time axis
+        assert (batch["BTCUSDT"]['timestamp'] == batch["SOLUSDT"]['timestamp']).all()
+    
     @pytest.mark.asyncio
     async def test_get_current_ticker(self, provider):
         """Test current ticker generation."""
@@ -303,8 +616,28 @@ class TestMockProvider:
         assert isinstance(symbol_info, dict)
         assert symbol_info['symbol'] == "BTCUSDT"
         assert symbol_info['status'] == "TRADING"
-        assert 'baseAsset' in symbol_info
-        assert 'quoteAsset' in symbol_info
+        assert symbol_info['baseAsset'] == "BTC"
+        assert symbol_info['quoteAsset'] == "USDT"
+        
+        # Repeated lookups are served from the cache as fresh copies
+        again = await provider.get_symbol_info("BTCUSDT")
+        assert again == symbol_info
+        assert again is not symbol_info
+    
+    @pytest.mark.asyncio
+    async def test_symbol_info_mutation_is_isolated(self, fresh_provider):
+        """Test editing returned symbol info affects no other symbol or provider."""
+        symbol_info = await fresh_provider.get_symbol_info("BTCUSDT")
+        expected_filters = [dict(f) for f in symbol_info['filters']]
+        
+        symbol_info['filters'][0]['minPrice'] = "-1"
+        symbol_info['orderTypes'].append("BOGUS")
+        
+        assert (await fresh_provider.get_symbol_info("BTCUSDT"))['filters'] == expected_filters
+        assert (await fresh_provider.get_symbol_info("ETHUSDT"))['filters'] == expected_filters
+        other = await MockProvider().get_symbol_info("BTCUSDT")
+        assert other['filters'] == expected_filters
+        assert "BOGUS" not in other['orderTypes']
     
     @pytest.mark.asyncio
     async def test_ping(self, provider):
@@ -326,27 +659,28 @@ class TestMockProvider:
         assert provider._interval_to_seconds("1h") == 3600
         assert provider._interval_to_seconds("1d") == 86400
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_consistent_data_generation(self, provider):
+    async def test_consistent_data_generation(self, fresh_provider):
         """Test that generated data is consistent."""
         # Get initial price
-        ticker1 = await provider.get_current_ticker("BTCUSDT")
+        ticker1 = await fresh_provider.get_current_ticker("BTCUSDT")
         initial_price = ticker1.price
         
         # Get price again (should be close but may have small changes)
-        ticker2 = await provider.get_current_ticker("BTCUSDT")
+        ticker2 = await fresh_provider.get_current_ticker("BTCUSDT")
         price_diff = abs(ticker2.price - initial_price) / initial_price
         
         # Should be within reasonable range (small random walk)
         assert price_diff < 0.1  # Less than 10% change
     
     @pytest.mark.asyncio
-    async def test_candle_sequence_consistency(self, provider):
+    async def test_candle_sequence_consistency(self, fresh_provider):
         """Test that candle sequences are consistent."""
         end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(hours=5)
+        start_time = end_time - timedelta(hours=3)
         
-        candles = await provider.get_historical_candles(
+        candles = await fresh_provider.get_historical_candles(
             symbol="BTCUSDT",
             interval="1h",
             start_time=start_time,
@@ -363,6 +697,7 @@ class TestMockProvider:
 class TestProviderInterface:
     """Test common provider interface compliance."""
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_mock_provider_interface(self):
         """Test that MockProvider implements the interface correctly."""
@@ -6,16 +6,36 @@ Tests data quality checks and format transformations.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
 import json
 
 from ..utils.normalizer import DataNormalizer
 from ..utils.validator import DataValidator
+from ..utils import converter as converter_module
 from ..utils.converter import DataConverter
 from ..models import Candle, Ticker, OrderBook, OrderBookLevel, Trade
 
 
+def hourly_candles(hours, **fields):
+    """BTCUSDT 1h candles at the given hour offsets; fields override per-candle values."""
+    return [
+        Candle(
+            timestamp=1640995200000 + hour * 3600000,
+            symbol="BTCUSDT",
+            interval="1h",
+            open=47000.0 + hour,
+            high=47100.0 + hour,
+            low=46900.0 + hour,
+            close=47050.0 + hour,
+            volume=1000.0,
+            **{name: values[i] for name, values in fields.items()}
+        )
+        for i, hour in enumerate(hours)
+    ]
+
+
 class TestDataNormalizer:
     """Test cases for DataNormalizer."""
     
@@ -50,7 +70,29 @@ class TestDataNormalizer:
         assert candle.volume == 1000.0
         assert candle.quote_volume == 47200000.0
         assert candle.trade_count == 100
-    
+
+    def test_normalize_binance_klines_bulk(self):
+        """Test bulk kline normalization matches the per-kline path."""
+        klines = [
+            [
+                1640995200000 + i * 3600000, f"{47000.0 + i}", "47500.0", "46500.0",
+                "47200.0", "1000.0", 1640998799999 + i * 3600000, "47200000.0",
+                100 + i, "500.0", "23600000.0", "0"
+            ]
+            for i in range(3)
+        ]
+
+        candles = DataNormalizer.normalize_binance_klines(klines, "btcusdt", "1h")
+        batch = DataNormalizer.normalize_binance_klines(klines, "btcusdt", "1h", as_batch=True)
+
+        assert candles == [
+            DataNormalizer.normalize_binance_kline(kline, "btcusdt", "1h")
+            for kline in klines
+        ]
+        assert batch.symbol == "BTCUSDT"
+        assert batch.open.tolist() == [47000.0, 47001.0, 47002.0]
+        assert batch.trade_count.tolist() == [100, 101, 102]
+
     def test_normalize_binance_ticker(self):
         """Test Binance ticker normalization."""
         ticker_data = {
@@ -524,6 +566,66 @@ class TestDataConverter:
         
         assert len(merged) == 2
         assert merged[0].timestamp < merged[1].timestamp  # Should be sorted
+    
+    def test_candles_to_dataframe_float32(self):
+        """Test dtype=np.float32 narrows float columns but not timestamps or counts."""
+        candles = hourly_candles([0, 1, 2], trade_count=[10, 20, 30])
+        
+        df = DataConverter.candles_to_dataframe(candles, dtype=np.float32)
+        
+        for name in ('open', 'high', 'low', 'close', 'volume', 'quote_volume',
+                     'price_change', 'price_change_percent', 'typical_price', 'weighted_price'):
+            assert df[name].dtype == np.float32, name
+        assert df['timestamp'].dtype == np.int64
+        assert df['trade_count'].dtype == np.int64
+        assert df['close'].tolist() == [47050.0, 47051.0, 47052.0]
+        
+        # Missing trade counts become NaN, which needs a float column
+        partial = hourly_candles([0, 1], trade_count=[10, None])
+        df = DataConverter.candles_to_dataframe(partial, dtype=np.float32)
+        assert df['trade_count'].dtype == np.float64
+        assert df['trade_count'].isna().tolist() == [False, True]
+    
+    def test_candles_to_dataframe_polars(self):
+        """Test the polars backend columns, dtypes and ordering."""
+        pl = pytest.importorskip("polars")
+        candles = hourly_candles(
+            [2, 0, 1],
+            trade_count=[30, 10, 20],
+            raw_data=[{'hour': 2}, {'hour': 0}, {'hour': 1}]
+        )
+        
+        df = DataConverter.candles_to_dataframe(candles, include_raw_data=True, backend="polars")
+        
+        assert isinstance(df, pl.DataFrame)
+        assert df['timestamp'].to_list() == sorted(c.timestamp for c in candles)
+        assert df['trade_count'].to_list() == [10, 20, 30]
+        assert [row['hour'] for row in df['raw_data'].to_list()] == [0, 1, 2]
+        
+        assert df.schema['timestamp'] == pl.Int64
+        assert df.schema['symbol'] == pl.String
+        assert df.schema['trade_count'] == pl.Int64
+        for name in ('open', 'high', 'low', 'close', 'volume', 'price_change', 'typical_price'):
+            assert df.schema[name] == pl.Float64
+        assert df.schema['quote_volume'] == pl.Float64  # All None -> NaN
+        assert df.schema['raw_data'] == pl.Object
+        assert isinstance(df.schema['datetime'], pl.Datetime)
+        assert df.schema['datetime'].time_zone == 'UTC'
+        assert df['datetime'][0] == datetime(2022, 1, 1, tzinfo=timezone.utc)
+    
+    def test_candles_to_dataframe_backend_errors(self, monkeypatch):
+        """Test unknown backends and a missing polars install are rejected."""
+        candles = hourly_candles([0])
+        
+        with pytest.raises(ValueError):
+            DataConverter.candles_to_dataframe(candles, backend="arrow")
+        
+        monkeypatch.setattr(converter_module, 'pl', None)
+        with pytest.raises(ImportError):
+            DataConverter.candles_to_dataframe(candles, backend="polars")
+        
+        # The default backend does not need polars
+        assert len(DataConverter.candles_to_dataframe(candles)) == 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+"""
+Numeric Kernels
+
+Array kernels shared by the data utilities. Each kernel is written for
+Numba's nopython mode and compiled when numba is installed; otherwise the
+equivalent vectorized NumPy implementation is used.
+"""
+
+import numpy as np
+
+try:
+    # Optional: numba compiles the scalar kernels to native code
+    from numba import njit
+except ImportError:  # pragma: no cover - falls back to vectorized NumPy
+    njit = None
+
+
+def _zscore_outliers_py(values: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Indices whose Z-score exceeds the threshold, written for Numba.
+    
+    Two passes for the mean and sample variance, then one pass collecting
+    matches into a preallocated buffer.
+    
+    Args:
+        values (np.ndarray): float64 values to scan
+        threshold (float): Absolute Z-score above which a value is an outlier
+    
+    Returns:
+        np.ndarray: int64 indices of outliers, in ascending order
+    """
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    if n < 2:
+        return out[:0]
+    
+    mean = 0.0
+    for i in range(n):
+        mean += values[i]
+    mean /= n
+    
+    variance = 0.0
+    for i in range(n):
+        deviation = values[i] - mean
+        variance += deviation * deviation
+    stdev = np.sqrt(variance / (n - 1))
+    
+    count = 0
+    # NaN stdev also fails this check, so NaN input yields no outliers
+    if stdev > 0:
+        for i in range(n):
+            if abs(values[i] - mean) / stdev > threshold:
+                out[count] = i
+                count += 1
+    return out[:count]
+
+
+def _zscore_outliers_np(values: np.ndarray, threshold: float) -> np.ndarray:
+    """Vectorized NumPy fallback for _zscore_outliers_py."""
+    if len(values) < 2:
+        return np.empty(0, dtype=np.int64)
+    stdev = values.std(ddof=1)
+    if not stdev > 0:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.abs(values - values.mean()) / stdev > threshold)
+
+
+# Compiled kernel, or the vectorized NumPy path without numba
+if njit is not None:
+    zscore_outliers = njit(cache=True)(_zscore_outliers_py)
+else:
+    zscore_outliers = _zscore_outliers_np
@@ -6,12 +6,75 @@ Provides utility functions for transforming market data between
 various representations used by strategies and analysis tools.
 """
 
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timezone
 import json
+from operator import attrgetter
 
-from ..models import Candle, Ticker, OrderBook, Trade
+try:
+    # Optional: orjson serializes JSON several times faster than the stdlib
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson is missing
+    orjson = None
+
+try:
+    # Optional: polars backend for candles_to_dataframe
+    import polars as pl
+except ImportError:  # pragma: no cover - pandas remains the default backend
+    pl = None
+
+from ..models import Candle, CandleBatch, Ticker, OrderBook, OrderBookLevel, Trade
+
+
+_PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+_OPTIONAL_COLUMNS = ('quote_volume', 'trade_count', 'taker_buy_volume', 'taker_buy_quote_volume')
+# Columns stored in the caller's float dtype (trade_count stays integral)
+_FLOAT_COLUMNS = frozenset(_PRICE_COLUMNS + _OPTIONAL_COLUMNS) - {'trade_count'}
+
+
+def _optional_array(values, dtype) -> np.ndarray:
+    """Array of optional values; None becomes NaN (integer dtypes fall back to float64)."""
+    if None in values and np.dtype(dtype).kind != 'f':
+        dtype = np.float64
+    return np.array(values, dtype=dtype)
+
+
+def _optional_values(df: pd.DataFrame, name: str) -> List[Any]:
+    """Column values as a list, with missing columns/values mapped to None."""
+    if name not in df:
+        return [None] * len(df)
+    column = df[name]
+    if column.hasnans:
+        column = column.astype(object).where(column.notna(), None)
+    return column.tolist()
+
+
+def _order_book_side_arrays(levels: List[OrderBookLevel]) -> Dict[str, List[float]]:
+    """Price, quantity and notional columns for one side of an order book."""
+    prices = [level.price for level in levels]
+    quantities = [level.quantity for level in levels]
+    return {
+        'prices': prices,
+        'quantities': quantities,
+        # Reuse the extracted columns rather than calling notional_value per level
+        'notional': [price * quantity for price, quantity in zip(prices, quantities)]
+    }
+
+
+def _polars_candle_frame(data: Dict[str, Any]) -> 'pl.DataFrame':
+    """Polars frame from candle columns, with a UTC datetime column."""
+    if 'raw_data' in data:
+        # Arbitrary dicts; keep them as Python objects rather than inferring structs
+        data['raw_data'] = pl.Series('raw_data', data['raw_data'], dtype=pl.Object)
+    
+    df = pl.DataFrame(data).with_columns(
+        pl.from_epoch('timestamp', time_unit='ms').dt.replace_time_zone('UTC').alias('datetime')
+    )
+    if not df['timestamp'].is_sorted():
+        df = df.sort('timestamp', maintain_order=True)
+    return df
 
 
 class DataConverter:
@@ -24,55 +87,97 @@ class DataConverter:
     
     @staticmethod
     def candles_to_dataframe(
-        candles: List[Candle],
-        include_raw_data: bool = False
-    ) -> pd.DataFrame:
+        candles: Union[List[Candle], CandleBatch],
+        include_raw_data: bool = False,
+        backend: str = "pandas",
+        dtype: Any = np.float64
+    ) -> Union[pd.DataFrame, 'pl.DataFrame']:
         """
         Convert list of candles to pandas DataFrame.
         
+        Columns are gathered in one pass and the derived price fields are
+        computed on whole arrays rather than per candle.
+        
         Args:
-            candles (List[Candle]): List of candles to convert
+            candles (Union[List[Candle], CandleBatch]): Candles to convert
             include_raw_data (bool): Whether to include raw_data column
+            backend (str): 'pandas', or 'polars' for a polars DataFrame with
+                a UTC 'datetime' column in place of the index
+            dtype (Any): Float dtype for price, volume and derived columns;
+                np.float32 halves their memory at ~7 significant digits
             
         Returns:
-            pd.DataFrame: DataFrame with candle data
+            Union[pd.DataFrame, pl.DataFrame]: DataFrame with candle data,
+                indexed by UTC datetime for pandas
         """
-        if not candles:
-            return pd.DataFrame()
-        
-        data = []
-        for candle in candles:
-            row = {
-                'timestamp': candle.timestamp,
-                'datetime': candle.datetime,
-                'symbol': candle.symbol,
-                'interval': candle.interval,
-                'open': candle.open,
-                'high': candle.high,
-                'low': candle.low,
-                'close': candle.close,
-                'volume': candle.volume,
-                'quote_volume': candle.quote_volume,
-                'trade_count': candle.trade_count,
-                'taker_buy_volume': candle.taker_buy_volume,
-                'taker_buy_quote_volume': candle.taker_buy_quote_volume,
-                'price_change': candle.price_change,
-                'price_change_percent': candle.price_change_percent,
-                'typical_price': candle.typical_price,
-                'weighted_price': candle.weighted_price
+        if backend not in ("pandas", "polars"):
+            raise ValueError(f"Unsupported DataFrame backend: {backend}")
+        if backend == "polars" and pl is None:
+            raise ImportError("polars is required for backend='polars'")
+        
+        if not len(candles):
+            return pl.DataFrame() if backend == "polars" else pd.DataFrame()
+        
+        if isinstance(candles, CandleBatch):
+            columns = {
+                name: column.astype(dtype, copy=False) if name in _FLOAT_COLUMNS else column
+                for name, column in candles.columns().items()
+            }
+            symbols = [candles.symbol] * len(candles)
+            intervals = [candles.interval] * len(candles)
+        else:
+            values = list(zip(*(
+                (c.timestamp, c.symbol, c.interval, c.open, c.high, c.low, c.close, c.volume,
+                 c.quote_volume, c.trade_count, c.taker_buy_volume, c.taker_buy_quote_volume)
+                for c in candles
+            )))
+            symbols, intervals = values[1], values[2]
+            columns = {
+                'timestamp': np.array(values[0], dtype=np.int64),
+                **{
+                    name: np.array(column, dtype=dtype)
+                    for name, column in zip(_PRICE_COLUMNS, values[3:8])
+                },
+                **{
+                    name: _optional_array(column, np.int64 if name == 'trade_count' else dtype)
+                    for name, column in zip(_OPTIONAL_COLUMNS, values[8:])
+                }
             }
-            
-            if include_raw_data:
-                row['raw_data'] = candle.raw_data
-            
-            data.append(row)
         
-        df = pd.DataFrame(data)
+        open_, high, low, close = (columns[name] for name in ('open', 'high', 'low', 'close'))
+        price_change = close - open_
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_change_percent = np.where(open_ == 0, 0.0, (price_change / open_) * 100)
+        
+        data = {
+            'timestamp': columns['timestamp'],
+            'symbol': symbols,
+            'interval': intervals,
+            **{name: columns[name] for name in _PRICE_COLUMNS + _OPTIONAL_COLUMNS},
+            'price_change': price_change,
+            'price_change_percent': price_change_percent,
+            'typical_price': (high + low + close) / 3,
+            'weighted_price': (high + low + close * 2) / 4
+        }
         
-        # Set datetime as index for time series analysis
-        if not df.empty:
-            df.set_index('datetime', inplace=True)
-            df.sort_index(inplace=True)
+        if include_raw_data:
+            data['raw_data'] = (
+                [{} for _ in range(len(candles))] if isinstance(candles, CandleBatch)
+                else [candle.raw_data for candle in candles]
+            )
+        
+        if backend == "polars":
+            return _polars_candle_frame(data)
+        
+        # Datetime index for time series analysis: epoch-ms ints reinterpreted
+        # as datetime64[ms] (a view, no per-value parsing), localized to UTC
+        index = pd.DatetimeIndex(
+            columns['timestamp'].view('datetime64[ms]'), tz='UTC', name='datetime'
+        )
+        df = pd.DataFrame(data, index=index, copy=False)
+        
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True, kind='stable')
         
         return df
     
@@ -96,33 +201,28 @@ class DataConverter:
         if df.empty:
             return []
         
-        candles = []
-        
-        for index, row in df.iterrows():
-            # Handle datetime index
-            if isinstance(index, pd.Timestamp):
-                timestamp = int(index.timestamp() * 1000)
-            else:
-                timestamp = int(row.get('timestamp', 0))
-            
-            candle = Candle(
-                timestamp=timestamp,
-                symbol=row.get('symbol', symbol or ''),
-                interval=row.get('interval', interval or ''),
-                open=float(row['open']),
-                high=float(row['high']),
-                low=float(row['low']),
-                close=float(row['close']),
-                volume=float(row['volume']),
-                quote_volume=row.get('quote_volume'),
-                trade_count=row.get('trade_count'),
-                taker_buy_volume=row.get('taker_buy_volume'),
-                taker_buy_quote_volume=row.get('taker_buy_quote_volume'),
-                raw_data=row.get('raw_data', {})
-            )
-            candles.append(candle)
-        
-        return candles
+        n = len(df)
+        
+        # Prefer a datetime index; fall back to the timestamp column
+        if isinstance(df.index, pd.DatetimeIndex):
+            timestamps = df.index.as_unit('ms').asi8.tolist()
+        elif 'timestamp' in df:
+            timestamps = df['timestamp'].astype('int64').tolist()
+        else:
+            timestamps = [0] * n
+        
+        # Pull whole columns as native Python values; no per-row Series boxing
+        columns = [
+            timestamps,
+            df['symbol'].tolist() if 'symbol' in df else [symbol or ''] * n,
+            df['interval'].tolist() if 'interval' in df else [interval or ''] * n,
+            *(df[name].astype('float64').tolist() for name in _PRICE_COLUMNS),
+            *(_optional_values(df, name) for name in _OPTIONAL_COLUMNS),
+            df['raw_data'].tolist() if 'raw_data' in df else [{} for _ in range(n)]
+        ]
+        
+        # Positional order matches the Candle field order
+        return [Candle(*row) for row in zip(*columns)]
     
     @staticmethod
     def tickers_to_dataframe(tickers: List[Ticker]) -> pd.DataFrame:
@@ -181,32 +281,25 @@ class DataConverter:
         return df
     
     @staticmethod
-    def candles_to_ohlcv(candles: List[Candle]) -> Dict[str, List[float]]:
+    def candles_to_ohlcv(candles: Union[List[Candle], CandleBatch]) -> Dict[str, List[float]]:
         """
         Convert candles to OHLCV format for analysis libraries.
         
         Args:
-            candles (List[Candle]): List of candles
+            candles (Union[List[Candle], CandleBatch]): Candles to convert
             
         Returns:
             Dict[str, List[float]]: OHLCV data structure
         """
-        if not candles:
-            return {
-                'open': [],
-                'high': [],
-                'low': [], 
-                'close': [],
-                'volume': []
-            }
+        if not len(candles):
+            return {name: [] for name in _PRICE_COLUMNS}
         
-        return {
-            'open': [c.open for c in candles],
-            'high': [c.high for c in candles],
-            'low': [c.low for c in candles],
-            'close': [c.close for c in candles],
-            'volume': [c.volume for c in candles]
-        }
+        if isinstance(candles, CandleBatch):
+            return {name: getattr(candles, name).tolist() for name in _PRICE_COLUMNS}
+        
+        # Single pass over the candles, transposed into columns
+        values = zip(*((c.open, c.high, c.low, c.close, c.volume) for c in candles))
+        return {name: list(column) for name, column in zip(_PRICE_COLUMNS, values)}
     
     @staticmethod
     def candles_to_strategy_format(candles: List[Candle]) -> List[Dict[str, Any]]:
@@ -260,16 +353,8 @@ class DataConverter:
         return {
             'timestamp': order_book.timestamp,
             'symbol': order_book.symbol,
-            'bids': {
-                'prices': [level.price for level in order_book.bids],
-                'quantities': [level.quantity for level in order_book.bids],
-                'notional': [level.notional_value for level in order_book.bids]
-            },
-            'asks': {
-                'prices': [level.price for level in order_book.asks],
-                'quantities': [level.quantity for level in order_book.asks],
-                'notional': [level.notional_value for level in order_book.asks]
-            },
+            'bids': _order_book_side_arrays(order_book.bids),
+            'asks': _order_book_side_arrays(order_book.asks),
             'spread': order_book.spread,
             'mid_price': order_book.mid_price
         }
@@ -339,11 +424,18 @@ class DataConverter:
         """
         data = [candle.to_dict() for candle in candles]
         
-        json_str = json.dumps(
-            data,
-            indent=2 if pretty else None,
-            default=str  # Handle datetime serialization
-        )
+        if orjson is not None:
+            json_str = orjson.dumps(
+                data,
+                default=str,  # Handle datetime serialization
+                option=orjson.OPT_INDENT_2 if pretty else 0
+            ).decode()
+        else:
+            json_str = json.dumps(
+                data,
+                indent=2 if pretty else None,
+                default=str  # Handle datetime serialization
+            )
         
         if filename:
             with open(filename, 'w') as f:
@@ -462,6 +554,7 @@ class DataConverter:
             merged.extend(candle_list)
         
         if sort_by_timestamp:
-            merged.sort(key=lambda c: c.timestamp)
+            # Timsort merges the pre-sorted runs in linear time; stable for ties
+            merged.sort(key=attrgetter('timestamp'))
         
         return merged
\ No newline at end of file
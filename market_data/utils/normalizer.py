@@ -5,15 +5,65 @@ Normalizes market data from different providers into standardized formats.
 Handles data conversion, missing field handling, and format standardization.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timezone
 import logging
+from operator import itemgetter
 
-from ..models import Candle, Ticker, OrderBook, OrderBookLevel, Trade
+import numpy as np
+
+from ..models import Candle, CandleBatch, CANDLE_DTYPE, Ticker, OrderBook, OrderBookLevel, Trade
 
 
 logger = logging.getLogger(__name__)
 
+# Deletes the separators accepted in symbols (BTC-USDT, BTC_USDT, BTC/USDT)
+_SYMBOL_SEPARATORS = str.maketrans('', '', '-_/')
+
+
+def _to_coinbase_symbol(clean_symbol: str) -> str:
+    """Coinbase uses a hyphen before the quote asset (e.g., BTC-USD)."""
+    if len(clean_symbol) >= 6:
+        return f"{clean_symbol[:-3]}-{clean_symbol[-3:]}"
+    return clean_symbol
+
+
+# Provider-specific formatting of a separator-free uppercase symbol
+_SYMBOL_FORMATTERS = {
+    "coinbase": _to_coinbase_symbol,
+}
+
+# WebSocket kline payload keys: open time, symbol, interval, OHLCV, quote
+# volume, trade count and taker buy base/quote volume
+_WS_KLINE_FIELDS = itemgetter('t', 's', 'i', 'o', 'h', 'l', 'c', 'v', 'q', 'n', 'V', 'Q')
+_WS_KLINE_DEFAULTS = {
+    't': 0, 's': '', 'i': '', 'o': 0, 'h': 0, 'l': 0, 'c': 0,
+    'v': 0, 'q': 0, 'n': 0, 'V': 0, 'Q': 0
+}
+
+# Long-form interval names mapped to the standard (Binance) format
+_INTERVAL_CANONICAL = {
+    "1min": "1m",
+    "5min": "5m",
+    "15min": "15m",
+    "30min": "30m",
+    "1hour": "1h",
+    "4hour": "4h",
+    "1day": "1d",
+    "1week": "1w",
+    "1month": "1M"
+}
+
+# Provider-specific interval formats, keyed by standard interval
+_PROVIDER_INTERVALS = {
+    "binance": {},
+    # Coinbase uses seconds
+    "coinbase": {
+        "1m": "60", "5m": "300", "15m": "900", "30m": "1800",
+        "1h": "3600", "4h": "14400", "1d": "86400"
+    }
+}
+
 
 class DataNormalizer:
     """
@@ -70,6 +120,72 @@ class DataNormalizer:
             logger.error(f"Failed to normalize Binance kline data: {e}")
             raise ValueError(f"Invalid Binance kline data format: {e}")
     
+    @staticmethod
+    def normalize_binance_klines(
+        klines: List[List[Any]],
+        symbol: str,
+        interval: str,
+        as_batch: bool = False
+    ) -> Union[List[Candle], CandleBatch]:
+        """
+        Normalize a page of Binance klines in bulk.
+        
+        Transposes the rows into columns and parses each column with a
+        single NumPy conversion instead of one float() call per field.
+        
+        Args:
+            klines (List[List[Any]]): Raw Binance kline data arrays
+            symbol (str): Trading symbol
+            interval (str): Candle interval
+            as_batch (bool): Return a columnar CandleBatch (no raw data)
+            
+        Returns:
+            Union[List[Candle], CandleBatch]: Normalized candles
+        """
+        if not klines:
+            if as_batch:
+                raise ValueError("No klines provided")
+            return []
+        
+        # Short rows lack the optional fields; take the per-kline path
+        if min(map(len, klines)) < 11:
+            candles = [
+                DataNormalizer.normalize_binance_kline(kline, symbol, interval)
+                for kline in klines
+            ]
+            return CandleBatch.from_candles(candles) if as_batch else candles
+        
+        try:
+            columns = list(zip(*klines))
+            batch = CandleBatch(
+                symbol.upper(),
+                interval,
+                np.array(columns[0], dtype=np.int64),
+                *(np.array(columns[i], dtype=np.float64) for i in (1, 2, 3, 4, 5, 7)),
+                np.array(columns[8], dtype=np.int64),
+                np.array(columns[9], dtype=np.float64),
+                np.array(columns[10], dtype=np.float64)
+            )
+        except (ValueError, TypeError) as e:
+            logger.error(f"Failed to normalize Binance kline data: {e}")
+            raise ValueError(f"Invalid Binance kline data format: {e}")
+        
+        if as_batch:
+            return batch
+        
+        rows = zip(*(getattr(batch, name).tolist() for name in CANDLE_DTYPE.names))
+        return [
+            Candle(
+                timestamp, batch.symbol, interval, open, high, low, close, volume,
+                quote_volume, trade_count, taker_buy_volume, taker_buy_quote_volume,
+                {'binance_kline': kline}
+            )
+            for (
+                timestamp, open, high, low, close, volume, quote_volume,
+                trade_count, taker_buy_volume, taker_buy_quote_volume
+            ), kline in zip(rows, klines)
+        ]
+    
     @staticmethod
     def normalize_binance_ticker(
         ticker_data: Dict[str, Any],
@@ -204,19 +320,27 @@ class DataNormalizer:
             # Extract kline data from WebSocket message
             kline = ws_data.get('k', {})
             
+            # All fields in one C-level lookup; partial payloads take defaults
+            try:
+                fields = _WS_KLINE_FIELDS(kline)
+            except KeyError:
+                fields = _WS_KLINE_FIELDS({**_WS_KLINE_DEFAULTS, **kline})
+            (open_time, kline_symbol, kline_interval, open_price, high, low, close,
+             volume, quote_volume, trade_count, taker_buy_volume, taker_buy_quote_volume) = fields
+            
             candle = Candle(
-                timestamp=int(kline.get('t', 0)),  # Open time
-                symbol=kline.get('s', '').upper(),
-                interval=kline.get('i', ''),
-                open=float(kline.get('o', 0)),
-                high=float(kline.get('h', 0)),
-                low=float(kline.get('l', 0)),
-                close=float(kline.get('c', 0)),
-                volume=float(kline.get('v', 0)),
-                quote_volume=float(kline.get('q', 0)),
-                trade_count=int(kline.get('n', 0)),
-                taker_buy_volume=float(kline.get('V', 0)),
-                taker_buy_quote_volume=float(kline.get('Q', 0)),
+                timestamp=int(open_time),
+                symbol=kline_symbol.upper(),
+                interval=kline_interval,
+                open=float(open_price),
+                high=float(high),
+                low=float(low),
+                close=float(close),
+                volume=float(volume),
+                quote_volume=float(quote_volume),
+                trade_count=int(trade_count),
+                taker_buy_volume=float(taker_buy_volume),
+                taker_buy_quote_volume=float(taker_buy_quote_volume),
                 raw_data={'websocket_kline': ws_data}
             )
             
@@ -378,21 +502,12 @@ class DataNormalizer:
         Returns:
             str: Normalized symbol
         """
-        # Remove any separators and convert to uppercase
-        clean_symbol = symbol.replace('-', '').replace('_', '').replace('/', '').upper()
+        # Remove any separators and convert to uppercase in one scan
+        clean_symbol = symbol.translate(_SYMBOL_SEPARATORS).upper()
         
-        if provider.lower() == "binance":
-            # Binance uses no separators (e.g., BTCUSDT)
-            return clean_symbol
-        elif provider.lower() == "coinbase":
-            # Coinbase uses hyphen (e.g., BTC-USD)
-            if len(clean_symbol) >= 6:
-                return f"{clean_symbol[:-3]}-{clean_symbol[-3:]}"
-        elif provider.lower() == "kraken":
-            # Kraken may use different naming conventions
-            return clean_symbol
-        
-        return clean_symbol
+        # Binance and Kraken use no separators (e.g., BTCUSDT)
+        formatter = _SYMBOL_FORMATTERS.get(provider.lower())
+        return formatter(clean_symbol) if formatter is not None else clean_symbol
     
     @staticmethod
     def normalize_interval_format(interval: str, provider: str = "binance") -> str:
@@ -406,32 +521,8 @@ class DataNormalizer:
         Returns:
             str: Normalized interval
         """
-        interval = interval.lower().strip()
-        
-        # Common mappings
-        interval_mappings = {
-            "1min": "1m",
-            "5min": "5m", 
-            "15min": "15m",
-            "30min": "30m",
-            "1hour": "1h",
-            "4hour": "4h",
-            "1day": "1d",
-            "1week": "1w",
-            "1month": "1M"
-        }
-        
-        normalized = interval_mappings.get(interval, interval)
-        
-        if provider.lower() == "binance":
-            # Binance format is already our standard
-            return normalized
-        elif provider.lower() == "coinbase":
-            # Coinbase uses seconds
-            conversions = {
-                "1m": "60", "5m": "300", "15m": "900", "30m": "1800",
-                "1h": "3600", "4h": "14400", "1d": "86400"
-            }
-            return conversions.get(normalized, normalized)
+        canonical = interval.lower().strip()
+        canonical = _INTERVAL_CANONICAL.get(canonical, canonical)
         
-        return normalized
\ No newline at end of file
+        # Binance format is already our standard; unknown providers pass through
+        return _PROVIDER_INTERVALS.get(provider.lower(), {}).get(canonical, canonical)
\ No newline at end of file
@@ -9,8 +9,16 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 import logging
 import statistics
+from operator import attrgetter
+
+import numpy as np
 
 from ..models import Candle, Ticker, OrderBook, Trade, validate_candle, validate_ticker
+from ._numeric_kernels import zscore_outliers
+
+
+# Candle attributes detect_outliers reads directly
+_OUTLIER_FIELDS = ('close', 'volume', 'high', 'low')
 
 
 logger = logging.getLogger(__name__)
@@ -284,6 +292,8 @@ class DataValidator:
         prices = [t.price for t in trades]
         quantities = [t.quantity for t in trades]
         volumes = [t.notional_value for t in trades]
+        # list.count tallies in C; unknown sides are counted as neither
+        sides = [t.side for t in trades]
         
         statistics_data = {
             'total_trades': len(trades),
@@ -291,8 +301,8 @@ class DataValidator:
             'price_range': [min(prices), max(prices)],
             'total_volume': sum(volumes),
             'average_trade_size': statistics.mean(quantities),
-            'buy_trades': sum(1 for t in trades if t.side == 'buy'),
-            'sell_trades': sum(1 for t in trades if t.side == 'sell')
+            'buy_trades': sides.count('buy'),
+            'sell_trades': sides.count('sell')
         }
         
         return {
@@ -320,46 +330,32 @@ class DataValidator:
         if len(candles) < 3:
             return []
         
-        values = []
-        for candle in candles:
-            if field == 'close':
-                values.append(candle.close)
-            elif field == 'volume':
-                values.append(candle.volume)
-            elif field == 'high':
-                values.append(candle.high)
-            elif field == 'low':
-                values.append(candle.low)
-            elif field == 'price_range':
-                values.append(candle.high - candle.low)
-            else:
-                raise ValueError(f"Unsupported field: {field}")
-        
-        if len(values) < 3:
-            return []
-        
-        # Calculate mean and standard deviation
-        mean_val = statistics.mean(values)
-        stdev_val = statistics.stdev(values)
+        if field == 'price_range':
+            field_values = (candle.high - candle.low for candle in candles)
+        elif field in _OUTLIER_FIELDS:
+            field_values = map(attrgetter(field), candles)
+        else:
+            raise ValueError(f"Unsupported field: {field}")
         
-        # Find outliers
-        outliers = []
-        for i, value in enumerate(values):
-            z_score = abs(value - mean_val) / stdev_val if stdev_val > 0 else 0
-            if z_score > self.outlier_threshold:
-                outliers.append(i)
-        
-        return outliers
+        # One contiguous array, scanned by the (Numba-compiled when available) kernel
+        values = np.fromiter(field_values, dtype=np.float64, count=len(candles))
+        return zscore_outliers(values, float(self.outlier_threshold)).tolist()
     
     def _check_chronological_order(self, candles: List[Candle]) -> List[str]:
         """Check if candles are in chronological order."""
-        issues = []
+        if len(candles) < 2:
+            return []
         
-        for i in range(1, len(candles)):
-            if candles[i].timestamp <= candles[i-1].timestamp:
-                issues.append(f"Candle {i} timestamp not greater than previous candle")
+        timestamps = np.fromiter(
+            (c.timestamp for c in candles), dtype=np.int64, count=len(candles)
+        )
+        # Indices of candles not strictly after their predecessor, in one pass
+        violations = np.flatnonzero(np.diff(timestamps) <= 0) + 1
         
-        return issues
+        return [
+            f"Candle {i} timestamp not greater than previous candle (chronological order violation)"
+            for i in violations.tolist()
+        ]
     
     def _check_timeline_gaps(self, candles: List[Candle]) -> List[str]:
         """Check for unusual gaps in timeline."""
@@ -427,19 +423,31 @@ class DataValidator:
     
     def _check_ohlc_relationships(self, candles: List[Candle]) -> List[str]:
         """Check OHLC price relationships."""
-        issues = []
+        if not candles:
+            return []
         
-        for i, candle in enumerate(candles):
+        open_, high, low, close, volume = np.array(
+            [(c.open, c.high, c.low, c.close, c.volume) for c in candles],
+            dtype=np.float64
+        ).T
+        
+        # Negated so NaN prices are flagged, as a failed comparison
+        high_invalid = ~((high >= open_) & (high >= close))
+        low_invalid = ~((low <= open_) & (low <= close))
+        volume_invalid = volume < 0
+        
+        issues = []
+        for i in np.flatnonzero(high_invalid | low_invalid | volume_invalid).tolist():
             # High should be the highest price
-            if not (candle.high >= candle.open and candle.high >= candle.close):
+            if high_invalid[i]:
                 issues.append(f"High price not highest in candle {i}")
             
             # Low should be the lowest price
-            if not (candle.low <= candle.open and candle.low <= candle.close):
+            if low_invalid[i]:
                 issues.append(f"Low price not lowest in candle {i}")
             
             # Volume should be non-negative
-            if candle.volume < 0:
+            if volume_invalid[i]:
                 issues.append(f"Negative volume in candle {i}")
         
         return issues